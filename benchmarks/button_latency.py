@@ -0,0 +1,57 @@
+# Press-to-action latency of the button, run on a normal computer:
+#   python benchmarks/button_latency.py
+# Scripts short, long and double presses into the simulator while PicoCore runs its blocking loop (switching modes on
+# the way), checks that each one is recognized as the right gesture and fails if any action ran more than 300 ms after
+# the release or press that ended it. A short press has to wait out the double press window first, so that window
+# plus a button poll has to fit in the budget.
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import simulator  # noqa: E402
+
+sim = simulator.install()
+
+from core import PicoCore  # noqa: E402
+from buttons import SHORT, LONG, DOUBLE  # noqa: E402
+
+RUN_SECONDS = 60
+LATENCY_BUDGET = 300  # ms from the physical edge to the action, about where a button starts to feel slow
+
+# (seconds into the run, hold time) per press, and the gestures they should come out as
+PRESSES = ((5, 0.1), (12, 1.5), (20, 0.1), (20.25, 0.1), (30, 0.05), (40, 0.1), (40.2, 0.08))
+EXPECTED = {SHORT: 2, LONG: 1, DOUBLE: 2}
+
+
+def run():
+    core = sim.attach(PicoCore())
+    core.switch("launch")
+    core.wifi_connect()
+    core.keep_time()
+
+    start = sim.clock.monotonic()
+    for at, hold in PRESSES:
+        sim.press(start + at, hold)
+
+    # The body of run_loop(), until the scripted presses are over
+    while sim.clock.monotonic() - start < RUN_SECONDS:
+        core.cycle(max(1, RUN_SECONDS - (sim.clock.monotonic() - start)))
+
+    buttons = core.buttons
+    print()
+    print(buttons.report())
+    passed = buttons.latency_max <= LATENCY_BUDGET
+    for gesture, count in EXPECTED.items():
+        ok = buttons.counts[gesture] == count
+        passed = passed and ok
+        print(f"{gesture:<7} expected {count}, got {buttons.counts[gesture]} {'ok' if ok else 'WRONG'}")
+    print(f"max latency {buttons.latency_max} ms from the edge, budget {LATENCY_BUDGET} ms "
+          f"{'ok' if buttons.latency_max <= LATENCY_BUDGET else 'OVER BUDGET'}")
+    if not passed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,66 @@
+# Time to the first countdown after a real power cycle, run in the simulator on a normal computer:
+#   python benchmarks/cold_boot.py
+# A first boot fetches the launches and writes them to the flash cache. Then the pico loses power: the RTC goes back
+# to its power-on default and rocketlaunch.live stops answering. The second boot has to bring the cached countdown up
+# as soon as NTP sets the clock, without a single successful launch fetch.
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import simulator  # noqa: E402
+
+sim = simulator.install()
+
+from core import PicoCore  # noqa: E402
+
+RUN_SECONDS = 60
+
+
+def boot() -> PicoCore:
+    core = sim.attach(PicoCore())
+    core.switch("launch")
+    core.wifi_connect()
+    core.keep_time()
+    return core
+
+
+def main():
+    first = boot()
+    first.cycle(1)
+    cached = first.mode.flash.writes
+
+    # Power cycle: the RTC restarts at 2000-01-01 and the API is down from now on
+    sim.clock.rtc_base = 946684800
+    sim.clock.rtc_set_at = sim.clock.ns
+    sim.server.fail_requests = 1000
+    start = sim.clock.monotonic()
+    core = sim.attach(PicoCore())
+    core.switch("launch")
+    restored = core.mode.launch is not None
+    core.wifi_connect()
+    core.keep_time()
+    shown_at = None
+    while sim.clock.monotonic() - start < RUN_SECONDS and shown_at is None:
+        core.cycle(1)
+        if core.mode.countdown_text_area.text[:1].isdigit():
+            shown_at = sim.clock.monotonic() - start
+    print(f"countdown up {shown_at} s after power-on, {core.net.fetches - core.net.failures} launch fetches")
+
+    checks = (
+        ("first boot wrote the cache", cached >= 1),
+        ("cache restored with the RTC unset", restored),
+        ("countdown up within a few seconds", shown_at is not None and shown_at <= 5),
+        ("no launch fetch needed", core.net.fetches == core.net.failures),
+    )
+    passed = True
+    for name, ok in checks:
+        passed = passed and ok
+        print(f"{name:<40} {'ok' if ok else 'FAILED'}")
+    if not passed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
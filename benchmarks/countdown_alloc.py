@@ -0,0 +1,90 @@
+# Allocations per display tick for the old datetime/f-string countdown and CountdownFormatter, plus a check that both
+# produce the same text, run on a normal computer:
+#   python benchmarks/countdown_alloc.py
+# The old path is reproduced with the standard library datetime, which allocates the same way adafruit_datetime does.
+# CPython also allocates for every int above 256 (including CountdownFormatter's call counter), which CircuitPython
+# doesn't, so the numbers on the pico are lower still for the new path.
+
+import os
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from countdown_format import CountdownFormatter  # noqa: E402
+
+TICKS_PER_SECOND = 5  # display_interval=0.2
+LAUNCH = datetime(2026, 10, 17, 14, 30)
+
+
+def legacy_format(full_launch_time, current_time) -> str:
+    # The body of countdown_loop() before CountdownFormatter, unchanged
+    countdown = full_launch_time - current_time
+
+    total_seconds = int(countdown.total_seconds())
+    days = total_seconds // 86400
+    hours = total_seconds // 3600
+    minutes = (total_seconds % 3600) // 60
+    seconds = total_seconds % 60
+
+    if hours == 0:
+        hour_logic = ""
+    else:
+        hour_logic = f"{hours}:"
+
+    if hours >= 100:
+        countdown_str = f"{days} Days"
+    elif total_seconds <= 0:
+        countdown_str = "00:00"
+    else:
+        countdown_str = f"{hour_logic}{minutes:02}:{seconds:02}"
+
+    return countdown_str.split('.')[0]
+
+
+def check_output():
+    # Every second from 6 days out to 2 minutes past T-0, plus the hour and day boundaries around it
+    formatter = CountdownFormatter()
+    offsets = list(range(-120, 6 * 86400))
+    for total_seconds in offsets:
+        # Fresh formatters too, so no cached prefix can hide a mismatch
+        expected = legacy_format(LAUNCH, LAUNCH - timedelta(seconds=total_seconds))
+        assert formatter.format(total_seconds) == expected, (total_seconds, expected)
+        assert CountdownFormatter().format(total_seconds) == expected, (total_seconds, expected)
+    print(f"Output matches the old countdown for {len(offsets)} different times")
+
+
+def allocated_per_tick(render, inputs: list) -> float:
+    # Bytes allocated inside render() per tick, from tracemalloc's peak growth during each call
+    tracemalloc.start()
+    total = 0
+    for value in inputs:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        render(value)
+        total += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+    return total / len(inputs)
+
+
+def main():
+    check_output()
+    seconds = 600
+    start_offset = 2 * 3600
+    # Inputs are built up front so only the formatting itself is measured
+    remaining = [start_offset - tick // TICKS_PER_SECOND for tick in range(seconds * TICKS_PER_SECOND)]
+    now = [LAUNCH - timedelta(seconds=value) for value in remaining]
+
+    formatter = CountdownFormatter()
+    legacy = allocated_per_tick(lambda current_time: legacy_format(LAUNCH, current_time), now)
+    current = allocated_per_tick(formatter.format, remaining)
+
+    print(f"Bytes allocated per tick over {len(remaining)} ticks ({seconds} s at {TICKS_PER_SECOND} ticks/s):")
+    print(f"  old datetime/f-string path: {legacy:.1f}")
+    print(f"  CountdownFormatter:         {current:.1f}")
+    print(f"  ({formatter.builds} strings built in {formatter.calls} calls)")
+
+
+if __name__ == "__main__":
+    main()
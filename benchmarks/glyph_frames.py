@@ -0,0 +1,92 @@
+# Frame time of the countdown drawn as a scaled label versus GlyphAtlas sprites, run on a normal computer:
+#   python benchmarks/glyph_frames.py
+# Each frame is one text change plus display.refresh() in the simulator. The bytes pushed over SPI are the same on the
+# pico, so the bus time at 24 MHz is a fair estimate of the device's frame time. Host CPU time is shown too, but the
+# simulator's Label doesn't lay out glyphs like adafruit_display_text does, so the label's real CPU cost is higher.
+
+import os
+import sys
+import time as host_time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import simulator  # noqa: E402
+
+perf_counter = host_time.perf_counter
+sim = simulator.install()
+
+from adafruit_display_text import label  # noqa: E402
+from displayio import Group  # noqa: E402
+from terminalio import FONT  # noqa: E402
+
+from countdown_format import CountdownFormatter  # noqa: E402
+from glyph_atlas import GlyphAtlas, GlyphText  # noqa: E402
+from simulator.hardware import Display, FourWire, SPI  # noqa: E402
+
+BAUDRATE = 24_000_000
+
+
+def screen():
+    display = Display(FourWire(SPI()), width=128, height=160)
+    display.auto_refresh = False
+    splash = Group()
+    display.root_group = splash
+    display.refresh()
+    return display, splash
+
+
+def label_path(scale: int, x: int, y: int):
+    display, splash = screen()
+    group = Group(scale=scale, x=x, y=y)
+    text = label.Label(FONT, text="", color=0x000000)
+    group.append(text)
+    splash.append(group)
+    return display, text
+
+
+def sprite_path(atlas: GlyphAtlas, cells: int, x: int, y: int):
+    display, splash = screen()
+    text = GlyphText(atlas, cells, color=0x000000, x=x, y=y)
+    splash.append(text.grid)
+    return display, text
+
+
+def run(display, target, texts: list) -> tuple:
+    # Returns (host microseconds, bytes sent) per frame
+    sent = display.bus.bytes_sent
+    start = perf_counter()
+    for text in texts:
+        target.text = text
+        display.refresh()
+    elapsed = perf_counter() - start
+    return elapsed / len(texts) * 1_000_000, (display.bus.bytes_sent - sent) / len(texts)
+
+
+def compare(title: str, texts: list, scale: int, x: int, y: int, chars: str, cells: int):
+    start = perf_counter()
+    atlas = GlyphAtlas(FONT, chars, scale=scale)
+    build_ms = (perf_counter() - start) * 1000
+    atlas_bytes = atlas.bitmap.width * atlas.bitmap.height // 8
+
+    print(f"{title}: {len(texts)} frames, atlas of {len(atlas.chars)} characters "
+          f"({atlas_bytes} bytes, built in {build_ms:.1f} ms on this computer)")
+    print(f"  {'path':<8} {'host us/frame':>14} {'bytes/frame':>12} {'bus ms/frame':>13}")
+    for name, (display, target) in (("label", label_path(scale, x, y + atlas.tile_height // 2)),
+                                    ("sprites", sprite_path(atlas, cells, x, y))):
+        host_us, size = run(display, target, texts)
+        print(f"  {name:<8} {host_us:>14.1f} {size:>12.0f} {size * 8 / BAUDRATE * 1000:>13.2f}")
+
+
+def main():
+    # Launch countdown in main.py: ten minutes of seconds counting down from 5:04:09
+    formatter = CountdownFormatter()
+    seconds = [formatter.format(5 * 3600 + 249 - i) for i in range(600)]
+    compare("Launch countdown (scale 2)", seconds, 2, 16, 6, "0123456789:DaysLOADING", 9)
+
+    # Clock in clock.py: a day of minutes
+    minutes = [f"{(m // 60) % 12 or 12:02}:{m % 60:02}" for m in range(1440)]
+    compare("Clock (scale 3)", minutes, 3, 20, 12, "0123456789:", 5)
+
+
+if __name__ == "__main__":
+    main()
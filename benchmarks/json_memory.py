@@ -0,0 +1,91 @@
+# Peak-RAM comparison between response.json() and the streaming JsonExtractor, run on a normal computer:
+#   python benchmarks/json_memory.py
+# The recorded rocketlaunch.live response is padded with longer and longer descriptions to show that the extractor's
+# peak memory stays flat while a full json.loads() grows with the payload.
+# Then checks that escaped names (including an emoji sent as a surrogate pair) come out the same as from json.loads(),
+# however the response is split into chunks.
+
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from json_extract import JsonExtractor  # noqa: E402
+from launches import LAUNCH_FIELDS  # noqa: E402
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "..", "fixtures", "rocketlaunch_next_1.json")
+CHUNK_SIZE = 256
+# Mission names as the API may escape them, and what json.loads() makes of them
+ESCAPED_NAMES = {
+    "surrogate pair": '"Go \\ud83d\\ude80 for launch"',
+    "BMP escape": '"Tianzhou \\u5929\\u821f"',
+    "simple escapes": '"Line\\none \\"quoted\\" \\\\ slash"',
+}
+
+
+def peak_bytes(parse, payload: bytes) -> int:
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    parse(payload)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def parse_full(payload: bytes):
+    content = json.loads(payload)
+    return content["result"][0]
+
+
+def parse_streaming(payload: bytes):
+    extractor = JsonExtractor("result", LAUNCH_FIELDS)
+    for start in range(0, len(payload), CHUNK_SIZE):
+        if extractor.feed(payload[start:start + CHUNK_SIZE]):
+            break
+    return extractor.finish()[0]
+
+
+def padded(padding: int) -> bytes:
+    with open(FIXTURE, "rb") as fixture:
+        content = json.load(fixture)
+    content["result"][0]["launch_description"] += " " * padding
+    return json.dumps(content).encode()
+
+
+def escaped_matches(name: str) -> bool:
+    # The escaped name fed in every possible chunk size, each result compared with json.loads()
+    with open(FIXTURE, "rb") as fixture:
+        content = fixture.read().decode()
+    payload = content.replace(json.dumps(json.loads(content)["result"][0]["name"]), name, 1).encode()
+    expected = parse_full(payload)["name"]
+    for size in range(1, 64):
+        extractor = JsonExtractor("result", LAUNCH_FIELDS, max_string=256)
+        for start in range(0, len(payload), size):
+            if extractor.feed(payload[start:start + size]):
+                break
+        if extractor.finish()[0]["name"] != expected:
+            return False
+    return True
+
+
+def main():
+    print(f"{'payload':>10} {'json.loads peak':>16} {'streaming peak':>15}")
+    for padding in (0, 4096, 16384, 65536):
+        payload = padded(padding)
+        assert parse_streaming(payload)["name"] == parse_full(payload)["name"]
+        # The payload itself is already in memory for both, so only the parser's own allocations are counted
+        print(f"{len(payload):>10} {peak_bytes(parse_full, payload):>16} {peak_bytes(parse_streaming, payload):>15}")
+
+    passed = True
+    for case, name in ESCAPED_NAMES.items():
+        ok = escaped_matches(name)
+        passed = passed and ok
+        print(f"{case + ' matches json.loads':<40} {'ok' if ok else 'FAILED'}")
+    if not passed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
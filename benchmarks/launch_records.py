@@ -0,0 +1,92 @@
+# RAM kept per stored launch by the old 7-field tuples and by LaunchRecord, run on a normal computer:
+#   python benchmarks/launch_records.py
+# The recorded 5-launch response is repeated (with later T-0 times) to fill queues of different sizes, then streamed
+# through JsonExtractor exactly like a fetch. Only what the queue keeps afterwards is counted.
+# CPython objects are larger than CircuitPython's, so the absolute numbers are higher than on the pico; the difference
+# between the two layouts (a T-0 string less per launch, shared vehicle/pad/location/country strings) carries over.
+
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from json_extract import JsonExtractor  # noqa: E402
+from launches import LAUNCH_FIELDS, LaunchQueue  # noqa: E402
+from timeutil import parse_t0  # noqa: E402
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "..", "fixtures", "rocketlaunch_next_5.json")
+CHUNK_SIZE = 256
+NOW = parse_t0("2026-10-17T12:00Z")
+
+
+def payload(count: int) -> bytes:
+    with open(FIXTURE, "rb") as fixture:
+        content = json.load(fixture)
+    launches = content["result"]
+    result = []
+    for i in range(count):
+        launch = json.loads(json.dumps(launches[i % len(launches)]))
+        # Every repeat of the fixture moves to a later date, so each launch has its own T-0 text
+        for key in ("t0", "win_open"):
+            t0 = launch[key]
+            if t0 is not None:
+                launch[key] = f"{2026 + i // 20}{t0[4:8]}{int(t0[8:10]) + i // 5 % 4 * 2:02}{t0[10:]}"
+        result.append(launch)
+    content["result"] = result
+    return json.dumps(content).encode()
+
+
+def extract(data: bytes, count: int) -> list:
+    extractor = JsonExtractor("result", LAUNCH_FIELDS, max_records=count)
+    for start in range(0, len(data), CHUNK_SIZE):
+        if extractor.feed(data[start:start + CHUNK_SIZE]):
+            break
+    return extractor.finish()
+
+
+def legacy_load(records: list) -> list:
+    # LaunchQueue.load() before LaunchRecord, unchanged
+    entries = []
+    for record in records:
+        t0 = record["t0"] if record["t0"] is not None else record["win_open"]
+        if t0 is None:
+            continue
+        entries.append((parse_t0(t0), t0, record["name"], record["vehicle"], record["pad"],
+                        record["location"], record["country"]))
+    entries.sort()
+    return entries
+
+
+def record_load(records: list) -> list:
+    queue = LaunchQueue(size=len(records), grace=0)
+    queue.load(records, NOW)
+    return queue.entries
+
+
+def retained_bytes(load, data: bytes, count: int):
+    # Bytes still allocated once the extracted dicts are gone, i.e. what the queue itself holds on to
+    gc.collect()
+    tracemalloc.start()
+    entries = load(extract(data, count))
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return retained, entries
+
+
+def main():
+    print(f"{'launches':>8} {'tuples':>8} {'per launch':>10} {'records':>8} {'per launch':>10}")
+    for count in (5, 20, 50, 100):
+        data = payload(count)
+        legacy, legacy_entries = retained_bytes(legacy_load, data, count)
+        records, record_entries = retained_bytes(record_load, data, count)
+        assert [entry[0] for entry in legacy_entries] == [entry.t0 for entry in record_entries]
+        assert [entry[2:] for entry in legacy_entries] == [tuple(entry[1:]) for entry in record_entries]
+        print(f"{count:>8} {legacy:>8} {legacy // count:>10} {records:>8} {records // count:>10}")
+
+
+if __name__ == "__main__":
+    main()
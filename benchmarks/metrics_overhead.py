@@ -0,0 +1,100 @@
+# Cost of the metrics in metrics.py, run in the simulator on a normal computer:
+#   python benchmarks/metrics_overhead.py
+# Times a single record() call with the metrics off and on against an empty method call, then runs the launch
+# countdown for ten simulated minutes with METRICS off and on, a few times each, and compares the host CPU time.
+# The simulator's clock only moves on sleeps, so the timings the metrics record here are mostly zero; the point is
+# what recording them costs, and that every histogram gets fed from where it should be. Host CPU time is noisy and
+# leaves out the SPI transfers that take most of a tick on the pico, so the whole-run numbers are only printed, and
+# the per-call check leaves plenty of room.
+# Then opens the hidden diagnostics screen and checks its rows fit the screen.
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import simulator  # noqa: E402
+
+sim = simulator.install()
+
+from core import PicoCore  # noqa: E402
+from metrics import METRICS, Metrics  # noqa: E402
+
+RUN_SECONDS = 600
+REPEATS = 3
+CALLS = 100_000
+SCREEN_CHARACTERS = 21  # 128 pixels of 6 pixel wide terminalio characters
+
+
+class Empty:
+    def record(self, name: str, value: int):
+        pass
+
+
+def call_ns(target) -> float:
+    # Host nanoseconds per target.record() call, best of REPEATS
+    best = None
+    for _ in range(REPEATS):
+        start = time.perf_counter_ns()
+        for i in range(CALLS):
+            target.record("tick", i)
+        elapsed = (time.perf_counter_ns() - start) / CALLS
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run(enabled: bool):
+    core = sim.attach(PicoCore())
+    if enabled:
+        core.metrics.enable()
+    core.switch("launch")
+    core.wifi_connect()
+    core.keep_time()
+    start = sim.clock.monotonic()
+    cpu_start = time.process_time()
+    while sim.clock.monotonic() - start < RUN_SECONDS:
+        core.cycle(max(1, min(core.refresh_wait(), RUN_SECONDS - (sim.clock.monotonic() - start))))
+        core.manage_memory()
+    return time.process_time() - cpu_start, core
+
+
+def main():
+    empty, disabled, enabled = call_ns(Empty()), call_ns(Metrics()), call_ns(Metrics(enabled=True))
+    print(f"record() per call: empty method {empty:.0f} ns, metrics off {disabled:.0f} ns, on {enabled:.0f} ns")
+
+    off_times = []
+    on_times = []
+    for _ in range(REPEATS):
+        off_times.append(run(False)[0])
+        on_time, core = run(True)
+        on_times.append(on_time)
+    off, on = min(off_times), min(on_times)
+    print(f"metrics off: {off:.3f} s of CPU, metrics on: {on:.3f} s ({100 * (on - off) / off:+.1f}%)")
+    print(core.metrics.report())
+
+    off_core = run(False)[1]
+    counts = {name: core.metrics.histograms[name].count for name in METRICS}
+    core.switch("diagnostics")
+    core.mode.render_tick()
+    rows = core.metrics.rows()
+    for row in rows:
+        print(f"  |{row}|")
+
+    checks = (
+        ("metrics off allocate no histograms", not off_core.metrics.histograms),
+        ("record() with metrics off costs about a call", disabled < empty * 3),
+        ("every histogram got samples", all(counts.values())),
+        ("one fetch sample per request", counts["fetch"] == core.net.fetches - core.net.failures),
+        ("diagnostics rows fit the screen", all(len(row) <= SCREEN_CHARACTERS for row in rows)),
+    )
+    passed = True
+    for name, ok in checks:
+        passed = passed and ok
+        print(f"{name:<46} {'ok' if ok else 'FAILED'}")
+    if not passed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
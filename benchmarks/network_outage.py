@@ -0,0 +1,114 @@
+# Runs the launch countdown through a series of network failures in the simulator, run on a normal computer:
+#   python benchmarks/network_outage.py
+# Wi-Fi is unavailable at power-on, then comes up, then drops out for a while, then DNS fails with the link up, then
+# the API answers with HTML 502 error pages and a captive portal's login page.
+# Checks that nothing raises, that the countdown stays on screen from the cached launches the whole time after the
+# first fetch, that reconnect attempts back off instead of retrying every couple of seconds, and that fetching
+# recovers afterwards. Exits with status 1 if any check fails.
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import simulator  # noqa: E402
+
+sim = simulator.install()
+
+from core import PicoCore  # noqa: E402
+from json_extract import JsonExtractor  # noqa: E402
+from launches import LAUNCH_FIELDS  # noqa: E402
+from simulator.network import BAD_GATEWAY, CAPTIVE_PORTAL  # noqa: E402
+
+random.seed(4295)  # Same jitter on every run
+
+BOOT_FAILURES = 3  # Failed connection attempts at power-on
+OUTAGE_FAILURES = 5  # Failed connection attempts after the link drops
+DNS_FAILURES = 2  # Failed requests with Wi-Fi up
+ERROR_PAGES = 2  # 502 responses from the API after that
+PORTAL_PAGES = 1  # Login pages with a 200 status after those
+RUN_SECONDS = 1200
+
+
+def main():
+    attempts = []
+    connect = sim.radio.connect
+
+    def timed_connect(ssid, password=None, **kwargs):
+        attempts.append(sim.clock.monotonic())
+        return connect(ssid, password, **kwargs)
+
+    sim.radio.connect = timed_connect
+    sim.radio.fail_connects = BOOT_FAILURES
+
+    core = sim.attach(PicoCore())
+    core.mode_name = "launch"
+    core.switch("launch")
+    core.mode.refresh_interval = 60
+    countdown = core.mode.countdown_text_area
+
+    start = sim.clock.monotonic()
+    blank_after_fetch = 0
+    stage = 0
+    while sim.clock.monotonic() - start < RUN_SECONDS:
+        elapsed = sim.clock.monotonic() - start
+        if stage == 0 and core.net.fetches - core.net.failures > 0:
+            # First launches are in, cut the link
+            stage = 1
+            sim.radio.disconnect()
+            sim.radio.fail_connects = OUTAGE_FAILURES
+            print(f"{elapsed:7.1f} s  Wi-Fi dropped")
+        elif stage == 1 and sim.radio.connected:
+            stage = 2
+            sim.server.fail_requests = DNS_FAILURES
+            core.mode.queue.fetched_at = None  # Refetch on the next refresh, so the DNS failures are hit right away
+            print(f"{elapsed:7.1f} s  Wi-Fi back, DNS failing for the next {DNS_FAILURES} requests")
+        elif stage == 2 and sim.server.fail_requests == 0 and core.mode.queue.fetched_at is not None:
+            stage = 3
+            sim.server.error_responses = ERROR_PAGES
+            sim.server.portal_responses = PORTAL_PAGES
+            core.mode.queue.fetched_at = None
+            print(f"{elapsed:7.1f} s  API answering the next {ERROR_PAGES} requests with a 502 page, then "
+                  f"{PORTAL_PAGES} with a captive portal")
+
+        core.cycle(core.refresh_wait())
+        if stage > 0 and not countdown.text[:1].isdigit():
+            blank_after_fetch += 1
+
+    gaps = [round(b - a, 1) for a, b in zip(attempts, attempts[1:])]
+    print()
+    print(f"Connection attempts at {[round(at - start, 1) for at in attempts]} s, gaps {gaps} s")
+    print(core.net.report())
+
+    # The extractor on its own must turn an HTML page into a ValueError, which fetch() catches
+    html_errors = []
+    for page in (BAD_GATEWAY, CAPTIVE_PORTAL):
+        try:
+            extractor = JsonExtractor("result", LAUNCH_FIELDS)
+            extractor.feed(page)
+            extractor.finish()
+            html_errors.append(None)
+        except Exception as error:
+            html_errors.append(error)
+
+    outage_gaps = gaps[BOOT_FAILURES + 1:BOOT_FAILURES + 1 + OUTAGE_FAILURES]
+    checks = (
+        ("reached the end of the run without raising", True),
+        ("countdown stayed up after the first fetch", blank_after_fetch == 0),
+        ("reconnect waits grew during the outage", all(b > a for a, b in zip(outage_gaps, outage_gaps[1:]))),
+        ("failed requests were counted", core.net.failures == DNS_FAILURES + ERROR_PAGES + PORTAL_PAGES),
+        ("502 pages weren't parsed", core.http.errors == ERROR_PAGES and sim.server.error_responses == 0),
+        ("extractor rejects HTML with a ValueError", all(isinstance(error, ValueError) for error in html_errors)),
+        ("fetching recovered", sim.radio.connected and core.mode.queue.fetched_at is not None),
+    )
+    passed = True
+    for name, ok in checks:
+        passed = passed and ok
+        print(f"{name:<45} {'ok' if ok else 'FAILED'}")
+    if not passed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# Requests, wake-ups and freshness of the adaptive poll policy against the old fixed timing, run on a normal computer:
+#   python benchmarks/poll_volume.py
+# Launch mode: a launch ten days out slips by an hour two days before T-0, then holds for ten minutes half an hour
+# before T-0. Both timings run against the same timeline through LaunchQueue: the old one woke up every 120 seconds
+# and refetched once the data was 30 minutes old, the new one sleeps for as long as refresh_in() says.
+# Clock mode: ten minutes of the real ClockMode in the simulator, checking every render lands just after a minute
+# boundary.
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import simulator  # noqa: E402
+
+sim = simulator.install()
+
+from core import PicoCore  # noqa: E402
+from launches import LaunchQueue  # noqa: E402
+from polling import PollPolicy  # noqa: E402
+from timeutil import date_time  # noqa: E402
+
+START = 1_789_999_980  # On a minute boundary, like every T-0
+T0 = START + 10 * 86400
+# (time of the change, new T-0)
+CHANGES = ((T0 - 2 * 86400 + 1000, T0 + 3600), (T0 + 3600 - 1800 + 77, T0 + 3600 + 600))
+CLOCK_SECONDS = 600
+
+
+def t0_text(epoch: int) -> str:
+    y, m, d, h, mi = date_time(epoch)[:5]
+    return f"{y}-{m:02}-{d:02}T{h:02}:{mi:02}Z"
+
+
+def published_t0(now: int) -> int:
+    # The T-0 rocketlaunch.live would answer with at time now
+    t0 = T0
+    for at, new_t0 in CHANGES:
+        if now >= at:
+            t0 = new_t0
+    return t0
+
+
+def run_launch(queue: LaunchQueue, wait) -> dict:
+    # Wakes up, refetches if the queue says so, and sleeps for wait(queue, now) seconds, until the launch is over.
+    now = START
+    wakes = 0
+    lags = []
+    seen = None
+    while now < CHANGES[-1][1] + queue.grace:
+        wakes += 1
+        queue.expire(now)
+        if queue.needs_refresh(now):
+            record = {"t0": t0_text(published_t0(now)), "win_open": None, "name": "Test launch", "vehicle": "Falcon 9",
+                      "pad": "SLC-40", "location": "Cape Canaveral SFS", "country": "United States"}
+            queue.load([record], now)
+        t0 = queue.current().t0
+        if t0 != seen:
+            changed_at = max([at for at, new_t0 in CHANGES if new_t0 == t0] or [now])
+            lags.append(now - changed_at)
+            seen = t0
+        now += max(1, wait(queue, now))
+    return {"requests": queue.fetches, "wakes": wakes, "lags": lags[1:]}
+
+
+def run_clock() -> list:
+    # Seconds past the minute of every clock render after the first one
+    core = sim.attach(PicoCore())
+    core.wifi_connect()
+    core.keep_time()
+    core.switch("clock")
+    renders = []
+    render_tick = core.mode.render_tick
+
+    def timed_render():
+        render_tick()
+        renders.append(core.utc_now() % 60)
+
+    core.mode.render_tick = timed_render
+    start = sim.clock.monotonic()
+    while sim.clock.monotonic() - start < CLOCK_SECONDS:
+        core.cycle(max(1, min(core.refresh_wait(), CLOCK_SECONDS - (sim.clock.monotonic() - start))))
+    return renders[1:]
+
+
+def main():
+    old = run_launch(LaunchQueue(policy=PollPolicy(tiers=(), far_max_age=1800)), lambda queue, now: 120)
+    new = run_launch(LaunchQueue(), lambda queue, now: queue.refresh_in(now) or 120)
+    print(f"{'launch mode':<12} {'requests':>9} {'wake-ups':>9}  seconds until a T-0 change showed up")
+    for name, result in (("fixed", old), ("adaptive", new)):
+        print(f"{name:<12} {result['requests']:>9} {result['wakes']:>9}  {result['lags']}")
+
+    renders = run_clock()
+    print(f"clock mode: {len(renders)} renders in {CLOCK_SECONDS} s, seconds past the minute {sorted(set(renders))}")
+
+    checks = (
+        ("fewer requests", new["requests"] < old["requests"]),
+        ("fewer wake-ups", new["wakes"] < old["wakes"]),
+        # Days out a slip may take up to that tier's max age to show, close to T-0 it has to be at least as quick
+        ("slip days out shows up within 2 hours", new["lags"][0] <= 7200),
+        ("hold near T-0 shows up at least as fast", new["lags"][1] <= old["lags"][1]),
+        ("clock renders once a minute", len(renders) <= CLOCK_SECONDS // 60),
+        ("clock renders right after the minute", all(second <= 1 for second in renders)),
+    )
+    passed = True
+    for name, ok in checks:
+        passed = passed and ok
+        print(f"{name:<40} {'ok' if ok else 'FAILED'}")
+    if not passed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
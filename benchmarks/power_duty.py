@@ -0,0 +1,114 @@
+# Duty cycle of the default (always on) timing against low power mode, run in the simulator on a normal computer:
+#   python benchmarks/power_duty.py
+# Runs the clock and the launch countdown for two simulated hours each way. Joining Wi-Fi takes 3 seconds, like on
+# the pico. Halfway through the clock runs, the button is held for a second to ask for an NTP resync.
+# Prints how much of the time the CPU was awake and the radio was on, and checks that low power mode still renders
+# the right time every minute, still answers the button, and ticks the countdown right after every second.
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import simulator  # noqa: E402
+
+sim = simulator.install()
+
+from core import PicoCore  # noqa: E402
+from power import PowerManager  # noqa: E402
+from timeutil import date_time  # noqa: E402
+
+RUN_SECONDS = 7200
+CONNECT_SECONDS = 3
+
+
+def run(mode: str, low_power: bool) -> dict:
+    core = sim.attach(PicoCore())
+    core.power = PowerManager(core.net, low_power=low_power)
+    core.net.disconnect()  # Every run starts with the radio off and joins once, like after power-on
+    core.wifi_connect()
+    core.keep_time()
+    core.switch(mode)
+    syncs = core.clock.syncs
+    sleeps = sim.light_sleeps
+    start = sim.clock.monotonic()
+    if mode == "clock":
+        sim.press(start + RUN_SECONDS / 2, duration=1.0)
+
+    wrong = []
+    if mode == "clock":
+        render_tick = core.mode.render_tick
+
+        def checked_render():
+            render_tick()
+            hours, minutes = date_time(core.tz.to_local(sim.clock.true_time()))[3:5]
+            shown = f"{hours - 12 if hours > 12 else hours:02}:{minutes:02}"
+            if core.mode.countdown_text_area.text != shown:
+                wrong.append((core.mode.countdown_text_area.text, shown))
+
+        core.mode.render_tick = checked_render
+
+    lags = []
+    if mode == "launch":
+        render_tick = core.mode.render_tick
+
+        def timed_render(now=None):
+            # How long after the RTC's second boundary the countdown got drawn
+            lags.append((sim.clock.ns - sim.clock.rtc_set_at) % 1_000_000_000 / 1e9)
+            render_tick(now)
+
+        core.mode.render_tick = timed_render
+
+    while sim.clock.monotonic() - start < RUN_SECONDS:
+        core.cycle(max(1, min(core.refresh_wait(), RUN_SECONDS - (sim.clock.monotonic() - start))))
+    core.mode_name = mode
+    core.switch(mode)  # Back to where it was, in case the button changed modes
+
+    elapsed = sim.clock.monotonic() - start
+    return {
+        "awake": 100 - 100 * core.power.asleep_ns / 1e9 / elapsed,
+        "radio": 100 * core.net.radio_on_time() / elapsed,
+        "wakes": sim.light_sleeps - sleeps,
+        "button_wakes": core.power.button_wakes,
+        "syncs": core.clock.syncs - syncs,
+        "fetches": core.net.fetches,
+        "wrong": wrong,
+        "lag": max(lags[1:]) if len(lags) > 1 else 0,  # The first tick comes before the boundary is found
+    }
+
+
+def main():
+    sim.radio.connect_seconds = CONNECT_SECONDS
+    results = {}
+    print(f"{'run':<18} {'awake %':>8} {'radio %':>8} {'wakes':>6} {'fetches':>8} {'NTP syncs':>10}")
+    for mode in ("clock", "launch"):
+        for low_power in (False, True):
+            result = run(mode, low_power)
+            results[(mode, low_power)] = result
+            name = f"{mode} {'low power' if low_power else 'always on'}"
+            print(f"{name:<18} {result['awake']:>8.1f} {result['radio']:>8.1f} {result['wakes']:>6} "
+                  f"{result['fetches']:>8} {result['syncs']:>10}")
+
+    clock = results[("clock", True)]
+    launch = results[("launch", True)]
+    print(f"Low power countdown drawn up to {launch['lag'] * 1000:.0f} ms after the second")
+    checks = (
+        ("clock sleeps most of the time", clock["awake"] < results[("clock", False)]["awake"] / 10),
+        ("clock radio mostly off", clock["radio"] < results[("clock", False)]["radio"] / 10),
+        ("launch sleeps between ticks", launch["awake"] < results[("launch", False)]["awake"] / 10),
+        ("launch radio mostly off", launch["radio"] < results[("launch", False)]["radio"] / 10),
+        ("launch ticks right after every second", launch["lag"] < 0.1),
+        ("clock shows the right time after every sleep", not clock["wrong"]),
+        ("button wakes the board", clock["button_wakes"] >= 1),
+        ("held button resynced the clock", clock["syncs"] >= 1),
+    )
+    passed = True
+    for name, ok in checks:
+        passed = passed and ok
+        print(f"{name:<45} {'ok' if ok else 'FAILED'}")
+    if not passed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
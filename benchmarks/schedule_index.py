@@ -0,0 +1,170 @@
+# Cost of the event calendar in schedule.py as it grows, run on a normal computer:
+#   python benchmarks/schedule_index.py
+# Writes calendars of 10, 100 and 1000 events (sessions at a handful of venues, in shuffled order) and loads each one
+# once. Then steps through a month of carousel turns, checking every pick against a plain linear scan, and measures
+# what the turns allocate: a few boxed ints at most, however long the calendar is.
+# Also loads a hand-written calendar with short and broken lines, then runs the manual and clock modes in the
+# simulator on the schedule.txt that ships with the repo.
+
+import gc
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import simulator  # noqa: E402
+
+sim = simulator.install()
+
+from core import PicoCore  # noqa: E402
+from schedule import Carousel, Schedule  # noqa: E402
+from timeutil import date_time  # noqa: E402
+
+START = 1_790_000_000
+SIZES = (10, 100, 1000)
+VENUES = ("Stadio San Siro", "Arena di Verona", "Cortina Curling", "Bormio Stelvio", "Livigno Snow Park")
+TURNS = 3000
+TURN_SECONDS = 900
+# Custom dates as people type them: only a name, no text at all, a bad date and a bad time zone
+HANDWRITTEN = ("2026-12-25T06:00Z | Christmas\n"
+               "2027-01-01T06:00Z\n"
+               "2027-02-30 | Not a T-0\n"
+               "2027-03-01T00:00Z | Trip | | | | | 5 | Mars/Olympus\n")
+TURN_PEAK = 1024  # Bytes a turn may allocate for a moment (CPython boxes ints over 256), whatever the calendar size
+
+
+def write_calendar(count: int) -> str:
+    rows = []
+    for i in range(count):
+        y, m, d, h, mi = date_time(START + i * 3600 * 7)[:5]
+        venue = VENUES[i % len(VENUES)]
+        rows.append(f"{y}-{m:02}-{d:02}T{h:02}:{mi:02}Z | Session {i} | Event {i % 16} | {venue} | Milan-Cortina | "
+                    f"Italy, Europe")
+    random.Random(count).shuffle(rows)
+    path = os.path.join(tempfile.mkdtemp(prefix="schedule-"), "schedule.txt")
+    with open(path, "w") as file:
+        file.write("# Generated by benchmarks/schedule_index.py\n" + "\n".join(rows) + "\n")
+    return path
+
+
+def linear_pick(events: list, now: int, grace: int, window: int, turn: int):
+    # What the carousel should show, by looking at every event
+    upcoming = [event for event in events if event.t0 > now - grace]
+    if not upcoming:
+        return events[-1]
+    return upcoming[:window][turn % min(window, len(upcoming))]
+
+
+def turns(carousel: Carousel):
+    now = START
+    for _ in range(TURNS):
+        carousel.current(now)
+        carousel.advance()
+        now += TURN_SECONDS
+
+
+def measure(count: int) -> dict:
+    path = write_calendar(count)
+    gc.collect()
+    tracemalloc.start()
+    calendar = Schedule()
+    started = time.perf_counter()
+    calendar.load(path)
+    load_ms = (time.perf_counter() - started) * 1000
+    gc.collect()
+    kept = tracemalloc.get_traced_memory()[0]
+
+    carousel = Carousel(calendar)
+    now = START
+    wrong = 0
+    for _ in range(TURNS // 10):
+        if carousel.current(now) is not linear_pick(calendar.events, now, calendar.grace, carousel.window,
+                                                    carousel.turn):
+            wrong += 1
+        carousel.advance()
+        now += TURN_SECONDS * 10
+
+    # The same turns again, this time only measuring them
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    turns(carousel)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    started = time.perf_counter()
+    turns(carousel)
+    turn_us = (time.perf_counter() - started) * 1_000_000 / TURNS
+    return {"load_ms": load_ms, "per_event": kept / count, "turn_us": turn_us, "left": current - before,
+            "peak": peak - before, "wrong": wrong}
+
+
+def load_handwritten() -> Schedule:
+    path = os.path.join(tempfile.mkdtemp(prefix="schedule-"), "schedule.txt")
+    with open(path, "w") as file:
+        file.write(HANDWRITTEN)
+    calendar = Schedule()
+    calendar.load(path)
+    return calendar
+
+
+def run_modes() -> dict:
+    core = sim.attach(PicoCore())
+    core.wifi_connect()
+    core.keep_time()
+    core.switch("manual")
+    shown = {core.mode.launch}
+    rotate = core.mode.rotate
+
+    def recorded_rotate():
+        rotate()
+        shown.add(core.mode.launch)
+
+    core.mode.rotate = recorded_rotate
+    start = sim.clock.monotonic()
+    while sim.clock.monotonic() - start < 60:
+        core.cycle(max(1, 60 - (sim.clock.monotonic() - start)))
+    core.switch("clock")
+    core.schedule()
+    core.mode.render_tick()
+    return {"manual": shown, "clock": [core.mode.view.rendered[name] for name in ("row_5", "row_6", "day")]}
+
+
+def main():
+    results = {}
+    print(f"{'events':>7} {'load ms':>8} {'bytes/event':>12} {'us/turn':>8} {'left behind':>12} {'peak':>6}")
+    for count in SIZES:
+        result = measure(count)
+        results[count] = result
+        print(f"{count:>7} {result['load_ms']:>8.1f} {result['per_event']:>12.0f} {result['turn_us']:>8.2f} "
+              f"{result['left']:>12} {result['peak']:>6}")
+    handwritten = load_handwritten()
+    print(handwritten.report())
+    modes = run_modes()
+    print(f"manual mode showed {sorted(event.name + ' / ' + event.vehicle for event in modes['manual'])}")
+    print(f"clock mode shows {modes['clock']}")
+
+    small, large = results[SIZES[0]], results[SIZES[-1]]
+    checks = (
+        ("every pick matches a linear scan", not any(result["wrong"] for result in results.values())),
+        ("what turns leave behind doesn't grow", large["left"] <= small["left"]),
+        ("turns allocate next to nothing, at any size", all(r["peak"] <= TURN_PEAK for r in results.values())),
+        ("turn time grows slower than the calendar", large["turn_us"] < small["turn_us"] * 10),
+        ("short lines load, broken ones are skipped",
+         [event.name for event in handwritten.events] == ["Christmas", ""] and handwritten.skipped == 2),
+        ("manual mode takes turns", len(modes["manual"]) >= 2),
+        ("clock mode shows an event", modes["clock"][0].startswith("Time in ")),
+    )
+    passed = True
+    for name, ok in checks:
+        passed = passed and ok
+        print(f"{name:<46} {'ok' if ok else 'FAILED'}")
+    if not passed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
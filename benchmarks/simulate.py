@@ -0,0 +1,161 @@
+# Runs PicoCore in the host-side simulator and checks it against performance budgets:
+#   python benchmarks/simulate.py
+# Measures get_launch_info() (peak allocations, bytes read), a minute of the launch countdown (render ticks per second
+# of host CPU time, label writes per tick, bytes pushed to the screen per frame and per second, peak allocations) and
+# switching through every mode (memory left behind by the old modes, old mode classes that outlive the switch, no new
+# display or Wi-Fi connection) and a minute in every mode (frames the display dropped), prints a table and exits with
+# status 1 if anything is over budget, so a regression shows up on a normal computer before it reaches the pico.
+# Absolute numbers are CPython's, not the pico's; the budgets are there to catch changes, not to predict the device.
+
+import gc
+import os
+import sys
+import tracemalloc
+import weakref
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import simulator  # noqa: E402
+
+sim = simulator.install()
+perf_counter = simulator.host_time.perf_counter  # The computer's clock, for ticks per second of host CPU time
+
+from core import PicoCore  # noqa: E402
+import modes  # noqa: E402
+from modes import ORDER  # noqa: E402
+
+LOOP_SECONDS = 60  # Simulated length of the countdown_loop() run
+
+# name -> (budget, True if higher is better)
+# Set a little past the current numbers; tighten them whenever an optimization lands. Ticks per second is left loose
+# since it depends on the computer running the benchmark.
+BUDGETS = {
+    "fetch_peak_bytes": (12_000, False),
+    "fetch_bytes_read": (8_000, False),
+    "loop_ticks_per_second": (2_000, True),
+    "loop_label_writes_per_tick": (0.5, False),
+    "loop_bytes_per_frame": (9_000, False),
+    "loop_bytes_per_second": (25_000, False),
+    "loop_peak_bytes": (6_000, False),
+    "switch_retained_bytes": (2_000, False),
+    "switch_reconnects": (0, False),
+    "switch_stale_modules": (0, False),
+    "frames_skipped": (0, False),
+}
+
+
+def setup():
+    core = sim.attach(PicoCore())
+    core.switch("launch")
+    core.wifi_connect()
+    core.keep_time()
+    return core
+
+
+def measure_fetch(core) -> dict:
+    served = sim.server.bytes_served
+    tracemalloc.start()
+    core.mode.get_launch_info()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"fetch_peak_bytes": peak, "fetch_bytes_read": sim.server.bytes_served - served}
+
+
+def measure_loop(core) -> dict:
+    display = sim.display()
+    sent = display.bus.bytes_sent
+    frames = display.frames
+    writes = sim.label_writes(display.root_group)
+    ticks = core.mode.view.ticks
+
+    start = perf_counter()
+    core.cycle(LOOP_SECONDS)
+    elapsed = perf_counter() - start
+
+    ticks = core.mode.view.ticks - ticks
+    frames = display.frames - frames
+    result = {
+        "loop_ticks_per_second": ticks / elapsed,
+        "loop_label_writes_per_tick": (sim.label_writes(display.root_group) - writes) / ticks,
+        "loop_bytes_per_frame": (display.bus.bytes_sent - sent) / frames if frames else 0,
+        "loop_bytes_per_second": (display.bus.bytes_sent - sent) / LOOP_SECONDS,
+    }
+
+    # A second run under tracemalloc, which slows everything down too much to time the first one with it
+    tracemalloc.start()
+    core.cycle(LOOP_SECONDS)
+    result["loop_peak_bytes"] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result
+
+
+def measure_switch(core) -> dict:
+    # Goes through every mode and back to the launch countdown three times, on the same display and Wi-Fi connection.
+    # Whatever a later round adds on top of the one before is held on to by modes that should have been let go. A leak
+    # grows every round, while a one-off resize of one of CPython's own tables (e.g. interned strings, as the modes
+    # are imported again) only lands in one of them, so the smaller growth of the last two rounds counts.
+    # After every switch the old mode's class (and with it its module) has to be gone, and so does the old module's
+    # attribute on the modes package, which importing it had set.
+    display = sim.display()
+    connects = sim.radio.connects
+    tracemalloc.start()
+    traced = []
+    stale = 0
+    for _ in range(3):
+        for name in ORDER[1:] + ORDER[:1]:
+            old_class = weakref.ref(type(core.mode))
+            old_module = type(core.mode).__module__.split(".")[1]
+            core.switch(name)
+            gc.collect()
+            new_modules = [module_name.split(".")[1] for module_name in sys.modules if module_name.startswith("modes.")]
+            stale += old_class() is not None
+            stale += old_module not in new_modules and hasattr(modes, old_module)
+        gc.collect()
+        traced.append(tracemalloc.get_traced_memory()[0])
+    retained = min(traced[1] - traced[0], traced[2] - traced[1])
+    tracemalloc.stop()
+    if sim.display() is not display:
+        raise RuntimeError("Switching modes created a new display")
+    return {"switch_retained_bytes": retained, "switch_reconnects": sim.radio.connects - connects,
+            "switch_stale_modules": stale}
+
+
+def measure_frames(core) -> dict:
+    # A minute in every mode, counting the refreshes the display dropped instead of showing
+    display = sim.display()
+    skipped = display.skipped_refreshes
+    for name in ORDER:
+        core.switch(name)
+        core.cycle(60)
+    return {"frames_skipped": display.skipped_refreshes - skipped}
+
+
+def within_budget(name: str, value: float) -> bool:
+    budget, higher_is_better = BUDGETS[name]
+    return value >= budget if higher_is_better else value <= budget
+
+
+def report(results: dict) -> bool:
+    passed = True
+    for name, (budget, higher_is_better) in BUDGETS.items():
+        value = results[name]
+        ok = within_budget(name, value)
+        passed = passed and ok
+        print(f"{name:<28} {value:>12.1f}  budget {'>=' if higher_is_better else '<='} {budget:<8} "
+              f"{'ok' if ok else 'OVER BUDGET'}")
+    return passed
+
+
+def run():
+    core = setup()
+    results = measure_fetch(core)
+    results.update(measure_loop(core))
+    results.update(measure_switch(core))
+    results.update(measure_frames(core))
+    print()
+    if not report(results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run()
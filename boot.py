@@ -0,0 +1,21 @@
+# Runs once before code.py. Remounts CIRCUITPY so code.py can save the launch cache (flash_cache.py) to flash.
+# While the drive is writable from code, the computer can only read it. Hold the button (GP0) while resetting the
+# pico to skip the remount and copy new files over as usual.
+try:
+    from board_definitions.raspberry_pi_pico_w import GP0
+except ImportError:  # pragma: no cover
+    # noinspection PyPackageRequirements
+    from board import GP0
+from digitalio import DigitalInOut, Direction, Pull
+import storage
+
+button = DigitalInOut(GP0)
+button.direction = Direction.INPUT
+button.pull = Pull.DOWN
+
+if button.value:
+    print("Button held, CIRCUITPY stays writable from USB and the launch cache is off")
+else:
+    storage.remount("/", readonly=False)
+
+button.deinit()
@@ -0,0 +1,126 @@
+import keypad
+from adafruit_ticks import ticks_ms, ticks_add, ticks_diff
+
+# Gestures handed out by ButtonEvents.poll()
+SHORT = "short"
+LONG = "long"
+DOUBLE = "double"
+
+
+class ButtonEvents:
+    # Turns a button into short, long and double presses. keypad.Keys scans and debounces the pin in the background
+    # and queues timestamped press/release edges, so a press is never missed between polls and nothing has to sleep.
+    # A short press is only certain once double_press has passed without a second press; a long press fires while
+    # the button is still held. Latency is counted from the physical edge that ends a gesture (the release of a short
+    # press, the second press of a double) to the poll() that hands it out, which is when its action runs, so the
+    # double_press wait is part of it. A long press has no such edge and counts from the end of its hold instead.
+
+    def __init__(self, pin, long_press=0.8, double_press=0.25, value_when_pressed=True, pull=True):
+        # pin (Pin) - the button's pin, e.g. GP0
+        # long_press (float) - default: 0.8 - seconds held before it counts as a long press
+        # double_press (float) - default: 0.25 - longest gap (in seconds) between the presses of a double press
+        # value_when_pressed (bool) - default: True - pin level while pressed, True for a button wired to 3.3V
+        # pull (bool) - default: True - enable the internal pull resistor (down if value_when_pressed is True)
+
+        self.pin = pin
+        self.value_when_pressed = value_when_pressed
+        self.pull = pull
+        self.keys = keypad.Keys((pin,), value_when_pressed=value_when_pressed, pull=pull)
+        self.resumed_at = None  # ticks_ms of a resume() after a press, keypad needs a scan or two to see it
+        self.event = keypad.Event()  # Reused for every edge, so draining the queue allocates nothing
+        self.long_ms = int(long_press * 1000)
+        self.double_ms = int(double_press * 1000)
+        self.pressed_at = None  # Timestamp of the press still held down
+        self.released_at = None  # Timestamp of a finished short press that could still become a double
+        self.long_fired: bool = False
+        self.swallow: bool = False  # Ignore the release that ends a double press
+        self.pending: list = []  # (gesture, ticks_ms of the edge that ended it)
+        self.counts: dict = {SHORT: 0, LONG: 0, DOUBLE: 0}
+        self.dropped: int = 0  # Edges lost to a full keypad queue
+        self.latency_total: int = 0
+        self.latency_max: int = 0
+
+    def _emit(self, gesture: str, edge_at: int):
+        self.pending.append((gesture, edge_at))
+        self.counts[gesture] += 1
+
+    def _edge(self, pressed: bool, timestamp: int):
+        if pressed:
+            self.pressed_at = timestamp
+            self.long_fired = False
+            if self.released_at is not None and ticks_diff(timestamp, self.released_at) <= self.double_ms:
+                self.released_at = None
+                self.swallow = True
+                self._emit(DOUBLE, timestamp)
+        elif self.pressed_at is not None:
+            self.pressed_at = None
+            if self.swallow or self.long_fired:
+                self.swallow = False
+            else:
+                self.released_at = timestamp
+
+    def update(self):
+        # Reads every queued edge and fires the gestures whose timers ran out.
+
+        events = self.keys.events
+        if events.overflowed:
+            self.dropped += 1
+            events.clear()
+            self.pressed_at = self.released_at = None
+        while events.get_into(self.event):
+            self._edge(self.event.pressed, self.event.timestamp)
+
+        now = ticks_ms()
+        if self.pressed_at is not None and not self.long_fired and not self.swallow:
+            decided_at = ticks_add(self.pressed_at, self.long_ms)
+            if ticks_diff(now, decided_at) >= 0:
+                self.long_fired = True
+                self._emit(LONG, decided_at)
+        if self.released_at is not None and self.pressed_at is None:
+            if ticks_diff(now, ticks_add(self.released_at, self.double_ms)) > 0:
+                self._emit(SHORT, self.released_at)
+                self.released_at = None
+
+    def poll(self):
+        # Returns the oldest gesture that's ready (SHORT, LONG or DOUBLE), or None.
+
+        self.update()
+        if not self.pending:
+            return None
+        gesture, edge_at = self.pending.pop(0)
+        latency = ticks_diff(ticks_ms(), edge_at)
+        self.latency_total += latency
+        if latency > self.latency_max:
+            self.latency_max = latency
+        return gesture
+
+    def waiting(self) -> bool:
+        # Whether keypad has edges queued that update() hasn't read yet.
+        return len(self.keys.events) > 0
+
+    def idle(self) -> bool:
+        # True when no gesture is in progress or waiting to be handed out, so nothing needs polling until a new press.
+
+        if self.resumed_at is not None and ticks_diff(ticks_ms(), self.resumed_at) < 100:
+            return False  # keypad may not have scanned the button since resume() yet
+        return self.pressed_at is None and self.released_at is None and not self.pending and not self.waiting()
+
+    def suspend(self):
+        # Releases the pin, e.g. so an alarm.pin.PinAlarm can wake the board from light sleep when it's pressed.
+        self.keys.deinit()
+
+    def resume(self, pressed=False):
+        # Starts scanning again after suspend(). A button that's already down shows up as a fresh press.
+        # pressed (bool) - default: False - True if the button is what ended the suspend, so idle() waits for keypad
+
+        self.keys = keypad.Keys((self.pin,), value_when_pressed=self.value_when_pressed, pull=self.pull)
+        self.resumed_at = ticks_ms() if pressed else None
+
+    def report(self) -> str:
+        handled = self.counts[SHORT] + self.counts[LONG] + self.counts[DOUBLE] - len(self.pending)
+        average = self.latency_total / handled if handled else 0
+        return (f"Buttons: {self.counts[SHORT]} short, {self.counts[LONG]} long, {self.counts[DOUBLE]} double, "
+                f"latency avg {average:.1f} ms / max {self.latency_max} ms, {self.dropped} overflows")
+
+    def deinit(self):
+        self.keys.deinit()
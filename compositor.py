@@ -0,0 +1,95 @@
+# Every rectangle sent to the ST7735R costs a column address, row address and memory write command (11 bytes) on
+# top of the pixel data itself, at 2 bytes per pixel in RGB565
+RECT_OVERHEAD = 11
+BYTES_PER_PIXEL = 2
+
+
+def rect_cost(rect: tuple) -> int:
+    # Bytes it takes to send one (x1, y1, x2, y2) rectangle over SPI
+    return (rect[2] - rect[0]) * (rect[3] - rect[1]) * BYTES_PER_PIXEL + RECT_OVERHEAD
+
+
+def merge_rects(rects: list) -> list:
+    # Merges rectangles that overlap or touch, as long as sending their bounding box costs no more than sending
+    # them apart. Returns a new list of (x1, y1, x2, y2) tuples.
+
+    merged = list(rects)
+    changed = True
+    while changed:
+        changed = False
+        for i in range(len(merged)):
+            a = merged[i]
+            for j in range(i + 1, len(merged)):
+                b = merged[j]
+                if a[0] > b[2] or b[0] > a[2] or a[1] > b[3] or b[1] > a[3]:
+                    continue  # Neither overlapping nor touching
+                union = (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+                if rect_cost(union) <= rect_cost(a) + rect_cost(b):
+                    merged[i] = union
+                    merged.pop(j)
+                    changed = True
+                    break
+            if changed:
+                break
+    return merged
+
+
+class Compositor:
+    # Partial-refresh render mode. displayio's auto refresh pushes changes out whenever it gets a chance, so one
+    # countdown update can go over SPI in several pieces, mid-way through a tick. With the compositor the display
+    # only refreshes once per tick, and only if something was marked dirty during it.
+    # Everything that changes the screen has to be marked (ViewModel does this for bound labels), otherwise it only
+    # shows up with the next refresh. Bytes per frame are worked out from the merged dirty rectangles.
+    # refresh() gets no target frame rate: the scheduler already paces the ticks, and with one displayio drops any
+    # frame that comes more than a frame period after the previous call, which is most of them when only some ticks
+    # change the screen.
+
+    def __init__(self, display):
+        # display (ST7735R) - the display to take over from auto refresh
+
+        self.display = display
+        self.dirty: list = []
+        self.frames: int = 0
+        self.idle: int = 0  # Ticks with nothing to refresh
+        self.last_bytes: int = 0
+        self.max_bytes: int = 0
+        self.total_bytes: int = 0
+        display.auto_refresh = False
+
+    def mark(self, x: int, y: int, width: int, height: int):
+        # Marks a screen area (in pixels) as changed since the last frame.
+
+        x2 = min(self.display.width, x + width)
+        y2 = min(self.display.height, y + height)
+        x = max(0, x)
+        y = max(0, y)
+        if x2 > x and y2 > y:
+            self.dirty.append((x, y, x2, y2))
+
+    def mark_all(self):
+        self.dirty = [(0, 0, self.display.width, self.display.height)]
+
+    def tick(self) -> int:
+        # Refreshes the display once if anything changed. Returns the bytes the frame took, 0 if it was skipped.
+
+        if not self.dirty:
+            self.idle += 1
+            return 0
+        if not self.display.refresh():
+            return 0  # Not sent, the dirty areas are tried again next tick
+        size = 0
+        for rect in merge_rects(self.dirty):
+            size += rect_cost(rect)
+        self.dirty = []
+
+        self.frames += 1
+        self.last_bytes = size
+        self.total_bytes += size
+        if size > self.max_bytes:
+            self.max_bytes = size
+        return size
+
+    def report(self) -> str:
+        average = self.total_bytes / self.frames if self.frames else 0
+        return (f"Compositor: {self.frames} frames, {self.idle} idle ticks, "
+                f"{average:.0f} bytes/frame on average, {self.max_bytes} max")
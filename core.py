@@ -0,0 +1,295 @@
+try:
+    from board_definitions.raspberry_pi_pico_w import GP10, GP11, GP16, GP17, GP18, GP0, LED
+except ImportError:  # pragma: no cover
+    # noinspection PyPackageRequirements
+    from board import GP10, GP11, GP16, GP17, GP18, GP0, LED
+from busio import SPI
+from digitalio import DigitalInOut, Direction
+import gc
+from time import monotonic_ns
+
+from displayio import release_displays
+from fourwire import FourWire
+from adafruit_st7735r import ST7735R
+
+# noinspection PyPackageRequirements
+from wifi import radio
+from os import getenv
+
+from adafruit_ticks import ticks_ms
+
+try:
+    import asyncio
+except ImportError:  # pragma: no cover
+    # Without the asyncio library the blocking run_loop() is used instead
+    asyncio = None
+
+import modes
+from buttons import ButtonEvents, DOUBLE
+from compositor import Compositor
+from http_cache import HttpCache
+from metrics import Metrics
+from net_supervisor import NetSupervisor
+from power import PowerManager
+from scheduler import Scheduler
+from timesource import TimeSource
+from timezones import TimeZone
+
+
+class PicoCore:
+    # Everything the screen modes share: the display, LED, button, Wi-Fi, HTTP session, NTP-disciplined clock and the
+    # scheduler. It's set up once at power-on and stays up while modes come and go, so switching modes never
+    # reinitializes the display or drops the Wi-Fi link. Only the active mode's module is imported (see modes/).
+    # A double press of the button moves on to the next mode; other presses go to the mode itself.
+    # With POWER = "low" in settings.toml it runs on battery: radio off between fetches, light sleep between ticks.
+    # With METRICS = "on" it keeps histograms of its timings (see metrics.py) and prints them with the other reports.
+
+    def __init__(self):
+        self.started = ticks_ms()
+        mosi_pin = GP11
+        clk_pin = GP10
+        reset_pin = GP17
+        cs_pin = GP18
+        dc_pin = GP16
+        release_displays()
+        spi = SPI(clock=clk_pin, MOSI=mosi_pin)
+        display_bus = FourWire(spi, command=dc_pin, chip_select=cs_pin, reset=reset_pin)
+        self.display = ST7735R(display_bus, width=128, height=160, bgr=True)
+        self.compositor = Compositor(self.display)
+        self.led = DigitalInOut(LED)
+        self.led.direction = Direction.OUTPUT
+        self.buttons = ButtonEvents(GP0)
+        self.metrics = Metrics(enabled=getenv("METRICS") == "on")
+        self.net = NetSupervisor(radio, getenv("WIFI"), getenv("PASS"), metrics=self.metrics)
+        self.pool = self.net.pool
+        self.requests = self.net.session
+        self.http = HttpCache(self.requests)
+        self.clock = TimeSource(self.pool, timeout=self.net.timeout)
+        self.power = PowerManager(self.net, low_power=getenv("POWER") == "low")
+        self.tz = TimeZone(getenv("TIMEZONE") or "America/Chicago")
+        self.drive: str = "/"  # Root of the CIRCUITPY drive, for files the modes keep
+        self.scheduler = Scheduler()
+        self.button_task = None
+        self.mode = None
+        self.mode_name: str = ""
+        self.next_mode = None  # Mode to switch to once the current scheduler run ends
+        self.refresh_event = None  # asyncio.Event in run_async(), None in the blocking loop
+        self.switches: int = 0
+
+    def led_toggle(self, toggle: bool):
+        self.led.value = toggle
+
+    # noinspection PyUnresolvedReferences
+    def manage_memory(self, verbose=False):
+        # Memory cleanup.
+        # verbose (bool) - default: False - Self-explanatory
+
+        old_memory_available = gc.mem_free()
+        if self.metrics.enabled:
+            start = monotonic_ns()
+            gc.collect()
+            self.metrics.since("gc", start)
+        else:
+            gc.collect()
+        new_memory_available = gc.mem_free()
+        self.metrics.record("heap", new_memory_available)
+        if verbose:
+            print(f"Memory cleaned: {old_memory_available} -> {new_memory_available} bytes free")
+        return old_memory_available, new_memory_available
+
+    def wifi_connect(self) -> bool:
+        # Tries to join Wi-Fi if the link is down, without waiting: after a failure the next try is left to the
+        # supervisor's backoff, and the modes keep showing what they have in the meantime.
+        return self.net.connect()
+
+    def utc_now(self) -> int:
+        # The RTC keeps UTC (set from NTP by the time source), read as epoch seconds.
+        return self.clock.now()
+
+    def keep_time(self):
+        # Resyncs the RTC with NTP whenever the time source says it's due.
+
+        if self.clock.due(self.utc_now()) and self.net.online():
+            self.clock.sync()
+            print(self.clock.report())
+
+    def present(self):
+        # Sends the changes marked since the last call to the screen in one refresh.
+
+        if not self.metrics.enabled:
+            self.compositor.tick()
+            return
+        start = monotonic_ns()
+        self.compositor.tick()
+        self.metrics.since("render", start)
+
+    def network_due(self) -> bool:
+        # Whether this pass has anything to do on the network: an NTP resync or a fetch for the mode.
+        return self.clock.due(self.utc_now()) or self.mode.needs_network()
+
+    def refresh_wait(self) -> float:
+        # Seconds until the next refresh: whatever the mode needs, or sooner for an NTP resync. While reconnecting
+        # it's sooner still, following the backoff. In low power mode the radio is off on purpose between fetches,
+        # so only a failed connection attempt counts as reconnecting.
+
+        wait = self.mode.refresh_wait()
+        reconnecting = self.net.failed_connects > 0 if self.power.low_power else not self.net.online()
+        if reconnecting:
+            return min(wait, max(1, self.net.retry_in()))
+        return min(wait, max(1, self.clock.sync_in(self.utc_now())))
+
+    def switch(self, name: str):
+        # Replaces the mode on screen. The old mode's module is dropped before the new one is imported, so only one
+        # of them takes up RAM at a time.
+        # name (str) - a key of modes.MODES
+
+        if self.mode is not None:
+            self.mode.stop()
+            self.mode = None
+            # The finished scheduler's tasks still hold the old mode's methods, which would keep it in RAM
+            self.scheduler = Scheduler(idle=self.idle, metrics=self.metrics)
+            modes.unload()
+        free_before = self.manage_memory()[1]
+
+        self.mode = modes.load(name)(self)
+        self.mode_name = name
+        self.next_mode = None
+        self.switches += 1
+        self.display.root_group = self.mode.start()
+        self.compositor.mark_all()
+        self.present()
+        print(f"Switched to {name} mode, {free_before - self.manage_memory()[1]} bytes of RAM in use by it")
+
+    def request_mode(self, name: str):
+        # Switches modes as soon as the current scheduler run ends, so no task of the old mode runs afterwards.
+
+        self.next_mode = name
+        self.scheduler.stop()
+
+    def request_refresh(self):
+        # Lets the mode fetch or redo its data right away instead of waiting out its refresh interval.
+
+        if self.refresh_event is not None:
+            self.refresh_event.set()
+        else:
+            self.scheduler.stop()
+
+    def button_tick(self):
+        gesture = self.buttons.poll()
+        if gesture == DOUBLE:
+            print("Button pressed twice, moving on to the next mode")
+            self.request_mode(modes.after(self.mode_name))
+        elif gesture is not None and self.mode.on_button(gesture):
+            self.request_refresh()
+
+        if self.power.low_power and self.buttons.idle():
+            # Nothing to time until the next press, which idle() notices, so stop polling and let the board sleep
+            self.scheduler.reschedule(self.button_task, 3600)
+
+    def idle(self, seconds: float):
+        # The scheduler's wait between deadlines, in light sleep if the power manager allows it. A press during the
+        # wait brings the button polls back right away.
+
+        if self.power.sleep(seconds, self.buttons) or self.buttons.waiting():
+            self.scheduler.reschedule(self.button_task, 0)
+
+    def schedule(self, button_interval=0.05):
+        # A fresh scheduler with the button and the current mode's tasks.
+        # button_interval (float) - default: 0.05 - interval (in seconds) between button polls
+
+        self.scheduler = Scheduler(idle=self.idle, metrics=self.metrics)
+        self.button_task = self.scheduler.every("button", button_interval, self.button_tick)
+        if self.metrics.enabled:
+            # Typing "m" into the serial console prints the metrics; only polled while they're being collected
+            self.scheduler.every("serial", 0.5, self.metrics.poll_serial)
+        self.mode.schedule(self.scheduler)
+        return self.scheduler
+
+    def report(self):
+        print(self.mode.report())
+        print(self.compositor.report())
+        print(self.buttons.report())
+        print(self.net.report())
+        print(self.power.report())
+        print(self.scheduler.report())
+        if self.metrics.enabled:
+            print(self.metrics.report())
+
+    def cycle(self, duration: float):
+        # One pass of the blocking loop: reconnects if needed, keeps the time, lets the mode refresh its data, then
+        # renders and handles the button for duration seconds (or until a button press cuts it short).
+        # In low power mode the radio only comes on when there's something to fetch, and goes off again right after.
+
+        if not self.power.low_power or self.network_due():
+            self.wifi_connect()
+        self.keep_time()
+        self.mode.refresh()
+        self.power.radio_off()
+        scheduler = self.schedule()
+        scheduler.after("refresh", duration, scheduler.stop)
+        scheduler.run()
+        self.report()
+        if self.next_mode is not None:
+            self.switch(self.next_mode)
+
+    def run_loop(self, name: str):
+        # The main setup + loop, without asyncio. The display pauses while data is downloaded.
+        # name (str) - the mode to start in
+
+        self.led_toggle(False)
+        self.switch(name)
+        self.wifi_connect()
+        self.keep_time()
+        while True:
+            self.cycle(self.refresh_wait())
+            self.manage_memory(verbose=False)
+
+    async def render_loop(self):
+        # Runs the scheduler, switching modes in between runs whenever one was requested.
+
+        while True:
+            await self.schedule().run_async()
+            if self.next_mode is not None:
+                self.report()
+                self.switch(self.next_mode)
+                self.refresh_event.set()
+
+    async def refresh_loop(self):
+        # Keeps the time and lets the mode refresh when it needs to (see refresh_wait()), or right away when asked to.
+
+        while True:
+            # Joining Wi-Fi, the NTP query and (inside the fetch) the TLS handshake each block until they're done, so
+            # control goes back to the render loop in between, letting a due tick draw before the next one starts
+            self.wifi_connect()
+            await asyncio.sleep(0)
+            self.keep_time()
+            await asyncio.sleep(0)
+            await self.mode.refresh_async()
+            self.manage_memory(verbose=False)
+
+            try:
+                await asyncio.wait_for(self.refresh_event.wait(), self.refresh_wait())
+            except asyncio.TimeoutError:
+                pass
+            self.refresh_event.clear()
+            self.report()
+
+    async def main_async(self, name: str):
+        self.refresh_event = asyncio.Event()
+        self.switch(name)
+
+        # Rendering starts right away so the screen keeps moving while Wi-Fi and the first fetch happen
+        render_task = asyncio.create_task(self.render_loop())
+        await asyncio.sleep(0)
+        await asyncio.gather(render_task, self.refresh_loop())
+
+    def run(self, name: str):
+        # Runs a mode forever, with the display ticking during network requests if asyncio is available.
+        # Light sleep needs the blocking loop, so low power mode always uses that one.
+        # name (str) - the mode to start in, a key of modes.MODES
+
+        if asyncio is None or self.power.low_power:
+            self.run_loop(name)
+        else:
+            self.led_toggle(False)
+            asyncio.run(self.main_async(name))
@@ -0,0 +1,49 @@
+# "00" to "59", built once so formatting never has to create digit strings
+_TWO_DIGITS = tuple(f"{value:02}" for value in range(60))
+
+
+class CountdownFormatter:
+    # Turns the seconds left until T-0 into the countdown text ("12 Days", "5:04:09", "04:09" or "00:00").
+    # The display ticks five times a second but the text only changes once a second, so the last result is handed
+    # back unchanged until the second moves on. The "H:MM:" part is kept between calls as well, so a new second
+    # costs a single string concatenation and nothing else is allocated.
+
+    def __init__(self):
+        self.last_seconds = None
+        self.last_minutes = None
+        self.prefix = ""
+        self.text = ""
+        self.calls: int = 0
+        self.builds: int = 0  # Calls that had to build a new string
+
+    def format(self, total_seconds: int) -> str:
+        # total_seconds (int) - seconds left until T-0, negative once it has passed
+
+        self.calls += 1
+        if total_seconds < 0:
+            total_seconds = 0
+        if total_seconds == self.last_seconds:
+            return self.text
+        self.last_seconds = total_seconds
+
+        hours = total_seconds // 3600
+        if hours >= 100:
+            days = total_seconds // 86400
+            if self.last_minutes != -days:  # Negative so it can't clash with a minute count
+                self.last_minutes = -days
+                self.text = f"{days} Days"
+                self.builds += 1
+        elif total_seconds == 0:
+            self.last_minutes = None
+            self.text = "00:00"
+        else:
+            minutes = total_seconds // 60
+            if minutes != self.last_minutes:
+                self.last_minutes = minutes
+                if hours == 0:
+                    self.prefix = _TWO_DIGITS[minutes] + ":"
+                else:
+                    self.prefix = f"{hours}:{_TWO_DIGITS[minutes % 60]}:"
+            self.text = self.prefix + _TWO_DIGITS[total_seconds % 60]
+            self.builds += 1
+        return self.text
@@ -0,0 +1,120 @@
+import struct
+
+from launches import make_record
+
+# File layout: header, then for every launch its T-0 epoch followed by its strings, each prefixed with its length
+# PLT1 records still held the T-0 text and PLT2 records an unused UTC delta, they fail to load and get replaced by the
+# next fetch
+_MAGIC = b"PLT3"
+_HEADER = "<4sIB"  # magic, fetch time (epoch seconds), number of launches
+_EPOCH = "<I"
+_STRINGS = 5  # name, vehicle, pad, location, country
+_FETCHED_AT = slice(4, 8)  # Where the fetch time sits inside the header
+
+
+def pack(fetched_at: int, entries: list) -> bytes:
+    data = bytearray(struct.pack(_HEADER, _MAGIC, fetched_at, len(entries)))
+    for entry in entries:
+        data.extend(struct.pack(_EPOCH, entry[0]))
+        for text in entry[1:]:
+            encoded = str(text).encode("utf-8")[:255]
+            data.append(len(encoded))
+            data.extend(encoded)
+    return bytes(data)
+
+
+def unpack(data: bytes):
+    # Returns (fetched_at, entries), raising ValueError if the data isn't a valid record.
+
+    if len(data) < struct.calcsize(_HEADER):
+        raise ValueError("Cache record too short")
+    magic, fetched_at, count = struct.unpack_from(_HEADER, data, 0)
+    if magic != _MAGIC:
+        raise ValueError("Not a launch cache record")
+    offset = struct.calcsize(_HEADER)
+    entries = []
+    strings = {}
+    for _ in range(count):
+        if offset + 4 > len(data):
+            raise ValueError("Cache record truncated")
+        entry = [struct.unpack_from(_EPOCH, data, offset)[0]]
+        offset += 4
+        for _ in range(_STRINGS):
+            if offset >= len(data) or offset + 1 + data[offset] > len(data):
+                raise ValueError("Cache record truncated")
+            length = data[offset]
+            entry.append(bytes(data[offset + 1:offset + 1 + length]).decode("utf-8"))
+            offset += 1 + length
+        entries.append(make_record(strings, *entry))
+    return fetched_at, entries
+
+
+def _same_launches(a: bytes, b: bytes) -> bool:
+    # True if two records only differ in their fetch time.
+    return a[:_FETCHED_AT.start] == b[:_FETCHED_AT.start] and a[_FETCHED_AT.stop:] == b[_FETCHED_AT.stop:]
+
+
+class FlashCache:
+    # Keeps the last good launch queue and its fetch time in a small binary file on CIRCUITPY so the countdown can be
+    # drawn straight after a reset, before Wi-Fi or any API has answered.
+    # Flash only survives so many erase cycles, so new records are written at most once every min_interval seconds,
+    # and a record whose launches didn't change (only the fetch time did) waits for max_interval instead.
+    # A record held back by those limits is simply replaced by the next save().
+    # The drive is only writable from code when boot.py remounts it, otherwise saving quietly turns itself off.
+
+    def __init__(self, path="/launch_cache.bin", min_interval=900, max_interval=21600):
+        # path (str) - default: "/launch_cache.bin" - file on the CIRCUITPY drive
+        # min_interval (int) - default: 900 - minimum time (in seconds) between two writes
+        # max_interval (int) - default: 21600 - time (in seconds) before an unchanged record gets a new fetch time
+
+        self.path = path
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.written = None  # Bytes currently in flash
+        self.last_write = None
+        self.writes: int = 0
+        self.enabled: bool = True
+
+    def load(self):
+        # Returns (fetched_at, entries) from flash, or None if there's no usable record.
+
+        try:
+            with open(self.path, "rb") as file:
+                data = file.read()
+            record = unpack(data)
+        except (OSError, ValueError, UnicodeError) as error:
+            print(f"No launch cache loaded from {self.path}: {error}")
+            return None
+        self.written = data
+        # The record was written right after its fetch, so the write limits carry on across the reset
+        self.last_write = record[0]
+        return record
+
+    def save(self, fetched_at: int, entries: list, now: int) -> bool:
+        # Stores a new record, subject to the write limit. Returns True if flash was actually written.
+        # now (int) - current UTC time in epoch seconds
+
+        if not self.enabled:
+            return False
+        data = pack(fetched_at, entries)
+        if data == self.written:
+            return False
+        if self.last_write is not None:
+            age = now - self.last_write
+            if age < self.min_interval:
+                return False
+            if age < self.max_interval and self.written is not None and _same_launches(data, self.written):
+                return False
+
+        try:
+            with open(self.path, "wb") as file:
+                file.write(data)
+        except OSError as error:
+            # Usually a read-only filesystem (errno 30) because boot.py didn't remount the drive
+            print(f"Launch cache disabled, can't write {self.path}: {error}")
+            self.enabled = False
+            return False
+        self.written = data
+        self.last_write = now
+        self.writes += 1
+        return True
@@ -0,0 +1,140 @@
+from displayio import Bitmap, Palette, TileGrid
+
+
+def _pixel(glyph, x: int, y: int) -> int:
+    # 1 if the glyph has ink at (x, y), 0 outside of it. Builtin fonts keep every glyph side by side in one bitmap.
+    if x < 0 or y < 0 or x >= glyph.width or y >= glyph.height:
+        return 0
+    return 1 if glyph.bitmap[glyph.tile_index * glyph.width + x, y] else 0
+
+
+def _scale2x(glyph, x: int, y: int) -> tuple:
+    # EPX/Scale2x: the 2x2 block for one source pixel, rounding off diagonal steps instead of doubling them
+    p = _pixel(glyph, x, y)
+    a = _pixel(glyph, x, y - 1)
+    b = _pixel(glyph, x + 1, y)
+    c = _pixel(glyph, x - 1, y)
+    d = _pixel(glyph, x, y + 1)
+    return (a if c == a and c != d and a != b else p,
+            b if a == b and a != c and b != d else p,
+            c if d == c and d != b and c != a else p,
+            d if b == d and b != a and d != c else p)
+
+
+def _scale3x(glyph, x: int, y: int) -> tuple:
+    # AdvMAME3x/Scale3x: the 3x3 block for one source pixel
+    a = _pixel(glyph, x - 1, y - 1)
+    b = _pixel(glyph, x, y - 1)
+    c = _pixel(glyph, x + 1, y - 1)
+    d = _pixel(glyph, x - 1, y)
+    e = _pixel(glyph, x, y)
+    f = _pixel(glyph, x + 1, y)
+    g = _pixel(glyph, x - 1, y + 1)
+    h = _pixel(glyph, x, y + 1)
+    i = _pixel(glyph, x + 1, y + 1)
+    if b == h or d == f:
+        return e, e, e, e, e, e, e, e, e
+    return (d if d == b else e,
+            b if (d == b and e != c) or (b == f and e != a) else e,
+            f if b == f else e,
+            d if (d == b and e != g) or (d == h and e != a) else e,
+            e,
+            f if (b == f and e != i) or (h == f and e != c) else e,
+            d if d == h else e,
+            h if (d == h and e != i) or (h == f and e != g) else e,
+            f if h == f else e)
+
+
+class GlyphAtlas:
+    # Renders a fixed set of characters once, already scaled up, into one shared 2-color Bitmap, one tile per
+    # character. Text drawn from it is a TileGrid whose tile indexes change, so a new digit costs a single index write
+    # instead of a label rebuild. Scale 2 and 3 are smoothed (Scale2x/Scale3x) instead of showing the font's blocky
+    # doubled pixels. Building the atlas takes a moment at startup; at scale 2, 20 characters are under 1 KB of RAM.
+
+    def __init__(self, font, chars: str, scale=2, smooth=True):
+        # font - a fixed-width font such as terminalio.FONT
+        # chars (str) - every character the text will ever need, a space is added for blank cells
+        # scale (int) - default: 2 - size of each font pixel on screen
+        # smooth (bool) - default: True - smooth diagonals at scale 2 and 3
+
+        self.chars = " "
+        for char in chars:
+            if char not in self.chars:
+                self.chars += char
+        self.index: dict = {}
+        for i in range(len(self.chars)):
+            self.index[self.chars[i]] = i
+        width, height = font.get_bounding_box()[:2]
+        self.scale = scale
+        self.tile_width = width * scale
+        self.tile_height = height * scale
+        self.bitmap = Bitmap(self.tile_width * len(self.chars), self.tile_height, 2)
+
+        smoother = None
+        if smooth and scale == 2:
+            smoother = _scale2x
+        elif smooth and scale == 3:
+            smoother = _scale3x
+        for i in range(1, len(self.chars)):
+            self._render(font.get_glyph(ord(self.chars[i])), i * self.tile_width, smoother)
+
+    def _render(self, glyph, left: int, smoother):
+        if glyph is None:
+            return  # Not in the font, stays blank
+        scale = self.scale
+        for y in range(min(glyph.height, self.tile_height // scale)):
+            for x in range(min(glyph.width, self.tile_width // scale)):
+                if smoother is None:
+                    block = (_pixel(glyph, x, y),) * (scale * scale)
+                else:
+                    block = smoother(glyph, x, y)
+                for k in range(scale * scale):
+                    if block[k]:
+                        self.bitmap[left + x * scale + k % scale, y * scale + k // scale] = 1
+
+    def tile(self, char: str) -> int:
+        # Tile index for a character, blank for anything that isn't in the atlas
+        return self.index.get(char, 0)
+
+
+class GlyphText:
+    # A line of text drawn from a GlyphAtlas: one TileGrid, one tile per character cell. Setting .text writes only the
+    # tile indexes that changed, so it works as a ViewModel target, and marks just those cells dirty on a Compositor.
+
+    def __init__(self, atlas: GlyphAtlas, cells: int, color=0xFFFFFF, x=0, y=0, compositor=None):
+        # atlas (GlyphAtlas) - the pre-rendered characters to draw with
+        # cells (int) - longest text that will be shown, anything past it is cut off
+        # color - text color, the rest of each cell is transparent
+        # x, y (ints) - defaults: 0, 0 - top left corner on screen, so add it to a group at (0, 0) like the splash
+        # compositor (Compositor) - default: None - marks changed cells dirty when set
+
+        self.atlas = atlas
+        self.compositor = compositor
+        palette = Palette(2)
+        palette[0] = 0x000000
+        palette[1] = color
+        palette.make_transparent(0)
+        self.grid = TileGrid(atlas.bitmap, pixel_shader=palette, width=cells, height=1,
+                             tile_width=atlas.tile_width, tile_height=atlas.tile_height, default_tile=0, x=x, y=y)
+        self.tiles = bytearray(cells)
+        self.shown: str = ""
+        self.tile_writes: int = 0
+
+    @property
+    def text(self) -> str:
+        return self.shown
+
+    @text.setter
+    def text(self, value: str):
+        atlas = self.atlas
+        for i in range(len(self.tiles)):
+            tile = atlas.tile(value[i]) if i < len(value) else 0
+            if tile == self.tiles[i]:
+                continue
+            self.tiles[i] = tile
+            self.grid[i] = tile
+            self.tile_writes += 1
+            if self.compositor is not None:
+                self.compositor.mark(self.grid.x + i * atlas.tile_width, self.grid.y,
+                                     atlas.tile_width, atlas.tile_height)
+        self.shown = value
@@ -0,0 +1,169 @@
+from adafruit_ticks import ticks_ms, ticks_add, ticks_diff
+
+# adafruit_ticks can only compare times up to about 3 days apart, so longer max-age values are cut down to this
+_MAX_AGE_LIMIT = 86400
+
+
+def _header(headers: dict, name: str):
+    # Case-insensitive lookup, since servers don't agree on header capitalisation.
+    # name (str) - lowercase header name
+
+    for key in headers:
+        if key.lower() == name:
+            return headers[key]
+    return None
+
+
+def _max_age(cache_control) -> int:
+    # Seconds the response may be reused without asking the server again, 0 if it can't be reused at all.
+
+    if not cache_control:
+        return 0
+    max_age = 0
+    for directive in cache_control.split(","):
+        directive = directive.strip().lower()
+        if directive in ("no-cache", "no-store"):
+            return 0
+        if directive.startswith("max-age="):
+            try:
+                max_age = int(directive[8:])
+            except ValueError:
+                return 0
+    return min(max_age, _MAX_AGE_LIMIT)
+
+
+class CacheEntry:
+    def __init__(self):
+        self.etag = None
+        self.last_modified = None
+        self.expires = None  # ticks_ms deadline of the max-age window, None once it no longer applies
+        self.value = None
+
+
+class HttpCache:
+    # Wraps an adafruit_requests Session with conditional GETs. The ETag/Last-Modified validators of each URL are
+    # sent back as If-None-Match/If-Modified-Since, and a 304 reuses the value parsed from the last full response.
+    # Within a Cache-Control max-age window the request is skipped altogether.
+
+    def __init__(self, session):
+        self.session = session
+        self.entries: dict = {}
+        self.hits: int = 0  # Answered from the cache without any network traffic
+        self.revalidated: int = 0  # 304 Not Modified, the server only confirmed the cached value
+        self.misses: int = 0  # Full responses that had to be downloaded and parsed
+        self.errors: int = 0  # Error responses (e.g. a 502 page from a proxy), never parsed
+
+    def _fresh(self, url: str):
+        # Returns the cached value if it's still inside its max-age window, or None.
+
+        entry = self.entries.get(url)
+        if entry is None or entry.value is None or entry.expires is None:
+            return None
+        if ticks_diff(entry.expires, ticks_ms()) <= 0:
+            entry.expires = None
+            return None
+        return entry.value
+
+    def revalidate(self, url: str):
+        # Ends the max-age window of a URL, so the next get() asks the server (still conditionally).
+
+        entry = self.entries.get(url)
+        if entry is not None:
+            entry.expires = None
+
+    def _request(self, url: str, timeout):
+        entry = self.entries.get(url)
+        headers = {}
+        if entry is not None and entry.value is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return self.session.get(url, headers=headers, timeout=timeout)
+
+    def _not_modified(self, url: str, response) -> bool:
+        entry = self.entries.get(url)
+        if response.status_code != 304 or entry is None or entry.value is None:
+            return False
+        self.revalidated += 1
+        self._remember(entry, response.headers)
+        return True
+
+    def _check_status(self, url: str, response):
+        # Whatever an error page holds, it isn't the data parse() expects. Raising (rather than returning None) lets
+        # NetSupervisor count the request as failed.
+
+        if response.status_code != 200:
+            self.errors += 1
+            raise RuntimeError(f"HTTP {response.status_code} from {url}")
+
+    def _store(self, url: str, response, value):
+        self.misses += 1
+        if not value:
+            # Nothing worth keeping, so there's nothing for a later 304 to bring back either
+            self.entries.pop(url, None)
+            return
+        entry = self.entries.get(url)
+        if entry is None:
+            entry = CacheEntry()
+            self.entries[url] = entry
+        entry.etag = _header(response.headers, "etag")
+        entry.last_modified = _header(response.headers, "last-modified")
+        entry.value = value
+        self._remember(entry, response.headers)
+
+    @staticmethod
+    def _remember(entry: CacheEntry, headers: dict):
+        max_age = _max_age(_header(headers, "cache-control"))
+        entry.expires = ticks_add(ticks_ms(), max_age * 1000) if max_age else None
+
+    def get(self, url: str, parse, timeout=60):
+        # Returns parse(response) for url, reusing the last parsed value whenever the server allows it.
+        # url (str) - address to GET
+        # parse (function) - turns a 200 response into the value to cache, the response is closed afterwards.
+        #                    Other responses (errors, or a 304 with nothing cached) aren't parsed and raise
+        #                    RuntimeError. An empty value (None, []) is returned but not cached.
+        # timeout (float) - default: 60 - socket timeout (in seconds) handed to adafruit_requests
+
+        value = self._fresh(url)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        response = self._request(url, timeout)
+        try:
+            if self._not_modified(url, response):
+                return self.entries[url].value
+            self._check_status(url, response)
+            value = parse(response)
+        finally:
+            response.close()
+        self._store(url, response, value)
+        return value
+
+    async def get_async(self, url: str, parse, timeout=60):
+        # Same as get(), with parse being a coroutine function so it can yield while reading the body. Connecting
+        # and the TLS handshake still block, so it yields right before and after them as well.
+        import asyncio
+
+        value = self._fresh(url)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        await asyncio.sleep(0)
+        response = self._request(url, timeout)
+        await asyncio.sleep(0)
+        try:
+            if self._not_modified(url, response):
+                return self.entries[url].value
+            self._check_status(url, response)
+            value = await parse(response)
+        finally:
+            response.close()
+        self._store(url, response, value)
+        return value
+
+    def report(self) -> str:
+        return (f"HTTP cache: {self.hits} hits, {self.revalidated} revalidated (304), {self.misses} misses, "
+                f"{self.errors} errors")
@@ -0,0 +1,248 @@
+_QUOTE = ord('"')
+_BACKSLASH = ord("\\")
+_OPEN_OBJECT = ord("{")
+_CLOSE_OBJECT = ord("}")
+_OPEN_ARRAY = ord("[")
+_CLOSE_ARRAY = ord("]")
+_COLON = ord(":")
+_COMMA = ord(",")
+_WHITESPACE = b" \t\r\n"
+_ESCAPES = {ord("n"): b"\n", ord("t"): b"\t", ord("r"): b"\r", ord("b"): b"\b", ord("f"): b"\f"}
+_REPLACEMENT = "\ufffd".encode("utf-8")  # Stands in for a surrogate escape that isn't half of a pair
+
+
+class JsonExtractor:
+    # Pulls a few fields out of the records of a top-level JSON array without ever building the whole document.
+    # The response is fed in small chunks straight from the socket, and only the wanted values are kept, so peak
+    # memory depends on max_records and max_string rather than on the size of the payload.
+    #
+    # Example: JsonExtractor("result", {"vehicle": ("vehicle", "name")}) turns
+    # {"result": [{"vehicle": {"name": "Falcon 9", ...}, ...}]} into [{"vehicle": "Falcon 9"}]
+
+    def __init__(self, array_key: str, fields: dict, max_records=1, max_string=64):
+        # array_key (str) - key of the top-level array holding the records
+        # fields (dict) - output name -> tuple of keys leading to the value inside each record
+        # max_records (int) - default: 1 - extraction stops once this many records are complete
+        # max_string (int) - default: 64 - longer strings are cut to this many bytes
+
+        self.array_key = array_key
+        self.paths: dict = {}
+        for name, path in fields.items():
+            self.paths[tuple(path)] = name
+        self.max_records = max_records
+        self.max_string = max_string
+
+        self.records: list = []
+        self.record = None
+        self.done: bool = False
+        self.bytes_fed: int = 0
+        self.started: bool = False  # Whether the top-level object or array has opened
+
+        self.stack = bytearray()  # "{" or "[" for every open container
+        self.path: list = []  # The key or index inside each open container
+        self.expect_key: bool = False
+        self.in_string: bool = False
+        self.in_key: bool = False
+        self.in_scalar: bool = False
+        self.escape: bool = False
+        self.unicode: int = -1  # Hex digits still expected for a \uXXXX escape, -1 when not in one
+        self.unicode_value: int = 0
+        self.surrogate: int = 0  # A \uD800-\uDBFF escape waiting for the low surrogate that completes it
+        self.target = None  # Output name of the value being captured, if any
+        self.buffer = bytearray()
+
+    def _match(self):
+        # Returns the output name for the value starting at the current path, or None if it isn't wanted.
+
+        path = self.path
+        if self.record is None or len(path) < 3:
+            return None
+        return self.paths.get(tuple(path[2:]))
+
+    def _begin_value(self):
+        self.target = self._match()
+        self.buffer = bytearray()
+
+    def _append(self, data):
+        if self.surrogate:
+            # The high surrogate wasn't followed by a low one, and on its own it can't be encoded
+            self.surrogate = 0
+            self._append(_REPLACEMENT)
+        if self.target is None and not self.in_key:
+            return
+        room = self.max_string - len(self.buffer)
+        if room > 0:
+            self.buffer.extend(data[:room])
+
+    def _text(self) -> str:
+        data = self.buffer
+        # A cut in the middle of a multi-byte character would make decode() fail, so drop the partial character
+        end = len(data)
+        while end > 0 and data[end - 1] & 0xC0 == 0x80:
+            end -= 1
+        if end > 0 and data[end - 1] >= 0xC0:
+            lead = data[end - 1]
+            needed = 2 if lead < 0xE0 else 3 if lead < 0xF0 else 4
+            if len(data) - end + 1 < needed:
+                data = data[:end - 1]
+        return bytes(data).decode("utf-8")
+
+    def _store(self, value):
+        if self.target is not None:
+            self.record[self.target] = value
+        self.target = None
+
+    def _end_scalar(self):
+        self.in_scalar = False
+        if self.target is None:
+            return
+        raw = bytes(self.buffer)
+        if raw == b"null":
+            value = None
+        elif raw == b"true":
+            value = True
+        elif raw == b"false":
+            value = False
+        elif b"." in raw or b"e" in raw or b"E" in raw:
+            value = float(raw)
+        else:
+            value = int(raw)
+        self._store(value)
+
+    def _unicode(self, value: int):
+        # Appends the character of a \uXXXX escape. Characters outside the BMP (e.g. emoji) come as two escapes, a
+        # high and a low surrogate, which only make a code point that can be encoded once they're combined.
+
+        if 0xD800 <= value < 0xDC00:
+            self._append(b"")  # Replaces an earlier high surrogate that's still waiting
+            self.surrogate = value
+        elif 0xDC00 <= value < 0xE000:
+            if self.surrogate:
+                value = 0x10000 + ((self.surrogate - 0xD800) << 10) + (value - 0xDC00)
+                self.surrogate = 0
+                self._append(chr(value).encode("utf-8"))
+            else:
+                self._append(_REPLACEMENT)
+        else:
+            self._append(chr(value).encode("utf-8"))
+
+    def _end_string(self):
+        self.in_string = False
+        if self.in_key:
+            self.in_key = False
+            self.path[-1] = self._text()
+        else:
+            self._store(self._text() if self.target is not None else None)
+        self.buffer = bytearray()
+
+    def _open(self, kind: int):
+        # A record starts when an object opens directly inside the wanted array
+        if (kind == _OPEN_OBJECT and len(self.stack) == 2 and self.stack[1] == _OPEN_ARRAY
+                and self.path[0] == self.array_key and self.path[1] < self.max_records):
+            self.record = {}
+            for name in self.paths.values():
+                self.record[name] = None
+        self.target = None
+        self.stack.append(kind)
+        self.started = True
+        self.path.append(0 if kind == _OPEN_ARRAY else None)
+        self.expect_key = kind == _OPEN_OBJECT
+
+    def _close(self, kind: int):
+        # A close that doesn't match the open container means this isn't JSON, e.g. an HTML error page
+        opening = _OPEN_OBJECT if kind == _CLOSE_OBJECT else _OPEN_ARRAY
+        if self.stack[-1] != opening:
+            raise ValueError(f"Unexpected {chr(kind)} in JSON")
+        self.stack = self.stack[:-1]
+        self.path.pop()
+        if self.record is not None and len(self.stack) == 2:
+            self.records.append(self.record)
+            self.record = None
+            if len(self.records) >= self.max_records:
+                self.done = True
+
+    def feed(self, chunk) -> bool:
+        # Parses the next piece of the document. Returns True once max_records records are complete, after which
+        # the rest of the response doesn't need to be read. Raises ValueError on input that can't be JSON.
+
+        self.bytes_fed += len(chunk)
+        i = 0
+        n = len(chunk)
+        while i < n and not self.done:
+            c = chunk[i]
+            if self.in_string:
+                if self.unicode >= 0:
+                    self.unicode_value = self.unicode_value * 16 + int(chr(c), 16)
+                    self.unicode -= 1
+                    if self.unicode == 0:
+                        self._unicode(self.unicode_value)
+                        self.unicode = -1
+                elif self.escape:
+                    self.escape = False
+                    if c == ord("u"):
+                        self.unicode = 4
+                        self.unicode_value = 0
+                    else:
+                        self._append(_ESCAPES.get(c, bytes((c,))))
+                elif c == _QUOTE:
+                    if self.surrogate:
+                        self._append(b"")
+                    self._end_string()
+                elif c == _BACKSLASH:
+                    self.escape = True
+                else:
+                    # Jump straight to the next quote or backslash instead of looking at every byte
+                    end = chunk.find(b'"', i)
+                    slash = chunk.find(b"\\", i, end if end >= 0 else n)
+                    if slash >= 0:
+                        end = slash
+                    elif end < 0:
+                        end = n
+                    self._append(chunk[i:end])
+                    i = end
+                    continue
+            elif self.in_scalar and c not in b",}] \t\r\n":
+                self._append(chunk[i:i + 1])
+            else:
+                if self.in_scalar:
+                    self._end_scalar()
+                if c in _WHITESPACE:
+                    pass
+                elif not self.stack and c != _OPEN_OBJECT and c != _OPEN_ARRAY:
+                    # Outside the top-level object or array, e.g. the "<html>" of an error or captive portal page
+                    raise ValueError(f"Unexpected {chr(c)} in JSON")
+                elif c == _QUOTE:
+                    self.in_string = True
+                    if self.expect_key:
+                        self.in_key = True
+                        self.expect_key = False
+                        self.buffer = bytearray()
+                    else:
+                        self._begin_value()
+                elif c == _COLON:
+                    self.expect_key = False
+                elif c == _COMMA:
+                    if self.stack[-1] == _OPEN_ARRAY:
+                        self.path[-1] += 1
+                    else:
+                        self.expect_key = True
+                elif c == _OPEN_OBJECT or c == _OPEN_ARRAY:
+                    self._open(c)
+                elif c == _CLOSE_OBJECT or c == _CLOSE_ARRAY:
+                    self._close(c)
+                else:
+                    self.in_scalar = True
+                    self._begin_value()
+                    self._append(chunk[i:i + 1])
+            i += 1
+        return self.done
+
+    def finish(self) -> list:
+        # Flushes a number left at the very end of the document and returns the extracted records. Raises ValueError
+        # if the document was empty or cut off before its records were complete.
+
+        if self.in_scalar:
+            self._end_scalar()
+        if not self.done and (self.stack or not self.started):
+            raise ValueError("JSON ended early" if self.started else "No JSON in the response")
+        return self.records
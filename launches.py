@@ -0,0 +1,130 @@
+from collections import namedtuple
+
+from polling import PollPolicy
+from timeutil import parse_t0
+
+# The free API returns up to 5 launches per request, so one fetch covers several rollovers
+LAUNCH_URL = "https://fdo.rocketlaunch.live/json/launches/next/"
+
+# The only parts of a rocketlaunch.live launch that the screen uses, as output name -> path inside the launch
+LAUNCH_FIELDS = {
+    "t0": ("t0",),
+    "win_open": ("win_open",),
+    "name": ("name",),
+    "vehicle": ("vehicle", "name"),
+    "pad": ("pad", "name"),
+    "location": ("pad", "location", "name"),
+    "country": ("pad", "location", "country"),
+}
+
+# One launch as it's kept in RAM: T-0 in UTC epoch seconds and the five strings shown on screen.
+# A namedtuple is a plain tuple underneath (no per-instance dict, __slots__ = () on CPython), so a record costs about
+# as much as the tuple it replaced, minus the T-0 string. The T-0 text is parsed once, when the launch is loaded.
+LaunchRecord = namedtuple("LaunchRecord", ("t0", "name", "vehicle", "pad", "location", "country"))
+
+
+def intern(strings: dict, text):
+    # Returns the copy of text already in strings, adding it if it's new. Launches from one response usually share
+    # their vehicle, pad, location and country, and every launch would otherwise hold its own copy of those.
+    # strings (dict) - text -> the one copy of it that's kept, shared by the records built in one go
+
+    return strings.setdefault(text, text)
+
+
+def _text(strings: dict, text) -> str:
+    return intern(strings, "" if text is None else text)
+
+
+def make_record(strings: dict, t0: int, name, vehicle, pad, location, country) -> LaunchRecord:
+    # Builds a LaunchRecord with its strings deduplicated through strings (see intern()). A missing field (JSON null)
+    # becomes "", so the labels and the flash cache show the same thing for it.
+    # t0 (int) - T-0 in UTC epoch seconds
+
+    return LaunchRecord(t0, _text(strings, name), _text(strings, vehicle), _text(strings, pad),
+                        _text(strings, location), _text(strings, country))
+
+
+class LaunchQueue:
+    # The next few launches from a single request, kept as LaunchRecords sorted by T-0.
+    # When the current launch's T-0 passes, the next entry takes over without touching the network. A refetch is only
+    # needed once the poll policy says the data is stale or after such a rollover, since the new head may have moved.
+
+    def __init__(self, size=5, policy=None, grace=60):
+        # size (int) - default: 5 - launches requested per fetch
+        # policy (PollPolicy) - default: None - decides when the data is stale, a default PollPolicy if None
+        # grace (int) - default: 60 - seconds that "00:00" stays up after T-0 before rolling over
+
+        self.size = size
+        self.policy = PollPolicy() if policy is None else policy
+        self.grace = grace
+        self.entries: list = []
+        self.fetched_at = None
+        self.rolled_over: bool = False
+        self.rollovers: int = 0
+        self.fetches: int = 0
+
+    @property
+    def url(self) -> str:
+        return f"{LAUNCH_URL}{self.size}"
+
+    def load(self, records: list, now: int):
+        # Replaces the queue with freshly extracted records.
+        # records (list) - dicts keyed by the names in LAUNCH_FIELDS
+        # now (int) - current UTC time in epoch seconds
+
+        entries = []
+        strings = {}
+        for record in records:
+            # If an official T-0 time isn't listed, but a window opening time is, use it instead
+            t0 = record["t0"] if record["t0"] is not None else record["win_open"]
+            if t0 is None:
+                continue  # No date yet, nothing to count down to
+            entries.append(make_record(strings, parse_t0(t0), record["name"], record["vehicle"], record["pad"],
+                                       record["location"], record["country"]))
+        entries.sort(key=lambda entry: entry.t0)
+        # The launch on screen coming back with another T-0 means a hold or a slip
+        head = self.current()
+        for entry in entries:
+            if head is not None and entry.name == head.name:
+                if entry.t0 != head.t0:
+                    print(f"T-0 of {head.name} moved by {entry.t0 - head.t0} seconds")
+                    self.policy.moved(now)
+                break
+        self.entries = entries
+        self.fetched_at = now
+        self.rolled_over = False
+        self.fetches += 1
+        self.expire(now)
+
+    def expire(self, now: int) -> bool:
+        # Drops launches whose T-0 (plus grace) has passed. Returns True if the current launch changed.
+
+        dropped = False
+        while len(self.entries) > 1 and self.entries[0].t0 + self.grace <= now:
+            self.entries.pop(0)
+            dropped = True
+        if dropped:
+            self.rolled_over = True
+            self.rollovers += 1
+        return dropped
+
+    def current(self):
+        # The launch to count down to, or None if nothing has been loaded.
+        return self.entries[0] if self.entries else None
+
+    def needs_refresh(self, now: int) -> bool:
+        if not self.entries or self.fetched_at is None:
+            return True
+        if self.rolled_over or self.policy.stale_in(self.fetched_at, self.entries[0].t0, now) <= 0:
+            return True
+        # The last launch we know about has passed as well
+        return self.entries[0].t0 + self.grace <= now
+
+    def refresh_in(self, now: int) -> int:
+        # Seconds until needs_refresh() will say yes, 0 if it already does. This is also the time until the policy
+        # moves to a tighter tier, or until the current launch is done and the queue rolls over.
+
+        if self.needs_refresh(now):
+            return 0
+        head = self.entries[0]
+        return min(self.policy.stale_in(self.fetched_at, head.t0, now), head.t0 + self.grace - now)
@@ -0,0 +1,143 @@
+import sys
+from array import array
+from time import monotonic_ns
+
+try:
+    import supervisor
+except ImportError:  # pragma: no cover
+    # Not on CircuitPython, so there's no serial console to listen to
+    supervisor = None
+
+# Histogram name -> unit, in the order they're reported
+METRICS = {
+    "tick": "us",  # One display tick, from the scheduler calling it to it returning
+    "render": "us",  # Pushing the changed regions to the screen
+    "fetch": "ms",  # A whole request through NetSupervisor, connect to last byte
+    "parse": "us",  # Time spent inside the JSON extractor for one response
+    "bytes": "B",  # Body bytes received per response
+    "gc": "us",  # One gc.collect()
+    "heap": "B",  # Free heap after a collect
+}
+
+
+def short(value: int) -> str:
+    # value as at most 5 characters, e.g. 12345 -> "12k", so a row of numbers fits the 128 pixel screen.
+
+    if value < 10_000:
+        return str(value)
+    if value < 10_000_000:
+        return f"{value // 1000}k"
+    return f"{value // 1_000_000}M"
+
+
+class Histogram:
+    # The last size samples of one measurement in a ring buffer, plus a running count and maximum.
+    # Adding a sample allocates nothing; percentiles are only worked out (on a sorted copy) when asked for.
+
+    def __init__(self, unit: str, size=32):
+        # unit (str) - shown after the numbers, e.g. "us"
+        # size (int) - default: 32 - samples kept for the percentiles
+
+        self.unit = unit
+        self.samples = array("l", [0] * size)
+        self.next: int = 0
+        self.count: int = 0
+        self.max: int = 0
+
+    def add(self, value: int):
+        self.samples[self.next] = value
+        self.next = (self.next + 1) % len(self.samples)
+        self.count += 1
+        if value > self.max:
+            self.max = value
+
+    def percentiles(self):
+        # (p50, p90) of the samples still in the buffer, or None before the first one.
+
+        kept = min(self.count, len(self.samples))
+        if not kept:
+            return None
+        ordered = sorted(self.samples[:kept])
+        return ordered[kept // 2], ordered[kept * 9 // 10]
+
+
+class Metrics:
+    # Histograms of the numbers that matter on the pico: tick and render time, fetch latency, JSON parse time,
+    # response size, GC pauses and free heap. Turned off (the default) it holds no buffers and every record() is an
+    # attribute check, so instrumented code can call it unconditionally.
+    # The report goes to the serial console with the other reports, or when "m" is typed into it, and the hidden
+    # diagnostics mode shows it on screen.
+
+    def __init__(self, enabled=False, size=32):
+        # enabled (bool) - default: False - start collecting right away, e.g. METRICS from settings.toml
+        # size (int) - default: 32 - samples kept per histogram
+
+        self.enabled: bool = False
+        self.size = size
+        self.histograms: dict = {}
+        if enabled:
+            self.enable()
+
+    def enable(self):
+        # Starts collecting. The buffers are only allocated now, so metrics that are never turned on cost no RAM.
+
+        if not self.histograms:
+            for name in METRICS:
+                self.histograms[name] = Histogram(METRICS[name], self.size)
+        self.enabled = True
+
+    def clear(self):
+        # Forgets every sample, e.g. to measure from a known point on.
+
+        self.histograms = {}
+        if self.enabled:
+            self.enable()
+
+    def record(self, name: str, value: int):
+        # name (str) - a key of METRICS
+        # value (int) - the sample, in that metric's unit
+
+        if self.enabled:
+            self.histograms[name].add(value)
+
+    def since(self, name: str, start_ns: int, unit=1000):
+        # Records the time since start_ns (from time.monotonic_ns()).
+        # unit (int) - default: 1000 - nanoseconds per unit of the metric, 1000 for "us", 1_000_000 for "ms"
+
+        if self.enabled:
+            self.histograms[name].add((monotonic_ns() - start_ns) // unit)
+
+    def poll_serial(self):
+        # Prints the report whenever "m" is typed into the serial console, without stopping the running code.
+
+        if supervisor is None or not supervisor.runtime.serial_bytes_available:
+            return
+        if sys.stdin.read(1) in ("m", "M"):
+            print(self.report())
+
+    def rows(self) -> list:
+        # One short line per metric ("name p50 p90 max"), for the diagnostics screen.
+
+        lines = []
+        for name in METRICS:
+            histogram = self.histograms.get(name)
+            values = None if histogram is None else histogram.percentiles()
+            if values is None:
+                lines.append(f"{name:<6}    -")
+            else:
+                lines.append(f"{name:<6}{short(values[0]):>5}{short(values[1]):>5}{short(histogram.max):>5}")
+        return lines
+
+    def report(self) -> str:
+        if not self.enabled:
+            return "Metrics: off"
+        lines = ["Metrics (p50 / p90 / max):"]
+        for name in METRICS:
+            histogram = self.histograms[name]
+            values = histogram.percentiles()
+            if values is None:
+                lines.append(f"  {name}: no samples")
+            else:
+                lines.append(f"  {name}: {values[0]} / {values[1]} / {histogram.max} {histogram.unit} "
+                             f"over {histogram.count} samples")
+        return "\n".join(lines)
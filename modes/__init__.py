@@ -0,0 +1,92 @@
+# Screen modes that run on top of PicoCore. Each one lives in its own module and is only imported when it's switched
+# to, so startup only pays the import time and RAM of the mode on screen.
+import gc
+import sys
+
+# Mode name -> (module, class)
+MODES = {
+    "launch": ("modes.launch", "LaunchMode"),
+    "manual": ("modes.manual", "ManualMode"),
+    "clock": ("modes.clock", "ClockMode"),
+    "diagnostics": ("modes.diagnostics", "DiagnosticsMode"),
+}
+# The order a double press cycles through them. Modes left out (diagnostics) are hidden from the cycle and the picker.
+ORDER = ("launch", "manual", "clock")
+
+
+def load(name: str):
+    # Imports a mode's module and returns its class.
+
+    if name not in MODES:
+        raise ValueError(f"Unknown mode {name}, pick one of {', '.join(ORDER)}")
+    module_name, class_name = MODES[name]
+    module = __import__(module_name, None, None, (class_name,))
+    return getattr(module, class_name)
+
+
+def unload():
+    # Forgets every imported mode module (and the helpers inside modes/), so the garbage collector can take them back.
+    # Importing a submodule also sets it as an attribute of this package, which would keep it alive otherwise.
+
+    package = sys.modules[__name__]
+    for module_name in list(sys.modules):
+        if module_name.startswith("modes."):
+            del sys.modules[module_name]
+            short_name = module_name[len("modes."):]
+            if hasattr(package, short_name):
+                delattr(package, short_name)
+    gc.collect()
+
+
+def after(name: str) -> str:
+    # The mode that follows name when cycling through them, the first one after a hidden mode
+    if name not in ORDER:
+        return ORDER[0]
+    return ORDER[(ORDER.index(name) + 1) % len(ORDER)]
+
+
+class Mode:
+    # What PicoCore expects from a mode. The defaults do nothing, so a mode only overrides what it needs.
+
+    accent = (255, 255, 255)
+    display_interval = 1.0  # Seconds between render ticks
+    refresh_interval = 120  # Seconds between calls to refresh(), unless refresh_wait() says otherwise
+
+    def __init__(self, core):
+        # core (PicoCore) - the shared hardware, network and clock
+        self.core = core
+
+    def start(self):
+        # Builds the mode's screen and returns its root Group. Called once per switch, before the first tick.
+        raise NotImplementedError
+
+    def schedule(self, scheduler):
+        # Adds the mode's tasks (rendering, animation) to a fresh Scheduler.
+        pass
+
+    def refresh(self):
+        # Fetches or recomputes whatever data the mode needs, if it's due. Blocks the display while it runs.
+        pass
+
+    def needs_network(self) -> bool:
+        # Whether refresh() would go to the network right now, so low power mode knows to turn the radio on.
+        return False
+
+    def refresh_wait(self) -> float:
+        # Seconds until refresh() has something to do again. PicoCore sleeps (and keeps the radio quiet) until then.
+        return self.refresh_interval
+
+    async def refresh_async(self):
+        # Same as refresh(), for modes that can share the CPU with rendering while they wait on the network.
+        self.refresh()
+
+    def on_button(self, gesture: str) -> bool:
+        # Handles a short or long press. Returns True to have refresh() run right away.
+        return False
+
+    def stop(self):
+        # Called before the mode is switched away from.
+        pass
+
+    def report(self) -> str:
+        return f"{type(self).__name__}: no statistics"
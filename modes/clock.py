@@ -0,0 +1,167 @@
+from displayio import Group, Bitmap, Palette, TileGrid
+from terminalio import FONT
+from adafruit_display_text import label
+from adafruit_display_shapes.circle import Circle
+
+from buttons import SHORT, LONG
+from glyph_atlas import GlyphAtlas, GlyphText
+from modes import Mode
+from polling import until_next
+from schedule import Schedule
+from timeutil import date_time
+from timezones import TimeZone, offset_text
+from view_model import ViewModel
+
+
+class ClockMode(Mode):
+    # A simple desk clock: local time and date, plus the local time and day number of the multi-day event in
+    # schedule.txt that's going on (or coming up next), e.g. "Time in Milan" and "Day 3" of the Winter Olympics.
+    # Nothing on screen shows seconds, so it only wakes up to render right after each minute boundary.
+    # A short press goes back to the launch countdown, a long press resyncs the clock with NTP.
+
+    accent = (255, 255, 255)
+    display_interval = 60
+    refresh_interval = 21600  # Nothing to fetch, PicoCore still wakes up early for NTP resyncs
+    olympics = True
+
+    def __init__(self, core):
+        super().__init__(core)
+        self.view = ViewModel()
+        self.view.compositor = core.compositor
+        self.calendar = Schedule()
+        self.zone = None  # TimeZone of the event on screen
+        self.digits = None
+        self.countdown_text_area = None
+        self.comp_day = None
+        self.counter = 0
+        self.scheduler = None
+        self.display_task = None
+
+    def start(self):
+        accent = self.accent
+        self.calendar.load(f"{self.core.drive}schedule.txt")
+        print(self.calendar.report())
+
+        # Add background with accent color
+        splash = Group()
+        color_bitmap = Bitmap(128, 160, 1)
+        color_palette = Palette(1)
+        color_palette[0] = (0, 0, 0)
+        bg_sprite = TileGrid(color_bitmap, pixel_shader=color_palette, x=0, y=0)
+        splash.append(bg_sprite)
+
+        # Pre-rendered triple size digits, so a new minute only rewrites the tiles of the digits that changed
+        self.digits = GlyphAtlas(FONT, "0123456789:", scale=3)
+        self.countdown_text_area = GlyphText(self.digits, 5, color=accent, x=20, y=12,
+                                             compositor=self.core.compositor)
+        self.countdown_text_area.text = "00:00"
+        splash.append(self.countdown_text_area.grid)
+        self.view.bind("countdown", self.countdown_text_area)
+
+        char_height = FONT.get_bounding_box()[1]
+
+        if self.olympics:
+            # rings are from left to right, top to bottom. 1 is top left, 5 is bottom right.
+            radius = 8
+            rings_height = 91
+            olympic_rings_group = Group()
+            ring_1 = Circle(28, rings_height, radius, outline=accent, stroke=1)
+            ring_2 = Circle(47, rings_height, radius, outline=accent, stroke=1)
+            ring_3 = Circle(66, rings_height, radius, outline=accent, stroke=1)
+            ring_4 = Circle(37, rings_height + radius, radius, outline=accent, stroke=1)
+            ring_5 = Circle(56, rings_height + radius, radius, outline=accent, stroke=1)
+            olympic_rings_group.append(ring_1)
+            olympic_rings_group.append(ring_2)
+            olympic_rings_group.append(ring_3)
+            olympic_rings_group.append(ring_4)
+            olympic_rings_group.append(ring_5)
+
+            self.comp_day = label.Label(FONT, x=86, y=95, text="Day -", color=accent)
+            olympic_rings_group.append(self.comp_day)
+            splash.append(olympic_rings_group)
+            self.view.bind("day", self.comp_day, (86, 95 - char_height // 2, 128 - 86, char_height))
+
+        main_text_group = Group(scale=1, x=20, y=65)
+        rows = (label.Label(FONT, y=0, text="", color=accent),
+                label.Label(FONT, y=15, text="", color=accent),
+                label.Label(FONT, y=30, text="", color=accent),
+                label.Label(FONT, y=45, text="", color=accent),
+                label.Label(FONT, y=60, text="Pico Clock", color=accent),
+                label.Label(FONT, y=75, text="Loading...", color=accent))
+        for i in range(len(rows)):
+            main_text_group.append(rows[i])
+            # Rows are centered on their y and can run up to the right edge of the screen
+            top = main_text_group.y + rows[i].y - char_height // 2
+            self.view.bind(f"row_{i + 1}", rows[i], (main_text_group.x, top, 128 - main_text_group.x, char_height))
+        splash.append(main_text_group)
+
+        print(f"Screen rendered with an accent of RGB value {accent}")
+        return splash
+
+    def schedule(self, scheduler):
+        # Renders right away, then render_tick() moves each following tick onto the next minute boundary
+        self.scheduler = scheduler
+        self.display_task = scheduler.every("display", self.display_interval, self.render_tick, metric="tick")
+
+    def render_tick(self):
+        if not self.core.clock.valid():
+            self.scheduler.reschedule(self.display_task, 1)
+            return  # Still waiting on the first NTP sync, look again in a second
+
+        # The RTC is kept in UTC; local and event time both come from the DST tables in timezones.py
+        now = self.core.utc_now()
+        # The RTC only reads whole seconds, so this lands up to a second after the boundary, never before it
+        self.scheduler.reschedule(self.display_task, until_next(now))
+        years, months, days, hours, minutes = date_time(self.core.tz.to_local(now))[:5]
+        if hours > 12:
+            hours -= 12
+
+        self.view.set("countdown", f"{hours:02}:{minutes:02}")
+        self.view.set("row_1", f"{months}/{days}/{years}")
+        self.render_event(now)
+        self.view.end_tick()
+        self.core.present()
+
+        self.counter += 1
+        if self.counter == 1:
+            print("Countdown active")
+
+    def render_event(self, now: int):
+        # The event's local time and which day of it this is there. Day 0 is the day it starts (e.g. an opening
+        # ceremony); before that the days left are shown instead, e.g. "T-12d".
+
+        span = self.calendar.span(now)
+        if span is None:
+            self.view.set("row_5", "")
+            self.view.set("row_6", "")
+            if self.olympics:
+                self.view.set("day", "")
+            return
+
+        index, zone_name, city = span[0], span[2], span[3]
+        if self.zone is None or self.zone.name != zone_name:
+            self.zone = TimeZone(zone_name)
+        # Hours and minutes both come from the event's own local time, since half-hour zones shift the minutes too
+        event_now = self.zone.to_local(now)
+        event_hrs, event_minutes = date_time(event_now)[3:5]
+        if event_hrs > 12:
+            event_hrs -= 12
+
+        self.view.set("row_5", f"Time in {city}")
+        self.view.set("row_6", f"{event_hrs}:{event_minutes:02} (UTC{offset_text(self.zone.offset_minutes(now))})")
+        if self.olympics:
+            day = event_now // 86400 - self.zone.to_local(self.calendar.starts[index]) // 86400
+            self.view.set("day", f"Day {day}" if day >= 0 else f"T-{-day}d")
+
+    def on_button(self, gesture: str) -> bool:
+        if gesture == SHORT:
+            print("Button pressed, switching to the launch countdown")
+            self.core.request_mode("launch")
+        elif gesture == LONG:
+            print("Button held, resyncing the clock")
+            self.core.clock.expire()
+            return True
+        return False
+
+    def report(self) -> str:
+        return self.view.summary()
@@ -0,0 +1,212 @@
+from displayio import Group, Bitmap, Palette, TileGrid
+from terminalio import FONT
+from adafruit_display_text import label
+from adafruit_display_text.scrolling_label import ScrollingLabel
+from adafruit_ticks import ticks_ms, ticks_diff
+
+from countdown_format import CountdownFormatter
+from glyph_atlas import GlyphAtlas, GlyphText
+from modes import Mode
+from timeutil import date_time
+from view_model import ViewModel
+
+
+class CountdownMode(Mode):
+    # The countdown screen shared by the launch and manual modes: the time left to T-0 at the top and seven rows
+    # about the event below it. Subclasses decide what to count down to and call show() with it.
+
+    accent = (71, 215, 0)
+    display_interval = 0.2
+    scroll_interval = 0.5
+    # Low power mode ticks once a second instead, each tick this much sooner than the one before (see second_tick())
+    creep = 0.01
+    recheck = 0.05  # Seconds from a tick that landed before the RTC's second boundary to the next look
+    manual_text = "Manual: False"
+
+    def __init__(self, core):
+        super().__init__(core)
+        self.view = ViewModel()
+        self.view.compositor = core.compositor
+        self.formatter = CountdownFormatter()
+        self.digits = None
+        self.countdown_text_area = None
+        self.main_row_1 = None
+        self.main_row_2 = None
+        self.main_row_3 = None
+        self.main_row_4 = None
+        self.main_row_5 = None
+        self.main_row_6 = None
+        self.main_row_7 = None
+        self.launch = None  # LaunchRecord on screen
+        self.launch_epoch = None
+        self.launch_date: str = ""
+        self.counter = 0
+        self.scheduler = None
+        self.display_task = None
+        self.second = None  # RTC second shown by the last second_tick()
+        self.second_at = None  # ticks_ms() of that tick, so a fresh scheduler keeps the same alignment
+
+    def start(self):
+        # Sets up the screen's color scheme, all 7 rows of data, and the countdown section.
+
+        accent = self.accent
+
+        # Add background
+        splash = Group()
+        color_bitmap = Bitmap(128, 160, 1)
+        color_palette = Palette(1)
+        color_palette[0] = accent
+        bg_sprite = TileGrid(color_bitmap, pixel_shader=color_palette, x=0, y=0)
+        splash.append(bg_sprite)
+
+        # Create black rectangle
+        # This visually makes the purple background look like just a border
+        inner_bitmap = Bitmap(118, 120, 1)
+        inner_palette = Palette(1)
+        inner_palette[0] = 0x000000  # Black
+        inner_sprite = TileGrid(inner_bitmap, pixel_shader=inner_palette, x=5, y=35)
+        splash.append(inner_sprite)
+
+        # Pre-rendered double size digits: a new second is a tile index write, and only the changed digits go over SPI
+        self.digits = GlyphAtlas(FONT, "0123456789:DaysLOADING", scale=2)
+        self.countdown_text_area = GlyphText(self.digits, 9, color=0x000000, x=16, y=6,
+                                             compositor=self.core.compositor)
+        splash.append(self.countdown_text_area.grid)
+
+        max_chars = 17
+
+        main_text_group = Group(scale=1, x=16, y=50)
+        self.main_row_1 = ScrollingLabel(FONT, y=0, animate_time=0.5, max_characters=max_chars, text="", color=accent)
+        self.main_row_2 = ScrollingLabel(FONT, y=15, animate_time=0.5, max_characters=max_chars, text="Data by rocket",
+                                         color=accent)
+        self.main_row_3 = ScrollingLabel(FONT, y=30, animate_time=0.5, max_characters=max_chars, text="launch.live",
+                                         color=accent)
+        self.main_row_4 = ScrollingLabel(FONT, y=45, animate_time=0.5, max_characters=max_chars,
+                                         text="---------------", color=accent)
+        self.main_row_5 = ScrollingLabel(FONT, y=60, animate_time=0.5, max_characters=max_chars,
+                                         text="PicoLaunchTimer", color=accent)
+        self.main_row_6 = label.Label(FONT, y=75, text="Version 0.3", color=accent)
+        self.main_row_7 = label.Label(FONT, y=90, text="Loading...", color=accent)
+        main_text_group.append(self.main_row_1)
+        main_text_group.append(self.main_row_2)
+        main_text_group.append(self.main_row_3)
+        main_text_group.append(self.main_row_4)
+        main_text_group.append(self.main_row_5)
+        main_text_group.append(self.main_row_6)
+        main_text_group.append(self.main_row_7)
+        splash.append(main_text_group)
+
+        # Screen area each row can cover, for the compositor: rows are centered on their y inside main_text_group
+        char_width, char_height = FONT.get_bounding_box()[:2]
+
+        def row(y):
+            return main_text_group.x, main_text_group.y + y - char_height // 2, max_chars * char_width, char_height
+
+        self.view.bind("countdown", self.countdown_text_area)
+        self.view.bind("row_1", self.main_row_1, row(0))
+        self.view.bind("row_2", self.main_row_2, row(15))
+        self.view.bind("row_3", self.main_row_3, row(30))
+        self.view.bind("row_4", self.main_row_4, row(45))
+        self.view.bind("row_5", self.main_row_5, row(60))
+        self.view.bind("row_6", self.main_row_6, row(75))
+        self.view.bind("row_7", self.main_row_7, row(90))
+
+        print(f"Screen rendered with an accent of RGB value {accent}")
+        return splash
+
+    def schedule(self, scheduler):
+        # In low power mode one tick a second renders and scrolls, so the gaps in between are long enough for light
+        # sleep. Otherwise the countdown ticks every display_interval and the rows scroll on their own timing.
+
+        self.scheduler = scheduler
+        if self.core.power.low_power:
+            delay = 0 if self.second_at is None else ticks_diff(self.second_at, ticks_ms()) % 1000 / 1000
+            self.display_task = scheduler.every("display", 1, self.second_tick, delay=delay, metric="tick")
+            return
+        self.display_task = scheduler.every("display", self.display_interval, self.render_tick, metric="tick")
+        scheduler.every("scroll", self.scroll_interval, self.update_scrolls)
+
+    def second_tick(self):
+        # The low power tick, lined up just after the RTC's second boundary. The RTC only reads whole seconds, so the
+        # boundary is found by arriving creep seconds earlier every second: once a tick still reads the second already
+        # on screen, it's just before the boundary, and the next look comes recheck seconds later, just after it.
+        # The very first tick looks again every recheck seconds until the second changes, to find the boundary.
+
+        now = self.core.utc_now()
+        if now == self.second:
+            self.scheduler.reschedule(self.display_task, self.recheck)
+            return
+        first = self.second is None
+        self.second = now
+        self.second_at = ticks_ms()
+        self.scheduler.reschedule(self.display_task, self.recheck if first else 1 - self.creep)
+        self.update_scrolls()
+        self.render_tick(now)
+
+    def update_scrolls(self, force=True):
+        # force (bool) - default: True - step the animation now, the scheduler already keeps the scroll timing
+        self.main_row_1.update(force)
+        self.main_row_2.update(force)
+        self.main_row_3.update(force)
+        self.main_row_4.update(force)
+        self.main_row_5.update(force)
+        # Only rows too long to fit actually move
+        for name in ("row_1", "row_2", "row_3", "row_4", "row_5"):
+            row = self.view.labels[name]
+            if len(row.full_text) > row.max_characters:
+                self.core.compositor.mark(*self.view.regions[name])
+        return "Screen scrolled"
+
+    def show(self, launch):
+        # Switches the countdown to another event and works out its local launch date for render_tick().
+        # launch (LaunchRecord) - the event, with T-0 already in epoch seconds so nothing is parsed here
+
+        self.launch = launch
+
+        # The launch date is shown with the UTC offset in effect at T-0, which can differ from today's across DST
+        self.launch_epoch = launch.t0
+        y, m, d = date_time(self.core.tz.to_local(self.launch_epoch))[:3]
+        self.launch_date = f"{y}-{m:02}-{d:02}"
+
+    def loading(self):
+        # Shows "LOADING" until the next show()
+        self.view.set("countdown", "LOADING")
+        self.launch_epoch = None
+        self.core.present()
+
+    def render_tick(self, now=None):
+        # now (int) - default: None - UTC epoch seconds if the caller already read the clock this tick
+
+        if self.launch_epoch is None or not self.core.clock.valid():
+            self.core.present()  # Nothing to count down to yet, only the scrolling text can have changed
+            return
+
+        # One clock read per tick, so everything drawn below agrees on the time
+        if now is None:
+            now = self.core.utc_now()
+
+        # Both sides are UTC, so a DST change between now and T-0 doesn't shift the countdown
+        # The formatter hands back the same string object until the second changes, so most ticks allocate nothing
+        countdown_str = self.formatter.format(self.launch_epoch - now)
+
+        # Only labels whose text actually changed get rewritten (and pushed over SPI)
+        launch = self.launch
+        self.view.set("row_1", launch.name)
+        self.view.set("row_2", launch.vehicle)
+        self.view.set("row_3", launch.pad)
+        self.view.set("row_4", launch.location)
+        self.view.set("row_5", launch.country)
+        self.view.set("row_6", self.launch_date)
+        self.view.set("row_7", self.manual_text)
+
+        self.view.set("countdown", countdown_str)
+        self.view.end_tick()
+        self.core.present()
+
+        self.counter += 1
+        if self.counter == 1:
+            print(f"Countdown active, {self.manual_text}")
+            print(f"Time to first countdown: {ticks_diff(ticks_ms(), self.core.started)} ms")
+
+    def report(self) -> str:
+        return self.view.summary()
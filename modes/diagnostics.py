@@ -0,0 +1,60 @@
+from time import monotonic
+
+from displayio import Group
+from terminalio import FONT
+from adafruit_display_text import label
+
+from buttons import SHORT, LONG
+from metrics import METRICS
+from modes import Mode
+from view_model import ViewModel
+
+
+class DiagnosticsMode(Mode):
+    # Hidden screen with the core's metrics (see metrics.py): p50, p90 and max of every histogram, once a second.
+    # It isn't in the double press cycle; a double press on the mode picker opens it. Opening it turns the metrics on
+    # if METRICS wasn't set, so there's something to look at from then on.
+    # A short press goes back to the launch countdown, a long press clears the histograms.
+
+    accent = (0, 255, 0)
+
+    def __init__(self, core):
+        super().__init__(core)
+        self.view = ViewModel()
+        self.view.compositor = core.compositor
+
+    def start(self):
+        self.core.metrics.enable()
+        char_height = FONT.get_bounding_box()[1]
+        splash = Group()
+        splash.append(label.Label(FONT, x=2, y=8, text="Diagnostics", color=self.accent))
+        splash.append(label.Label(FONT, x=2, y=24, text="       p50  p90  max", color=self.accent))
+        for i in range(len(METRICS) + 1):
+            y = 38 + 14 * i
+            row = label.Label(FONT, x=2, y=y, text="", color=self.accent)
+            splash.append(row)
+            self.view.bind(f"row_{i + 1}", row, (0, y - char_height // 2, 128, char_height))
+        return splash
+
+    def schedule(self, scheduler):
+        scheduler.every("display", self.display_interval, self.render_tick)
+
+    def render_tick(self):
+        rows = self.core.metrics.rows()
+        for i in range(len(rows)):
+            self.view.set(f"row_{i + 1}", rows[i])
+        self.view.set(f"row_{len(rows) + 1}", f"up {int(monotonic())} s")
+        self.view.end_tick()
+        self.core.present()
+
+    def on_button(self, gesture: str) -> bool:
+        if gesture == SHORT:
+            print("Button pressed, switching to the launch countdown")
+            self.core.request_mode("launch")
+        elif gesture == LONG:
+            print("Button held, clearing the metrics")
+            self.core.metrics.clear()
+        return False
+
+    def report(self) -> str:
+        return self.view.summary()
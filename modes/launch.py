@@ -0,0 +1,187 @@
+from time import monotonic_ns
+
+try:
+    import asyncio
+except ImportError:  # pragma: no cover
+    asyncio = None
+
+from buttons import SHORT, LONG
+from flash_cache import FlashCache
+from json_extract import JsonExtractor
+from launches import LAUNCH_FIELDS, LaunchQueue
+from modes.countdown import CountdownMode
+
+
+class LaunchMode(CountdownMode):
+    # Counts down to the next orbital launch from rocketlaunch.live, rolling over to the next queued launch at T-0.
+    # A short press switches to the manual countdown, a long press fetches the newest data right away.
+
+    def __init__(self, core):
+        super().__init__(core)
+        self.queue = LaunchQueue()
+        self.flash = FlashCache(f"{core.drive}launch_cache.bin")
+
+    def start(self):
+        splash = super().start()
+        # With last run's launches in flash the countdown is up before the network is even touched
+        if self.restore_cache():
+            self.prepare_countdown()
+        return splash
+
+    def extract_launches(self, response, chunk_size=256) -> list:
+        # Parses the response as it streams in, keeping only the fields in LAUNCH_FIELDS so the full JSON document
+        # never has to fit in RAM.
+        # chunk_size (int) - default: 256 - bytes read from the socket at a time
+
+        extractor = JsonExtractor("result", LAUNCH_FIELDS, max_records=self.queue.size)
+        parse_ns = 0
+        received = 0
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            received += len(chunk)
+            start = monotonic_ns()
+            done = extractor.feed(chunk)
+            parse_ns += monotonic_ns() - start
+            if done:
+                break
+        return self.finish_extract(extractor, parse_ns, received)
+
+    async def extract_launches_async(self, response, chunk_size=256) -> list:
+        # Same as extract_launches(), but yields after every chunk so rendering keeps going.
+
+        extractor = JsonExtractor("result", LAUNCH_FIELDS, max_records=self.queue.size)
+        parse_ns = 0
+        received = 0
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            received += len(chunk)
+            start = monotonic_ns()
+            done = extractor.feed(chunk)
+            parse_ns += monotonic_ns() - start
+            if done:
+                break
+            await asyncio.sleep(0)
+        return self.finish_extract(extractor, parse_ns, received)
+
+    def finish_extract(self, extractor, parse_ns: int, received: int) -> list:
+        # Returns the extracted launches and records the parse time and body size in the core's metrics. Only the
+        # time inside the extractor counts as parsing, not the waits on the socket in between.
+        # parse_ns (int) - nanoseconds spent in extractor.feed() so far
+        # received (int) - bytes of the body read
+
+        start = monotonic_ns()
+        records = extractor.finish()
+        self.core.metrics.record("parse", (parse_ns + monotonic_ns() - start) // 1000)
+        self.core.metrics.record("bytes", received)
+        return records
+
+    def get_launch_info(self):
+        # Gets the next few launches from https://rocketlaunch.live/api
+        # Unchanged data is answered by a 304 (or not requested at all inside a max-age window) and not parsed again.
+
+        # Offline or failed requests come back as None, which keeps the launches already on screen
+        self.store_launches(self.core.net.fetch(self.core.http.get, self.queue.url, self.extract_launches))
+
+    async def get_launch_info_async(self):
+        # Same as get_launch_info(), but the body is read without stopping the display.
+        # Connecting and the TLS handshake still block inside adafruit_requests, only the body transfer is shared.
+
+        self.store_launches(await self.core.net.fetch_async(self.core.http.get_async, self.queue.url,
+                                                            self.extract_launches_async))
+
+    def store_launches(self, records: list):
+        # Replaces the launch queue, unless the response didn't contain any launches.
+
+        if records:
+            now = self.core.utc_now()
+            self.queue.load(records, now)
+            print(f"Received {len(self.queue.entries)} upcoming launches from rocketlaunch.live. "
+                  f"{self.core.http.report()}")
+            if self.flash.save(self.queue.fetched_at, self.queue.entries, now):
+                print(f"Launch cache written to flash ({self.flash.writes} writes since boot)")
+        else:
+            print("No launches received, keeping the previous data")
+
+    def restore_cache(self) -> bool:
+        # Loads the launches saved by the last run so the countdown can start before any network request.
+        # Returns True if the countdown is ready to be drawn.
+        # After a power cycle the RTC is back at its power-on default. The launches are loaded anyway: render_tick()
+        # holds off until NTP has set the clock, and then the countdown shows up without waiting for a fetch.
+
+        record = self.flash.load()
+        if record is None:
+            return False
+        fetched_at, entries = record
+        clock = self.core.clock
+        if clock.valid() and clock.now() < fetched_at:
+            print("Launch cache is newer than the clock, ignoring it")
+            return False
+        self.queue.entries = entries
+        self.queue.fetched_at = fetched_at
+        if clock.valid():
+            now = clock.now()
+            self.queue.expire(now)
+            print(f"Restored {len(entries)} launches from flash, fetched {now - fetched_at} seconds ago")
+        else:
+            print(f"Restored {len(entries)} launches from flash, waiting for the clock to be set")
+        self.queue.rolled_over = False  # Stale or not, needs_refresh() judges the cached data by its age
+        return True
+
+    def prepare_countdown(self):
+        # Points the countdown at the current launch of the queue. Until the first launches arrive (from flash or the
+        # network) the screen stays on "LOADING".
+
+        launch = self.queue.current()
+        if launch is None:
+            self.loading()
+        else:
+            self.show(launch)
+
+    def due(self) -> bool:
+        # Rolls over first, so a refresh that lands right at T-0 sees the next launch and refetches.
+        now = self.core.utc_now()
+        self.queue.expire(now)
+        return self.queue.needs_refresh(now)
+
+    def needs_network(self) -> bool:
+        return self.due()
+
+    def refresh(self):
+        if self.due():
+            self.get_launch_info()
+        self.prepare_countdown()
+
+    async def refresh_async(self):
+        if self.due():
+            await self.get_launch_info_async()
+        self.prepare_countdown()
+
+    def refresh_wait(self) -> float:
+        # The poll policy decides: a fetch every few hours while T-0 is days out, every minute close to it.
+        # If the data is still stale right after refresh() (the fetch failed), it's tried again after refresh_interval.
+
+        wait = self.queue.refresh_in(self.core.utc_now())
+        return wait if wait > 0 else self.refresh_interval
+
+    def on_button(self, gesture: str) -> bool:
+        if gesture == SHORT:
+            print("Button pressed, switching to the manual countdown")
+            self.core.request_mode("manual")
+            return False
+        if gesture == LONG:
+            print("Button held, acquiring the newest data")
+            self.queue.fetched_at = None
+            self.core.http.revalidate(self.queue.url)
+            self.loading()
+            return True
+        return False
+
+    def render_tick(self, now=None):
+        if self.launch_epoch is not None:
+            now = self.core.utc_now()
+            # When T-0 passes, move on to the next queued launch without going to the network
+            if self.queue.expire(now):
+                print("T-0 passed, rolling over to the next launch")
+                self.prepare_countdown()
+        super().render_tick(now)
+
+    def report(self) -> str:
+        return f"{super().report()}\n{self.queue.policy.report()}"
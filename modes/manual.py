@@ -0,0 +1,51 @@
+from buttons import SHORT, LONG
+from modes.countdown import CountdownMode
+from schedule import Carousel, Schedule
+
+
+class ManualMode(CountdownMode):
+    # Counts down to the events in schedule.txt on the CIRCUITPY drive instead of a launch (see schedule.py for the
+    # format), taking turns between the next few of them. Past events drop out on their own.
+    # A short press goes back to the launch countdown, a long press moves on to the next event right away.
+
+    manual_text = "Manual: True"
+    rotate_interval = 10  # Seconds each event stays on screen
+
+    def __init__(self, core):
+        super().__init__(core)
+        self.calendar = Schedule()
+        self.carousel = Carousel(self.calendar)
+
+    def start(self):
+        splash = super().start()
+        if not self.calendar.load(f"{self.core.drive}schedule.txt"):
+            print("No schedule.txt on the drive, nothing to count down to")
+        print(self.calendar.report())
+        self.show_current()
+        return splash
+
+    def schedule(self, scheduler):
+        super().schedule(scheduler)
+        scheduler.every("carousel", self.rotate_interval, self.rotate, delay=self.rotate_interval)
+
+    def show_current(self):
+        # Shows the carousel's event, if it isn't on screen already.
+
+        event = self.carousel.current(self.core.utc_now())
+        if event is None:
+            self.loading()
+        elif event is not self.launch:
+            self.show(event)
+
+    def rotate(self):
+        self.carousel.advance()
+        self.show_current()
+
+    def on_button(self, gesture: str) -> bool:
+        if gesture == SHORT:
+            print("Button pressed, switching to the launch countdown")
+            self.core.request_mode("launch")
+        elif gesture == LONG:
+            print("Button held, showing the next event")
+            self.rotate()
+        return False
@@ -0,0 +1,178 @@
+from random import random
+from time import monotonic_ns
+
+import adafruit_connection_manager
+import adafruit_requests
+from adafruit_ticks import ticks_ms, ticks_add, ticks_diff
+
+# Errors a request or a connection attempt can end with on CircuitPython: DNS and socket failures are OSErrors,
+# TLS and some adafruit_requests failures are RuntimeErrors (and so are HTTP error statuses, see HttpCache), and a
+# cut-off or garbled response is a ValueError.
+NETWORK_ERRORS = (OSError, RuntimeError, ValueError)
+
+
+class NetSupervisor:
+    # Owns the Wi-Fi link and the shared HTTP session. Connecting never blocks the caller in a retry loop: a failed
+    # attempt schedules the next one after an exponential backoff with random jitter, and fetch() simply hands back
+    # None while the link is down, so the screen keeps showing whatever it already has.
+    # The socket pool and TLS context come from adafruit_connection_manager, which keeps one of each per radio, so
+    # every fetch (and the NTP client) reuses them instead of allocating its own.
+
+    def __init__(self, radio, ssid=None, password=None, timeout=15, min_delay=2, max_delay=300, metrics=None):
+        # radio (wifi.Radio) - the Wi-Fi radio
+        # ssid (str) - default: None - network to join, e.g. WIFI from settings.toml
+        # password (str) - default: None - its password, e.g. PASS from settings.toml
+        # timeout (float) - default: 15 - socket timeout (in seconds) for every request
+        # min_delay (float) - default: 2 - wait (in seconds) after the first failed connection attempt
+        # max_delay (float) - default: 300 - longest wait (in seconds) between attempts, however many have failed
+        # metrics (Metrics) - default: None - where every successful fetch's latency is recorded
+
+        self.radio = radio
+        self.ssid = ssid
+        self.password = password
+        self.timeout = timeout
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.metrics = metrics
+        self.pool = adafruit_connection_manager.get_radio_socketpool(radio)
+        self.ssl_context = adafruit_connection_manager.get_radio_ssl_context(radio)
+        # noinspection PyTypeChecker
+        self.session = adafruit_requests.Session(self.pool, self.ssl_context)
+        self.was_online: bool = False
+        self.failed_connects: int = 0  # Failed attempts in a row, resets once connected
+        self.retry_at = None  # ticks_ms of the next allowed attempt, None to allow one right away
+        self.connects: int = 0
+        self.drops: int = 0
+        self.fetches: int = 0
+        self.failures: int = 0
+        self.skipped: int = 0  # Fetches not even tried because the link was down
+        self.latency_total: int = 0
+        self.latency_max: int = 0
+        # monotonic_ns rather than ticks, since the radio can stay on for longer than ticks_diff() can measure
+        self.radio_on_ns: int = 0  # Radio time before the current on period
+        self.enabled_at = monotonic_ns() if radio.enabled else None
+
+    def online(self) -> bool:
+        # Whether the radio is on a network right now. Notices (and counts) a link that dropped since the last check.
+
+        connected = self.radio.connected
+        if self.was_online and not connected:
+            self.drops += 1
+            print("Wi-Fi link lost")
+            # Sockets opened over the old link are dead, let the next request open fresh ones
+            adafruit_connection_manager.connection_manager_close_all(self.pool)
+        self.was_online = connected
+        return connected
+
+    def retry_in(self) -> float:
+        # Seconds until connect() will try again, 0 if it would try right now.
+
+        if self.retry_at is None:
+            return 0
+        return max(0, ticks_diff(self.retry_at, ticks_ms()) / 1000)
+
+    def connect(self) -> bool:
+        # Joins the network if the link is down and the backoff allows another attempt. Returns whether it's online.
+
+        if self.online():
+            return True
+        if self.retry_in() > 0:
+            return False
+
+        if not self.radio.enabled:
+            self.radio.enabled = True
+            self.enabled_at = monotonic_ns()
+        try:
+            self.radio.connect(self.ssid, self.password)
+        except NETWORK_ERRORS as error:
+            self.failed_connects += 1
+            # Doubles with every failure; the jitter keeps a room full of picos from retrying in lockstep
+            delay = min(self.max_delay, self.min_delay * 2 ** (self.failed_connects - 1))
+            delay *= 0.5 + random() / 2
+            self.retry_at = ticks_add(ticks_ms(), int(delay * 1000))
+            print(f"No connection ({error}), trying again in {delay:.0f} seconds")
+            return False
+
+        self.connects += 1
+        self.failed_connects = 0
+        self.retry_at = None
+        self.was_online = True
+        print(f"Connected to the Internet via {self.ssid}")
+        return True
+
+    def disconnect(self):
+        # Turns the radio off on purpose, e.g. between scheduled fetches on battery. The next connect() turns it on.
+
+        if not self.radio.enabled:
+            return
+        adafruit_connection_manager.connection_manager_close_all(self.pool)
+        self.radio.enabled = False
+        self.was_online = False
+        self.radio_on_ns += monotonic_ns() - self.enabled_at
+        self.enabled_at = None
+
+    def radio_on_time(self) -> float:
+        # Seconds the radio has been on so far.
+
+        on_ns = self.radio_on_ns
+        if self.enabled_at is not None:
+            on_ns += monotonic_ns() - self.enabled_at
+        return on_ns / 1_000_000_000
+
+    def _begin(self) -> bool:
+        if not self.connect():
+            self.skipped += 1
+            return False
+        self.fetches += 1
+        return True
+
+    def _failed(self, error):
+        self.failures += 1
+        print(f"Request failed: {error}")
+        # A half-open socket would fail the next request too
+        adafruit_connection_manager.connection_manager_close_all(self.pool)
+
+    def _finished(self, start: int):
+        latency = ticks_diff(ticks_ms(), start)
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+        if self.metrics is not None:
+            self.metrics.record("fetch", latency)
+
+    def fetch(self, request, *args):
+        # Runs request(*args, timeout) if the network is up and returns its result, or None if the link is down or the
+        # request failed. Nothing raises past this, so a DNS, TLS or socket error can't take the device down.
+        # request (function) - e.g. HttpCache.get, called with the supervisor's timeout as its last argument
+
+        if not self._begin():
+            return None
+        start = ticks_ms()
+        try:
+            result = request(*args, self.timeout)
+        except NETWORK_ERRORS as error:
+            self._failed(error)
+            return None
+        self._finished(start)
+        return result
+
+    async def fetch_async(self, request, *args):
+        # Same as fetch(), for a coroutine function such as HttpCache.get_async.
+
+        if not self._begin():
+            return None
+        start = ticks_ms()
+        try:
+            result = await request(*args, self.timeout)
+        except NETWORK_ERRORS as error:
+            self._failed(error)
+            return None
+        self._finished(start)
+        return result
+
+    def report(self) -> str:
+        succeeded = self.fetches - self.failures
+        rate = 100 * succeeded / self.fetches if self.fetches else 0
+        latency = self.latency_total / succeeded if succeeded else 0
+        return (f"Network: {succeeded}/{self.fetches} fetches ok ({rate:.0f}%), {self.skipped} skipped offline, "
+                f"latency avg {latency:.0f} ms / max {self.latency_max} ms, {self.connects} connects, "
+                f"{self.drops} drops")
@@ -0,0 +1,53 @@
+from displayio import Group
+from terminalio import FONT
+from adafruit_display_text import label
+from adafruit_ticks import ticks_ms, ticks_add, ticks_diff
+from time import sleep
+
+from buttons import SHORT, LONG, DOUBLE
+from modes import ORDER
+
+
+def pick_mode(core, default="launch", wait=2.0) -> str:
+    # Lists the modes for a moment at power-on so one can be chosen without editing code.py. It only uses a few
+    # labels and imports none of the modes, so it costs next to nothing when it's left alone.
+    # A short press moves to the next mode and restarts the wait, a long press starts the highlighted one right away.
+    # A double press opens the hidden diagnostics screen.
+    # core (PicoCore) - the shared hardware
+    # default (str) - default: "launch" - the mode that's highlighted first, e.g. MODE from settings.toml
+    # wait (float) - default: 2.0 - seconds without a press before the highlighted mode starts
+
+    selected = ORDER.index(default) if default in ORDER else 0
+    group = Group(scale=1, x=16, y=40)
+    group.append(label.Label(FONT, y=0, text="Starting in:", color=0xFFFFFF))
+    rows = []
+    for i in range(len(ORDER)):
+        row = label.Label(FONT, y=20 + 15 * i, text="", color=0xFFFFFF)
+        group.append(row)
+        rows.append(row)
+    core.display.root_group = group
+
+    deadline = ticks_add(ticks_ms(), int(wait * 1000))
+    changed = True
+    while ticks_diff(deadline, ticks_ms()) > 0:
+        if changed:
+            for i in range(len(ORDER)):
+                rows[i].text = f"{'>' if i == selected else ' '} {ORDER[i]}"
+            core.compositor.mark_all()
+            core.present()
+            changed = False
+
+        gesture = core.buttons.poll()
+        if gesture == SHORT:
+            selected = (selected + 1) % len(ORDER)
+            deadline = ticks_add(ticks_ms(), int(wait * 1000))
+            changed = True
+        elif gesture == LONG:
+            break
+        elif gesture == DOUBLE:
+            print("Mode picked: diagnostics")
+            return "diagnostics"
+        sleep(0.05)
+
+    print(f"Mode picked: {ORDER[selected]}")
+    return ORDER[selected]
@@ -0,0 +1,71 @@
+# How old launch data may get before it's fetched again, by how far away T-0 is, as
+# (T-0 at most this many seconds away, refetch after this many seconds). Dates weeks out hardly ever move, while the
+# last hour is when holds and scrubs happen.
+TIERS = (
+    (600, 60),
+    (3600, 180),
+    (21600, 600),
+    (86400, 1800),
+    (604800, 7200),
+)
+
+
+def until_next(now: int, period=60) -> int:
+    # Seconds from now to the next multiple of period, e.g. the next minute boundary. Never 0, a boundary that's
+    # exactly now is already being handled.
+    # now (int) - epoch seconds
+    # period (int) - default: 60 - length (in seconds) of the periods to line up with
+
+    return period - now % period
+
+
+class PollPolicy:
+    # Decides when the launch data is stale. Far from T-0 one fetch every few hours is plenty, close to it the data
+    # is checked every minute. A T-0 that moved between two fetches (a hold, a slip or a scrub) keeps the polling
+    # tight for a while afterwards, since one change tends to be followed by more.
+
+    def __init__(self, tiers=TIERS, far_max_age=21600, unsettled_max_age=300, settle=3600):
+        # tiers (tuple) - default: TIERS - (seconds to T-0, max age) pairs, sorted by seconds to T-0
+        # far_max_age (int) - default: 21600 - max age (in seconds) once T-0 is beyond the last tier
+        # unsettled_max_age (int) - default: 300 - longest max age (in seconds) while the T-0 is unsettled
+        # settle (int) - default: 3600 - time (in seconds) a T-0 change keeps the polling tight
+
+        self.tiers = tiers
+        self.far_max_age = far_max_age
+        self.unsettled_max_age = unsettled_max_age
+        self.settle = settle
+        self.unsettled_until = None
+        self.slips: int = 0
+
+    def max_age(self, to_t0: int, now: int) -> int:
+        # Seconds fetched data stays good for, while T-0 is to_t0 seconds away (negative once it passed).
+
+        max_age = self.far_max_age
+        for limit, age in self.tiers:
+            if to_t0 <= limit:
+                max_age = age
+                break
+        if self.unsettled_until is not None and now < self.unsettled_until:
+            max_age = min(max_age, self.unsettled_max_age)
+        return max_age
+
+    def stale_in(self, fetched_at: int, t0: int, now: int) -> int:
+        # Seconds until data fetched at fetched_at for a launch at t0 goes stale, 0 or less if it already is.
+        # When T-0 reaches a tighter tier before then, the answer is the time until that tier starts instead, so a
+        # caller that sleeps this long wakes up in time to ask again.
+
+        to_t0 = t0 - now
+        wait = fetched_at + self.max_age(to_t0, now) - now
+        for limit, _ in self.tiers:
+            if limit < to_t0:
+                wait = min(wait, to_t0 - limit)  # The closest boundary wins
+        return wait
+
+    def moved(self, now: int):
+        # Records that the current launch's T-0 changed between two fetches.
+
+        self.unsettled_until = now + self.settle
+        self.slips += 1
+
+    def report(self) -> str:
+        return f"Poll policy: {self.slips} T-0 changes seen"
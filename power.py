@@ -0,0 +1,72 @@
+from time import monotonic, monotonic_ns, sleep
+
+try:
+    import alarm
+except ImportError:  # pragma: no cover
+    # Boards without the alarm module just sleep normally
+    alarm = None
+
+
+class PowerManager:
+    # Battery mode for running at events off a power bank. Two things use most of the power while the screen sits
+    # still: the Wi-Fi radio and the CPU spinning through sleep(). With low_power on:
+    # - The radio only comes on for a scheduled fetch or NTP resync (NetSupervisor.connect() turns it on) and
+    #   radio_off() turns it off again right after.
+    # - Waits of min_sleep seconds or longer become light sleep until an alarm.time.TimeAlarm, with an
+    #   alarm.pin.PinAlarm on the button so a press still wakes the board right away. The RTC keeps running through
+    #   light sleep and the display keeps its picture, so the countdown is just as correct after waking up.
+    # With low_power off everything behaves as before; the duty cycle is still measured so the two can be compared.
+
+    def __init__(self, net, low_power=False, min_sleep=0.5):
+        # net (NetSupervisor) - owner of the radio
+        # low_power (bool) - default: False - turn the radio off between fetches and light sleep between ticks
+        # min_sleep (float) - default: 0.5 - shortest wait (in seconds) worth going into light sleep for
+
+        self.net = net
+        self.low_power = low_power and alarm is not None
+        self.min_sleep = min_sleep
+        self.started = monotonic_ns()
+        self.asleep_ns: int = 0
+        self.wakes: int = 0
+        self.button_wakes: int = 0
+
+    def radio_off(self):
+        # Turns the radio off until the next fetch, in low power mode. Does nothing otherwise.
+
+        if self.low_power:
+            self.net.disconnect()
+
+    def sleep(self, seconds: float, buttons=None) -> bool:
+        # Waits for seconds, in light sleep if it's long enough. Returns True if a button press cut the sleep short.
+        # buttons (ButtonEvents) - default: None - button that wakes the board, only if no gesture is in progress
+
+        if not self.low_power or seconds < self.min_sleep:
+            sleep(seconds)
+            return False
+
+        alarms = [alarm.time.TimeAlarm(monotonic_time=monotonic() + seconds)]
+        # The pin alarm needs the pin to itself, and a half-finished gesture still needs keypad's timestamps
+        watch_button = buttons is not None and buttons.idle()
+        if watch_button:
+            buttons.suspend()
+            alarms.append(alarm.pin.PinAlarm(buttons.pin, value=buttons.value_when_pressed, pull=buttons.pull))
+
+        start = monotonic_ns()
+        woke_by = alarm.light_sleep_until_alarms(*alarms)
+        self.asleep_ns += monotonic_ns() - start
+        self.wakes += 1
+
+        if not watch_button:
+            return False
+        pressed = isinstance(woke_by, alarm.pin.PinAlarm)
+        buttons.resume(pressed)
+        if pressed:
+            self.button_wakes += 1
+        return pressed
+
+    def report(self) -> str:
+        elapsed = monotonic_ns() - self.started
+        awake = 100 - 100 * self.asleep_ns / elapsed if elapsed else 100
+        radio = 100 * self.net.radio_on_time() * 1_000_000_000 / elapsed if elapsed else 100
+        return (f"Power: {'low power' if self.low_power else 'always on'}, awake {awake:.1f}% of the time, "
+                f"radio on {radio:.1f}%, {self.wakes} wakes from light sleep ({self.button_wakes} by the button)")
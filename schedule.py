@@ -0,0 +1,132 @@
+from array import array
+
+from launches import intern, make_record
+from timeutil import parse_t0
+from timezones import ZONES
+
+# Separates the fields of a line in the schedule file
+SEPARATOR = "|"
+
+
+def first_after(values, target: int) -> int:
+    # Index of the first item of a sorted array that's greater than target, len(values) if there's none.
+
+    low = 0
+    high = len(values)
+    while low < high:
+        middle = (low + high) // 2
+        if values[middle] <= target:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+class Schedule:
+    # A calendar of events (launches, competition sessions, birthdays...) read once from a text file on CIRCUITPY.
+    # Each line is "T-0 | name | line 2 | line 3 | line 4 | line 5", with the T-0 in UTC as "YYYY-MM-DDTHH:MMZ" and
+    # the other fields shown like a launch's (trailing ones can be left out). Lines starting with # are comments.
+    # A multi-day event can add "| days | time zone | city" (e.g. "| 17 | Europe/Rome | Milan") for the clock mode's
+    # day counter and second time.
+    # The events end up as LaunchRecords sorted by T-0, with their start times copied into an array so the next event
+    # is one binary search away. Strings repeated across lines (venues, countries) are only kept once.
+
+    def __init__(self, grace=60):
+        # grace (int) - default: 60 - seconds an event stays up after its T-0
+
+        self.grace = grace
+        self.starts = array("l")  # T-0 of every event, sorted, for first_after()
+        self.events: list = []  # LaunchRecords, in the same order as starts
+        self.spans: list = []  # (index into events, days, time zone, city) of every multi-day event, sorted by T-0
+        self.skipped: int = 0  # Lines that couldn't be read
+
+    def load(self, path: str) -> bool:
+        # Reads a schedule file, replacing any events already loaded. Returns False if there's no such file.
+        # path (str) - the file, e.g. "/schedule.txt"
+
+        strings = {}
+        rows = []
+        self.skipped = 0
+        try:
+            with open(path, "r") as file:
+                for line in file:
+                    line = line.strip()
+                    if not line or line.startswith("#"):
+                        continue
+                    fields = [field.strip() for field in line.split(SEPARATOR)]
+                    try:
+                        rows.append(self.read_row(strings, fields))
+                    except (ValueError, IndexError):
+                        self.skipped += 1
+                        print(f"Skipping schedule line: {line}")
+        except OSError:
+            return False
+
+        rows.sort(key=lambda row: row[0].t0)
+        self.starts = array("l", [row[0].t0 for row in rows])
+        self.events = [row[0] for row in rows]
+        self.spans = [(i,) + rows[i][1] for i in range(len(rows)) if rows[i][1] is not None]
+        return True
+
+    @staticmethod
+    def read_row(strings: dict, fields: list):
+        # (LaunchRecord, (days, time zone, city) or None) from one line split into its fields. Only the T-0 is
+        # required, missing text fields are left empty (e.g. "2026-12-25T06:00Z | Christmas").
+
+        while len(fields) < 6:
+            fields.append("")
+        record = make_record(strings, parse_t0(fields[0]), *fields[1:6])
+        if len(fields) == 7 and fields[6]:
+            raise ValueError("Multi-day event without a time zone")
+        if len(fields) < 8:
+            return record, None
+        if fields[7] not in ZONES:
+            raise ValueError(f"Unknown time zone {fields[7]}")
+        zone = intern(strings, fields[7])
+        city = fields[8] if len(fields) > 8 else zone[zone.rfind("/") + 1:].replace("_", " ")
+        return record, (int(fields[6]), zone, intern(strings, city))
+
+    def upcoming(self, now: int) -> int:
+        # Index of the first event that's still up at now (within grace of its T-0 or later).
+        return first_after(self.starts, now - self.grace)
+
+    def span(self, now: int):
+        # The multi-day event going on at now, or else the next one to start, as its entry in spans. None once the
+        # last one is over. There are only ever a few of them, so they're simply checked in order.
+
+        for entry in self.spans:
+            if now < self.starts[entry[0]] + entry[1] * 86400:
+                return entry
+        return None
+
+    def report(self) -> str:
+        return f"Schedule: {len(self.events)} events, {len(self.spans)} multi-day, {self.skipped} lines skipped"
+
+
+class Carousel:
+    # Takes turns showing the next few events of a Schedule. Each turn is a binary search and some integer math,
+    # so rotating allocates nothing, however long the calendar is.
+
+    def __init__(self, schedule: Schedule, window=3):
+        # schedule (Schedule) - the events to go through
+        # window (int) - default: 3 - how many of the next events take turns
+
+        self.schedule = schedule
+        self.window = window
+        self.turn: int = 0
+
+    def current(self, now: int):
+        # The event to show at now, or None if the schedule is empty. Once every event is over the last one stays up.
+
+        events = self.schedule.events
+        if not events:
+            return None
+        first = self.schedule.upcoming(now)
+        available = min(self.window, len(events) - first)
+        if available <= 0:
+            return events[-1]
+        return events[first + self.turn % available]
+
+    def advance(self):
+        # Moves on to the next event in the window.
+        self.turn += 1
@@ -0,0 +1,130 @@
+from adafruit_ticks import ticks_ms, ticks_add, ticks_diff
+from time import monotonic_ns, sleep
+
+
+class Task:
+    # A single job for the Scheduler. Deadlines are absolute ticks_ms values, so the time a callback takes to run
+    # never pushes back the next deadline.
+
+    def __init__(self, name: str, interval_ms: int, deadline: int, callback, repeat: bool, metric=None):
+        self.name = name
+        self.metric = metric  # Metrics histogram the callback's run time goes into, None to not time it
+        self.interval_ms = interval_ms
+        self.deadline = deadline
+        self.callback = callback
+        self.repeat = repeat
+        self.runs: int = 0
+        self.skipped: int = 0  # Deadlines dropped because the task fell more than a whole interval behind
+        self.late_total: int = 0
+        self.late_max: int = 0
+
+
+class Scheduler:
+    # Runs display ticks, scroll animation, button polling and refresh timers on absolute adafruit_ticks deadlines.
+    # Replaces the old "num_cycles * sleep(display_interval)" counting, where render time and button handling piled
+    # up on top of every sleep and a 120 second window really lasted much longer.
+
+    def __init__(self, idle=None, metrics=None):
+        # idle (function) - default: None - called with the seconds to wait between deadlines, time.sleep if None
+        # metrics (Metrics) - default: None - where the run times of tasks with a metric are recorded
+
+        self.tasks: list = []
+        self.running: bool = False
+        self.idle = sleep if idle is None else idle
+        self.metrics = metrics
+
+    def every(self, name: str, interval: float, callback, delay: float = 0, metric=None):
+        # Fires a callback repeatedly.
+        # name (str) - label used in the lateness report
+        # interval (float) - time (in seconds) between deadlines
+        # callback (function) - called with no arguments
+        # delay (float) - default: 0 - time (in seconds) before the first deadline
+        # metric (str) - default: None - metrics histogram for the callback's run time, e.g. "tick"
+
+        interval_ms = int(interval * 1000)
+        task = Task(name, interval_ms, ticks_add(ticks_ms(), int(delay * 1000)), callback, True, metric)
+        self.tasks.append(task)
+        return task
+
+    def after(self, name: str, delay: float, callback):
+        # Fires a callback once, delay (float) seconds from now.
+
+        task = Task(name, 0, ticks_add(ticks_ms(), int(delay * 1000)), callback, False)
+        self.tasks.append(task)
+        return task
+
+    def reschedule(self, task: Task, delay: float):
+        # Moves a task's next deadline to delay (float) seconds from now, e.g. to line it up with the wall clock.
+        task.deadline = ticks_add(ticks_ms(), int(delay * 1000))
+
+    def stop(self):
+        # Makes run() return as soon as the current callback finishes.
+        self.running = False
+
+    def _fire(self, task: Task, now: int):
+        late = ticks_diff(now, task.deadline)
+        task.runs += 1
+        task.late_total += late
+        if late > task.late_max:
+            task.late_max = late
+
+        if task.repeat:
+            task.deadline = ticks_add(task.deadline, task.interval_ms)
+            # If a slow callback made us miss whole intervals, drop them instead of firing a burst to catch up
+            while ticks_diff(task.deadline, now) <= 0:
+                task.deadline = ticks_add(task.deadline, task.interval_ms)
+                task.skipped += 1
+        else:
+            self.tasks.remove(task)
+
+        if task.metric is None or self.metrics is None or not self.metrics.enabled:
+            task.callback()
+            return
+        start = monotonic_ns()
+        task.callback()
+        self.metrics.since(task.metric, start)
+
+    def _run_due(self):
+        # Fires every task whose deadline has passed and returns how long (in milliseconds) until the next one,
+        # or None once nothing is left to wait for.
+
+        now = ticks_ms()
+        wait = None
+        for task in self.tasks[:]:
+            remaining = ticks_diff(task.deadline, now)
+            if remaining <= 0:
+                self._fire(task, now)
+                if not self.running:
+                    return None
+                remaining = ticks_diff(task.deadline, ticks_ms()) if task.repeat else None
+            if remaining is not None and (wait is None or remaining < wait):
+                wait = remaining
+        return wait
+
+    def run(self):
+        # Fires due tasks in the order they were added until stop() is called or no tasks are left.
+
+        self.running = True
+        while self.running and self.tasks:
+            wait = self._run_due()
+            if wait is not None and wait > 0:
+                self.idle(wait / 1000)
+
+    async def run_async(self):
+        # Same as run(), but awaits between deadlines so other asyncio tasks (e.g. network fetches) get to run.
+        import asyncio
+
+        self.running = True
+        while self.running and self.tasks:
+            wait = self._run_due()
+            await asyncio.sleep(wait / 1000 if wait is not None and wait > 0 else 0)
+
+    def report(self) -> str:
+        # One line per task with how late (in milliseconds) its callbacks ran compared to their deadlines.
+
+        lines = []
+        for task in self.tasks:
+            average = task.late_total / task.runs if task.runs else 0
+            lines.append(f"{task.name}: {task.runs} runs, late avg {average:.1f} ms / max {task.late_max} ms, "
+                         f"{task.skipped} skipped")
+        return "\n".join(lines)
@@ -0,0 +1,140 @@
+# Runs PicoCore on a normal computer. install() puts fake CircuitPython modules (displayio, fourwire, wifi,
+# socketpool, adafruit_requests, rtc, time, ...) into sys.modules, so the project's modules import unchanged:
+#
+#     import simulator
+#     sim = simulator.install()
+#     from core import PicoCore
+#     core = sim.attach(PicoCore())
+#     core.switch("launch")
+#
+# Everything imported after install() sees simulated time, so sleep() returns straight away and moves the virtual
+# clock forward instead. The standard library modules the simulator itself needs are imported before that happens.
+import asyncio  # noqa: F401
+import gc
+import os
+import shutil
+import sys
+import tempfile
+import time as host_time  # The computer's own clock, for timing the host CPU once `time` is the simulated one
+import tracemalloc
+import types
+
+from simulator import hardware, network, virtual_time
+from simulator.virtual_time import VirtualClock
+
+# Roughly what a Pico W has left for Python after CircuitPython itself
+HEAP_SIZE = 120_000
+
+_installed = None  # The Simulation the fake modules talk to, once install() has run
+
+
+class Simulation:
+    def __init__(self, clock: VirtualClock):
+        self.clock = clock
+        self.radio = network.Radio(clock)
+        self.server = network.HttpServer(clock)
+        self.edges: list = []  # Scripted button edges, (seconds since the start, pressed)
+        # Stands in for the CIRCUITPY drive, so FlashCache never writes to the computer's own root directory
+        self.drive = tempfile.mkdtemp(prefix="circuitpy-")
+        # The files that get copied onto the drive next to code.py
+        shutil.copy(os.path.join(os.path.dirname(os.path.dirname(__file__)), "schedule.txt"), self.drive)
+        self.light_sleeps: int = 0
+
+    def attach(self, core):
+        # Points a PicoCore at the simulated drive. Call it before the first switch(), which is when modes open files.
+        core.drive = self.drive + os.sep
+        return core
+
+    def press(self, at: float, duration=0.1):
+        # Scripts a button press: down at `at` seconds into the simulation, up again `duration` seconds later.
+
+        self.edges.append((at, True))
+        self.edges.append((at + duration, False))
+        self.edges.sort()
+
+    def _feed_keys(self):
+        # Hands every scripted edge that's now in the past to keypad, stamped with its own time
+        keys = hardware.Keys.latest
+        while keys is not None and self.edges and self.edges[0][0] <= self.clock.monotonic():
+            at, pressed = self.edges.pop(0)
+            keys.edge(pressed, virtual_time.ticks_add(0, int(at * 1000)))
+
+    def light_sleep(self, *alarms):
+        # alarm.light_sleep_until_alarms(): jumps ahead to the time alarm, or to the next scripted press if a pin
+        # alarm is set and the press comes first. Returns the alarm that fired.
+
+        woke_by = None
+        wake_at = None
+        for alarm in alarms:
+            if isinstance(alarm, hardware.TimeAlarm) and (wake_at is None or alarm.monotonic_time < wake_at):
+                woke_by, wake_at = alarm, alarm.monotonic_time
+        for alarm in alarms:
+            if isinstance(alarm, hardware.PinAlarm):
+                presses = [at for at, pressed in self.edges if pressed]
+                if presses and (wake_at is None or presses[0] < wake_at):
+                    woke_by, wake_at = alarm, presses[0]
+        self.light_sleeps += 1
+        self.clock.sleep(max(0.0, wake_at - self.clock.monotonic()))
+        return woke_by
+
+    @staticmethod
+    def display():
+        # The most recently created fake ST7735R
+        return hardware.Display.latest
+
+    def label_writes(self, group) -> int:
+        # Total .text assignments on every label under a group
+        total = 0
+        for child in group.children:
+            if isinstance(child, hardware.Group):
+                total += self.label_writes(child)
+            elif isinstance(child, hardware.Label):
+                total += child.text_writes
+        return total
+
+
+def _mem_free() -> int:
+    if not tracemalloc.is_tracing():
+        return HEAP_SIZE
+    return max(0, HEAP_SIZE - tracemalloc.get_traced_memory()[0])
+
+
+def _alarm_modules(simulation: Simulation) -> dict:
+    alarm = types.ModuleType("alarm")
+    alarm.time = types.ModuleType("alarm.time")
+    alarm.time.TimeAlarm = hardware.TimeAlarm
+    alarm.pin = types.ModuleType("alarm.pin")
+    alarm.pin.PinAlarm = hardware.PinAlarm
+    alarm.light_sleep_until_alarms = simulation.light_sleep
+    return {"alarm": alarm, "alarm.time": alarm.time, "alarm.pin": alarm.pin}
+
+
+def install(clock=None) -> Simulation:
+    # Installs the fake modules and returns the Simulation they talk to. Without a clock, a second call returns the
+    # simulation that's already installed, e.g. when the tests import a benchmark.
+    # clock (VirtualClock) - default: None - a clock with custom start time, unset RTC or drift
+
+    global _installed
+    if clock is None and _installed is not None:
+        return _installed
+    clock = VirtualClock() if clock is None else clock
+    simulation = Simulation(clock)
+
+    fakes = {}
+    fakes.update(virtual_time.modules(clock))
+    fakes.update(hardware.modules())
+    hardware.Display.clock = clock
+    fakes.update(network.modules(clock, simulation.radio, simulation.server))
+    fakes.update(_alarm_modules(simulation))
+    sys.modules.update(fakes)
+
+    # CircuitPython's gc reports free heap, CPython's doesn't
+    if not hasattr(gc, "mem_free"):
+        gc.mem_free = _mem_free
+        gc.mem_alloc = lambda: HEAP_SIZE - _mem_free()
+
+    # displayio refreshes in the background whenever user code sleeps, which is when the bus traffic happens
+    clock.sleep_hooks.append(lambda: hardware.Display.latest is not None and hardware.Display.latest.background())
+    clock.sleep_hooks.append(simulation._feed_keys)
+    _installed = simulation
+    return simulation
@@ -0,0 +1,564 @@
+import types
+
+# terminalio.FONT glyphs are 6x12 pixels
+GLYPH_WIDTH = 6
+GLYPH_HEIGHT = 12
+
+# Every rectangle pushed to the ST7735R costs a column address, row address and memory write command on top of
+# the pixel data itself (2 bytes per pixel in RGB565)
+RECT_OVERHEAD = 11
+BYTES_PER_PIXEL = 2
+
+
+class Pin:
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self):
+        return f"board.{self.name}"
+
+
+class SPI:
+    def __init__(self, clock=None, MOSI=None, MISO=None):
+        self.clock = clock
+        self.MOSI = MOSI
+
+
+class Direction:
+    INPUT = "input"
+    OUTPUT = "output"
+
+
+class Pull:
+    UP = "up"
+    DOWN = "down"
+
+
+class DigitalInOut:
+    # Pins keep whatever value is written to them. The button goes through keypad instead, see Simulation.press().
+
+    def __init__(self, pin: Pin):
+        self.pin = pin
+        self.direction = Direction.INPUT
+        self.pull = None
+        self.value = False
+
+    def deinit(self):
+        pass
+
+
+class KeyEvent:
+    def __init__(self, key_number=0, pressed=True, timestamp=0):
+        self.key_number = key_number
+        self.pressed = pressed
+        self.timestamp = timestamp
+
+    @property
+    def released(self) -> bool:
+        return not self.pressed
+
+
+class EventQueue:
+    def __init__(self, max_events=64):
+        self.max_events = max_events
+        self.events: list = []
+        self.overflowed = False
+
+    def put(self, event: KeyEvent):
+        if len(self.events) >= self.max_events:
+            self.overflowed = True
+            return
+        self.events.append(event)
+
+    def get_into(self, event: KeyEvent) -> bool:
+        if not self.events:
+            return False
+        queued = self.events.pop(0)
+        event.key_number = queued.key_number
+        event.pressed = queued.pressed
+        event.timestamp = queued.timestamp
+        return True
+
+    def get(self):
+        return self.events.pop(0) if self.events else None
+
+    def clear(self):
+        self.events = []
+        self.overflowed = False
+
+    def __len__(self):
+        return len(self.events)
+
+
+class Keys:
+    # keypad.Keys. The simulation feeds it edges with edge(), stamped with the time they happened at, the way the
+    # real one scans in the background.
+
+    latest = None
+
+    def __init__(self, pins, *, value_when_pressed: bool, pull=True, interval=0.02, max_events=64):
+        Keys.latest = self
+        self.pins = pins
+        self.key_count = len(pins)
+        self.events = EventQueue(max_events)
+
+    def edge(self, pressed: bool, timestamp: int, key_number=0):
+        self.events.put(KeyEvent(key_number, pressed, timestamp))
+
+    def deinit(self):
+        # Scripted edges wait for the next Keys, like a press during light sleep that keypad only sees afterwards
+        if Keys.latest is self:
+            Keys.latest = None
+
+
+class TimeAlarm:
+    # alarm.time.TimeAlarm
+    def __init__(self, *, monotonic_time=None, epoch_time=None):
+        self.monotonic_time = monotonic_time
+
+
+class PinAlarm:
+    # alarm.pin.PinAlarm
+    def __init__(self, pin, value: bool, edge=False, pull=False):
+        self.pin = pin
+        self.value = value
+        self.pull = pull
+
+
+class FourWire:
+    # Counts what would go over SPI to the screen.
+
+    def __init__(self, spi, command=None, chip_select=None, reset=None, baudrate=24000000):
+        self.spi = spi
+        self.baudrate = baudrate
+        self.bytes_sent: int = 0
+        self.transactions: int = 0
+
+    def send(self, size: int):
+        self.bytes_sent += size
+        self.transactions += 1
+
+
+class Rect:
+    def __init__(self, x1: int, y1: int, x2: int, y2: int):
+        self.x1 = x1
+        self.y1 = y1
+        self.x2 = x2
+        self.y2 = y2
+
+    @property
+    def area(self) -> int:
+        return max(0, self.x2 - self.x1) * max(0, self.y2 - self.y1)
+
+
+class Display:
+    # Stand-in for adafruit_st7735r.ST7735R / displayio.Display. Changed areas pile up as dirty rectangles and are
+    # "sent" over the bus on refresh(), or after every sleep while auto_refresh is on, like displayio's background
+    # refresh.
+    # refresh() with a target frame rate paces itself like displayio's: it waits out the rest of the frame period, or
+    # skips the frame (returning False) when the previous call was more than one period ago.
+
+    latest = None
+    clock = None  # The VirtualClock that refresh() waits on, set by simulator.install()
+
+    def __init__(self, bus: FourWire, width=128, height=160, **kwargs):
+        Display.latest = self
+        self.bus = bus
+        self.width = width
+        self.height = height
+        self.rotation = kwargs.get("rotation", 0)
+        self.auto_refresh = True
+        self._root_group = None
+        self.dirty: list = []
+        self.frames: int = 0
+        self.refresh_calls: int = 0
+        self.skipped_refreshes: int = 0
+        self.pixels_sent: int = 0
+        self.last_refresh_call = None  # monotonic_ns of the last manual refresh() call
+        self.last_refresh = None  # monotonic_ns of the last refresh that went out
+
+    @property
+    def root_group(self):
+        return self._root_group
+
+    @root_group.setter
+    def root_group(self, group):
+        self._root_group = group
+        group.display = self
+        self.mark_dirty(Rect(0, 0, self.width, self.height))
+
+    def mark_dirty(self, rect: Rect):
+        x1 = max(0, rect.x1)
+        y1 = max(0, rect.y1)
+        x2 = min(self.width, rect.x2)
+        y2 = min(self.height, rect.y2)
+        if x2 > x1 and y2 > y1:
+            self.dirty.append(Rect(x1, y1, x2, y2))
+
+    def flush(self) -> int:
+        # Sends every dirty rectangle and returns the number of bytes that took
+        if not self.dirty:
+            return 0
+        sent = 0
+        for rect in self.dirty:
+            size = rect.area * BYTES_PER_PIXEL + RECT_OVERHEAD
+            self.bus.send(size)
+            self.pixels_sent += rect.area
+            sent += size
+        self.dirty = []
+        self.frames += 1
+        return sent
+
+    def refresh(self, target_frames_per_second=None, minimum_frames_per_second=0) -> bool:
+        self.refresh_calls += 1
+        now = self.clock.monotonic_ns()
+        if target_frames_per_second is not None and self.last_refresh is not None:
+            period = 1_000_000_000 // target_frames_per_second
+            since_call = now - self.last_refresh_call
+            self.last_refresh_call = now
+            if since_call > period:
+                self.skipped_refreshes += 1
+                return False
+            self.clock.sleep((period - (now - self.last_refresh) % period) / 1e9)
+        self.last_refresh_call = self.last_refresh = self.clock.monotonic_ns()
+        self.flush()
+        return True
+
+    def background(self):
+        if self.auto_refresh:
+            self.flush()
+
+
+class Group:
+    def __init__(self, scale=1, x=0, y=0):
+        self.scale = scale
+        self.x = x
+        self.y = y
+        self.hidden = False
+        self.parent = None
+        self.display = None
+        self.children: list = []
+
+    def append(self, child):
+        child.parent = self
+        self.children.append(child)
+        child._changed()
+
+    def insert(self, index: int, child):
+        child.parent = self
+        self.children.insert(index, child)
+        child._changed()
+
+    def remove(self, child):
+        self.children.remove(child)
+        child._changed()
+        child.parent = None
+
+    def pop(self, index=-1):
+        child = self.children[index]
+        self.remove(child)
+        return child
+
+    def __len__(self):
+        return len(self.children)
+
+    def __getitem__(self, index):
+        return self.children[index]
+
+    def _display(self):
+        node = self
+        while node.parent is not None:
+            node = node.parent
+        return node.display
+
+    def _to_screen(self, x: int, y: int, w: int, h: int) -> Rect:
+        # Maps a rectangle inside this group to screen coordinates
+        node = self
+        while node is not None:
+            x = node.x + x * node.scale
+            y = node.y + y * node.scale
+            w *= node.scale
+            h *= node.scale
+            node = node.parent
+        return Rect(x, y, x + w, y + h)
+
+    def _changed(self):
+        pass
+
+
+class Node:
+    # Anything drawn inside a Group: knows its own box and reports it dirty when it changes.
+
+    def __init__(self, x=0, y=0):
+        self.x = x
+        self.y = y
+        self.parent = None
+
+    def box(self):
+        # (x, y, width, height) inside the parent group
+        return self.x, self.y, 0, 0
+
+    def _changed(self, box=None):
+        if self.parent is None:
+            return
+        display = self.parent._display()
+        if display is None:
+            return
+        x, y, w, h = self.box() if box is None else box
+        display.mark_dirty(self.parent._to_screen(x, y, w, h))
+
+
+class Bitmap:
+    def __init__(self, width: int, height: int, value_count: int):
+        self.width = width
+        self.height = height
+        self.value_count = value_count
+        self.data = bytearray(width * height)
+        self.writes: int = 0
+
+    def __setitem__(self, index, value):
+        x, y = index if isinstance(index, tuple) else (index % self.width, index // self.width)
+        self.data[y * self.width + x] = value
+        self.writes += 1
+
+    def __getitem__(self, index):
+        x, y = index if isinstance(index, tuple) else (index % self.width, index // self.width)
+        return self.data[y * self.width + x]
+
+    def fill(self, value: int):
+        for i in range(len(self.data)):
+            self.data[i] = value
+
+
+class Palette:
+    def __init__(self, color_count: int):
+        self.colors = [0] * color_count
+        self.transparent: set = set()
+
+    def __setitem__(self, index: int, color):
+        self.colors[index] = color
+
+    def __getitem__(self, index: int):
+        return self.colors[index]
+
+    def __len__(self):
+        return len(self.colors)
+
+    def make_transparent(self, index: int):
+        self.transparent.add(index)
+
+
+class TileGrid(Node):
+    def __init__(self, bitmap, pixel_shader=None, width=1, height=1, tile_width=None, tile_height=None,
+                 default_tile=0, x=0, y=0):
+        super().__init__(x, y)
+        self.bitmap = bitmap
+        self.pixel_shader = pixel_shader
+        self.width = width
+        self.height = height
+        self.tile_width = bitmap.width if tile_width is None else tile_width
+        self.tile_height = bitmap.height if tile_height is None else tile_height
+        self.tiles = [default_tile] * (width * height)
+        self.tile_writes: int = 0
+
+    def box(self):
+        return self.x, self.y, self.width * self.tile_width, self.height * self.tile_height
+
+    def __setitem__(self, index, value: int):
+        if isinstance(index, tuple):
+            index = index[1] * self.width + index[0]
+        if self.tiles[index] == value:
+            return
+        self.tiles[index] = value
+        self.tile_writes += 1
+        # Only the one tile changes on screen
+        column = index % self.width
+        row = index // self.width
+        self._changed((self.x + column * self.tile_width, self.y + row * self.tile_height,
+                       self.tile_width, self.tile_height))
+
+    def __getitem__(self, index):
+        if isinstance(index, tuple):
+            index = index[1] * self.width + index[0]
+        return self.tiles[index]
+
+
+class Glyph:
+    def __init__(self, bitmap, tile_index: int):
+        self.bitmap = bitmap
+        self.tile_index = tile_index
+        self.width = GLYPH_WIDTH
+        self.height = GLYPH_HEIGHT
+        self.dx = 0
+        self.dy = 0
+        self.shift_x = GLYPH_WIDTH
+        self.shift_y = 0
+
+
+class Font:
+    # terminalio.FONT: printable ASCII side by side in one bitmap. The glyph shapes are made up, but stable from run
+    # to run, which is all the atlas code needs.
+
+    def __init__(self):
+        self.bitmap = Bitmap(GLYPH_WIDTH * 95, GLYPH_HEIGHT, 2)
+        for code in range(33, 127):
+            left = (code - 32) * GLYPH_WIDTH
+            for y in range(1, GLYPH_HEIGHT - 1):
+                for x in range(GLYPH_WIDTH - 1):
+                    if (code * 31 + x * 7 + y * 13) % 5 < 2:
+                        self.bitmap.data[y * self.bitmap.width + left + x] = 1
+
+    def get_bounding_box(self):
+        return GLYPH_WIDTH, GLYPH_HEIGHT
+
+    def get_glyph(self, codepoint: int):
+        if not 32 <= codepoint < 127:
+            return None
+        return Glyph(self.bitmap, codepoint - 32)
+
+
+FONT = Font()
+
+
+class Label(Node):
+    # adafruit_display_text.label.Label. Every .text assignment rebuilds the label, so the old and the new text areas
+    # both go dirty, even when the text didn't change.
+
+    def __init__(self, font, text="", color=0xFFFFFF, x=0, y=0, scale=1, **kwargs):
+        super().__init__(x, y)
+        self.font = font
+        self.color = color
+        self.scale = scale
+        self._text = text
+        self.text_writes: int = 0
+
+    def box(self):
+        width = len(self._text) * GLYPH_WIDTH * self.scale
+        height = GLYPH_HEIGHT * self.scale
+        return self.x, self.y - height // 2, width, height
+
+    @property
+    def bounding_box(self):
+        x, y, w, h = self.box()
+        return 0, -h // 2, w, h
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @text.setter
+    def text(self, value: str):
+        if not isinstance(value, str):
+            raise TypeError("Label text must be a str")
+        self._changed()
+        self._text = value
+        self.text_writes += 1
+        self._changed()
+
+
+class ScrollingLabel(Label):
+    # adafruit_display_text.scrolling_label.ScrollingLabel: shows max_characters of a longer text at a time and moves
+    # one character along on every update() once animate_time has passed (or when forced).
+
+    def __init__(self, font, max_characters=10, text="", animate_time=0.3, current_index=0, **kwargs):
+        self.max_characters = max_characters
+        self.animate_time = animate_time
+        self.current_index = current_index
+        self.full_text = text
+        self.updates: int = 0
+        super().__init__(font, text=text[:max_characters] if len(text) > max_characters else text, **kwargs)
+
+    @property
+    def text(self) -> str:
+        return self.full_text
+
+    @text.setter
+    def text(self, value: str):
+        if not isinstance(value, str):
+            raise TypeError("Label text must be a str")
+        self.full_text = value
+        self.current_index = 0
+        self._show(value[:self.max_characters] if len(value) > self.max_characters else value)
+        self.text_writes += 1
+
+    def _show(self, shown: str):
+        self._changed()
+        self._text = shown
+        self._changed()
+
+    def update(self, force=False):
+        if len(self.full_text) <= self.max_characters:
+            return
+        self.updates += 1
+        padded = self.full_text + "  "
+        self.current_index = (self.current_index + 1) % len(padded)
+        shown = (padded + padded)[self.current_index:self.current_index + self.max_characters]
+        self._show(shown)
+
+
+class Circle(Node):
+    def __init__(self, x0: int, y0: int, r: int, fill=None, outline=None, stroke=1):
+        super().__init__(x0 - r, y0 - r)
+        self.r = r
+
+    def box(self):
+        return self.x, self.y, self.r * 2 + 1, self.r * 2 + 1
+
+
+def release_displays():
+    pass
+
+
+def modules() -> dict:
+    # Replacement modules for the pico's hardware, keyed by import name.
+
+    pins = {}
+    for name in ("GP0", "GP10", "GP11", "GP16", "GP17", "GP18", "LED"):
+        pins[name] = Pin(name)
+    board = types.ModuleType("board")
+    board.__dict__.update(pins)
+    board_definitions = types.ModuleType("board_definitions")
+    pico_w = types.ModuleType("board_definitions.raspberry_pi_pico_w")
+    pico_w.__dict__.update(pins)
+    board_definitions.raspberry_pi_pico_w = pico_w
+
+    displayio = types.ModuleType("displayio")
+    for name, value in (("Group", Group), ("Bitmap", Bitmap), ("Palette", Palette), ("TileGrid", TileGrid),
+                        ("release_displays", release_displays), ("Display", Display)):
+        setattr(displayio, name, value)
+
+    display_text = types.ModuleType("adafruit_display_text")
+    label = types.ModuleType("adafruit_display_text.label")
+    label.Label = Label
+    scrolling_label = types.ModuleType("adafruit_display_text.scrolling_label")
+    scrolling_label.ScrollingLabel = ScrollingLabel
+    display_text.label = label
+    display_text.scrolling_label = scrolling_label
+
+    shapes = types.ModuleType("adafruit_display_shapes")
+    circle = types.ModuleType("adafruit_display_shapes.circle")
+    circle.Circle = Circle
+    shapes.circle = circle
+
+    result = {
+        "board": board,
+        "board_definitions": board_definitions,
+        "board_definitions.raspberry_pi_pico_w": pico_w,
+        "displayio": displayio,
+        "adafruit_display_text": display_text,
+        "adafruit_display_text.label": label,
+        "adafruit_display_text.scrolling_label": scrolling_label,
+        "adafruit_display_shapes": shapes,
+        "adafruit_display_shapes.circle": circle,
+    }
+    for name, attributes in (
+            ("busio", {"SPI": SPI}),
+            ("digitalio", {"DigitalInOut": DigitalInOut, "Direction": Direction, "Pull": Pull}),
+            ("fourwire", {"FourWire": FourWire}),
+            ("keypad", {"Keys": Keys, "Event": KeyEvent, "EventQueue": EventQueue}),
+            ("terminalio", {"FONT": FONT}),
+            ("adafruit_st7735r", {"ST7735R": Display})):
+        module = types.ModuleType(name)
+        module.__dict__.update(attributes)
+        result[name] = module
+    return result
@@ -0,0 +1,235 @@
+import json
+import os
+import types
+import zlib
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "fixtures")
+
+
+def fixture(name: str) -> bytes:
+    with open(os.path.join(FIXTURES, name), "rb") as file:
+        return file.read()
+
+
+class Radio:
+    # wifi.radio. Set fail_connects to make the next connect() calls raise ConnectionError, and connect_seconds to
+    # make joining the network take time like it does on the pico.
+
+    def __init__(self, clock):
+        self.clock = clock
+        self._enabled = True
+        self.connected = False
+        self.ipv4_address = None
+        self.fail_connects: int = 0
+        self.connects: int = 0
+        self.connect_seconds: float = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool):
+        self._enabled = value
+        if not value:
+            self.disconnect()
+
+    def connect(self, ssid, password=None, **kwargs):
+        self.connects += 1
+        if self.connect_seconds:
+            self.clock.sleep(self.connect_seconds)
+        if self.fail_connects > 0 or not self.enabled:
+            self.fail_connects -= 1
+            raise ConnectionError("No network with that ssid")
+        self.connected = True
+        self.ipv4_address = "192.168.4.2"
+
+    def disconnect(self):
+        self.connected = False
+        self.ipv4_address = None
+
+
+class SocketPool:
+    def __init__(self, radio):
+        self.radio = radio
+
+
+class ConnectionManager:
+    # adafruit_connection_manager: one socket pool and TLS context per radio, shared by everything that asks.
+
+    pools: dict = {}
+    closes: int = 0
+
+    @staticmethod
+    def get_radio_socketpool(radio):
+        if id(radio) not in ConnectionManager.pools:
+            ConnectionManager.pools[id(radio)] = SocketPool(radio)
+        return ConnectionManager.pools[id(radio)]
+
+    @staticmethod
+    def get_radio_ssl_context(radio):
+        return "ssl-context"
+
+    @staticmethod
+    def connection_manager_close_all(socket_pool=None, release_references=False):
+        ConnectionManager.closes += 1
+
+
+# What a proxy in front of the API answers while the API itself is down
+BAD_GATEWAY = b"<html><head><title>502 Bad Gateway</title></head><body><h1>502 Bad Gateway</h1></body></html>"
+# What a hotel or café network answers (with a 200) until its terms are accepted, whatever the URL
+CAPTIVE_PORTAL = (b"<!DOCTYPE html><html><body><form action=/login><button>Accept and connect</button></form>"
+                  b"</body></html>")
+
+
+class HttpServer:
+    # Local stand-in for rocketlaunch.live and timeapi.io that answers from the recorded fixtures.
+    # Launch responses carry an ETag, so conditional requests get a 304 until the fixture is swapped with serve().
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.requests: int = 0
+        self.not_modified: int = 0
+        self.bytes_served: int = 0
+        self.fail_requests: int = 0  # Raise OSError for this many of the next requests
+        self.error_responses: int = 0  # Answer this many of the next launch requests with a 502 error page
+        self.portal_responses: int = 0  # Then answer this many with a captive portal's login page
+        self.max_age = 0
+        self.bodies: dict = {}
+        self.serve(fixture("rocketlaunch_next_5.json"))
+
+    def serve(self, launches: bytes):
+        # Replaces the launch data, e.g. to simulate rocketlaunch.live updating a T-0.
+        # The /next/N bodies are built here, so serving a request doesn't add to the allocations being measured.
+
+        content = json.loads(launches)
+        results = content["result"]
+        self.bodies = {}
+        for count in range(1, len(results) + 1):
+            content["result"] = results[:count]
+            content["count"] = content["limit"] = count
+            self.bodies[count] = json.dumps(content, separators=(",", ":")).encode()
+
+    def handle(self, url: str, headers: dict):
+        # Returns (status code, headers, body) for a GET.
+
+        self.requests += 1
+        if self.fail_requests > 0:
+            self.fail_requests -= 1
+            raise OSError(-2, "Name or service not known")
+
+        if url.startswith("https://fdo.rocketlaunch.live/json/launches/next/") and self.error_responses > 0:
+            self.error_responses -= 1
+            return 502, {"content-type": "text/html"}, BAD_GATEWAY
+        if url.startswith("https://fdo.rocketlaunch.live/json/launches/next/") and self.portal_responses > 0:
+            self.portal_responses -= 1
+            return 200, {"content-type": "text/html"}, CAPTIVE_PORTAL
+
+        if url.startswith("https://fdo.rocketlaunch.live/json/launches/next/"):
+            count = int(url.rsplit("/", 1)[1])
+            body = self.bodies[min(count, len(self.bodies))]
+            etag = f'"{zlib.crc32(body):08x}"'
+            response_headers = {"content-type": "application/json", "etag": etag}
+            if self.max_age:
+                response_headers["cache-control"] = f"max-age={self.max_age}"
+            if headers.get("If-None-Match") == etag:
+                self.not_modified += 1
+                return 304, response_headers, b""
+            return 200, response_headers, body
+
+        if url.startswith("http://timeapi.io/api/time/current/zone"):
+            return 200, {"content-type": "application/json"}, fixture("timeapi_chicago.json")
+
+        return 404, {"content-type": "text/plain"}, b"Not found"
+
+
+class Response:
+    def __init__(self, server: HttpServer, status_code: int, headers: dict, body: bytes):
+        self.server = server
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+        self.position = 0
+        self.closed = False
+
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        while self.position < len(self.body):
+            chunk = self.body[self.position:self.position + chunk_size]
+            self.position += len(chunk)
+            self.server.bytes_served += len(chunk)
+            yield chunk
+
+    @property
+    def content(self) -> bytes:
+        return b"".join(self.iter_content(len(self.body) or 1))
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8")
+
+    def json(self):
+        return json.loads(self.content)
+
+    def close(self):
+        self.closed = True
+
+
+class Session:
+    # adafruit_requests.Session talking to the HttpServer of the running simulation.
+
+    server = None
+
+    def __init__(self, socket_pool=None, ssl_context=None):
+        self.socket_pool = socket_pool
+        self.ssl_context = ssl_context
+
+    def request(self, method: str, url: str, data=None, json=None, headers=None, stream=False, timeout=60):
+        if self.socket_pool is not None and not self.socket_pool.radio.connected:
+            raise OSError(-2, "Not connected to a network")
+        status_code, response_headers, body = Session.server.handle(url, headers or {})
+        return Response(Session.server, status_code, response_headers, body)
+
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+
+class NTP:
+    # adafruit_ntp.NTP answering with the simulation's true time.
+
+    clock = None
+
+    def __init__(self, socket_pool, *, server="0.adafruit.pool.ntp.org", port=123, tz_offset=0, socket_timeout=10):
+        self.socket_pool = socket_pool
+        self.tz_offset = tz_offset
+
+    @property
+    def utc_ns(self) -> int:
+        return NTP.clock.true_time() * 1_000_000_000
+
+    @property
+    def datetime(self):
+        if not self.socket_pool.radio.connected:
+            raise OSError(-2, "Not connected to a network")
+        return NTP.clock.localtime(NTP.clock.true_time() + int(self.tz_offset * 3600))
+
+
+def modules(clock, radio: Radio, server: HttpServer) -> dict:
+    # Replacement networking modules, keyed by import name.
+
+    Session.server = server
+    NTP.clock = clock
+
+    wifi = types.ModuleType("wifi")
+    wifi.radio = radio
+    socketpool = types.ModuleType("socketpool")
+    socketpool.SocketPool = SocketPool
+    requests = types.ModuleType("adafruit_requests")
+    requests.Session = Session
+    ntp = types.ModuleType("adafruit_ntp")
+    ntp.NTP = NTP
+    manager = types.ModuleType("adafruit_connection_manager")
+    manager.get_radio_socketpool = ConnectionManager.get_radio_socketpool
+    manager.get_radio_ssl_context = ConnectionManager.get_radio_ssl_context
+    manager.connection_manager_close_all = ConnectionManager.connection_manager_close_all
+    return {"wifi": wifi, "socketpool": socketpool, "adafruit_requests": requests, "adafruit_ntp": ntp,
+            "adafruit_connection_manager": manager}
@@ -0,0 +1,115 @@
+import time as _real_time
+import types
+
+# Start of the simulated wall clock: 2026-10-17T12:00:00Z
+DEFAULT_START = 1792238400
+
+_TICKS_PERIOD = 1 << 29
+
+
+class VirtualClock:
+    # Simulated time for everything the project reads from `time`, `adafruit_ticks` and `rtc`.
+    # sleep() returns immediately and moves the clock forward instead, so minutes of device time run in milliseconds.
+    # The RTC is kept apart from the "true" time that NTP reports, so it can start unset or drift.
+
+    def __init__(self, start=DEFAULT_START, rtc_set=True, drift_ppm=0.0):
+        # start (int) - default: DEFAULT_START - true UTC epoch seconds when the simulation starts
+        # rtc_set (bool) - default: True - False starts the RTC at 2000-01-01 like a pico that just got power
+        # drift_ppm (float) - default: 0.0 - how fast the RTC runs compared to the true time
+
+        self.ns = 0  # Monotonic time since the simulation started
+        self.start = start
+        self.rtc_base = start if rtc_set else 946684800
+        self.rtc_set_at = 0
+        self.drift_ppm = drift_ppm
+        self.sleeps: int = 0
+        self.slept_ns: int = 0
+        self.sleep_hooks: list = []  # Called after every sleep(), e.g. to let displayio auto-refresh
+
+    # Monotonic time
+    def monotonic_ns(self) -> int:
+        return self.ns
+
+    def monotonic(self) -> float:
+        return self.ns / 1_000_000_000
+
+    def ticks_ms(self) -> int:
+        return (self.ns // 1_000_000) % _TICKS_PERIOD
+
+    def sleep(self, seconds: float):
+        step = int(seconds * 1_000_000_000)
+        if step > 0:
+            self.ns += step
+            self.slept_ns += step
+        self.sleeps += 1
+        for hook in self.sleep_hooks:
+            hook()
+
+    # Wall clock
+    def true_time(self) -> int:
+        # What an NTP server would answer right now
+        return self.start + self.ns // 1_000_000_000
+
+    def time(self) -> int:
+        # What the RTC reads right now, like CircuitPython's time.time()
+        elapsed = self.ns - self.rtc_set_at
+        return self.rtc_base + int(elapsed * (1 + self.drift_ppm / 1_000_000)) // 1_000_000_000
+
+    def set_rtc(self, struct_time):
+        self.rtc_base = _epoch(struct_time)
+        self.rtc_set_at = self.ns
+
+    def localtime(self, seconds=None):
+        return _real_time.gmtime(self.time() if seconds is None else seconds)
+
+
+def _epoch(struct_time) -> int:
+    import calendar
+    return calendar.timegm(tuple(struct_time)[:6] + (0, 0, 0))
+
+
+def ticks_add(ticks: int, delta: int) -> int:
+    return (ticks + delta) % _TICKS_PERIOD
+
+
+def ticks_diff(ticks1: int, ticks2: int) -> int:
+    diff = (ticks1 - ticks2) & (_TICKS_PERIOD - 1)
+    return ((diff + _TICKS_PERIOD // 2) & (_TICKS_PERIOD - 1)) - _TICKS_PERIOD // 2
+
+
+def ticks_less(ticks1: int, ticks2: int) -> bool:
+    return ticks_diff(ticks1, ticks2) < 0
+
+
+def modules(clock: VirtualClock) -> dict:
+    # Replacement `time`, `adafruit_ticks` and `rtc` modules driven by clock.
+
+    time_module = types.ModuleType("time")
+    for name in dir(_real_time):
+        if not name.startswith("__"):
+            setattr(time_module, name, getattr(_real_time, name))
+    time_module.sleep = clock.sleep
+    time_module.monotonic = clock.monotonic
+    time_module.monotonic_ns = clock.monotonic_ns
+    time_module.time = clock.time
+    time_module.localtime = clock.localtime
+
+    ticks_module = types.ModuleType("adafruit_ticks")
+    ticks_module.ticks_ms = clock.ticks_ms
+    ticks_module.ticks_add = ticks_add
+    ticks_module.ticks_diff = ticks_diff
+    ticks_module.ticks_less = ticks_less
+
+    class RTC:
+        @property
+        def datetime(self):
+            return clock.localtime()
+
+        @datetime.setter
+        def datetime(self, value):
+            clock.set_rtc(value)
+
+    rtc_module = types.ModuleType("rtc")
+    rtc_module.RTC = RTC
+
+    return {"time": time_module, "adafruit_ticks": ticks_module, "rtc": rtc_module}
@@ -0,0 +1,19 @@
+# The tests import the modules from the repo root, like code.py on the pico, with the simulator's fake CircuitPython
+# modules installed first so everything that needs keypad, adafruit_ticks or wifi imports too:
+#   python -m pytest -q
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import simulator  # noqa: E402
+
+SIMULATION = simulator.install()
+
+
+@pytest.fixture
+def sim():
+    return SIMULATION
@@ -0,0 +1,31 @@
+# The budgets of benchmarks/simulate.py, one test per measurement. They share one PicoCore and run in order, like
+# the script does.
+
+import pytest
+
+from benchmarks import simulate
+
+
+@pytest.fixture(scope="module")
+def core():
+    return simulate.setup()
+
+
+def over_budget(results: dict) -> dict:
+    return {name: value for name, value in results.items() if not simulate.within_budget(name, value)}
+
+
+def test_fetch(core):
+    assert over_budget(simulate.measure_fetch(core)) == {}
+
+
+def test_loop(core):
+    assert over_budget(simulate.measure_loop(core)) == {}
+
+
+def test_switch(core):
+    assert over_budget(simulate.measure_switch(core)) == {}
+
+
+def test_frames(core):
+    assert over_budget(simulate.measure_frames(core)) == {}
@@ -0,0 +1,51 @@
+from board import GP0
+from buttons import ButtonEvents, SHORT, LONG, DOUBLE
+
+
+def gestures(sim, buttons: ButtonEvents, presses, seconds=3.0) -> list:
+    # Scripts (seconds from now, hold time) presses and polls every 50 ms like PicoCore, returning
+    # (gesture, seconds from now) for everything poll() hands out
+    start = sim.clock.monotonic()
+    for at, hold in presses:
+        sim.press(start + at, hold)
+    seen = []
+    while sim.clock.monotonic() - start < seconds:
+        sim.clock.sleep(0.05)
+        gesture = buttons.poll()
+        if gesture is not None:
+            seen.append((gesture, round(sim.clock.monotonic() - start, 2)))
+    return seen
+
+
+def test_short_press_waits_out_the_double_window(sim):
+    buttons = ButtonEvents(GP0)
+    assert gestures(sim, buttons, [(0.5, 0.1)]) == [(SHORT, 0.9)]
+    assert buttons.latency_max == 300  # From the release at 0.6 s
+
+
+def test_double_press(sim):
+    buttons = ButtonEvents(GP0)
+    assert gestures(sim, buttons, [(0.5, 0.1), (0.75, 0.1)]) == [(DOUBLE, 0.75)]
+    assert buttons.counts[SHORT] == 0
+
+
+def test_long_press_fires_while_held(sim):
+    buttons = ButtonEvents(GP0)
+    assert gestures(sim, buttons, [(0.5, 1.5)]) == [(LONG, 1.3)]
+
+
+def test_presses_too_far_apart_are_two_shorts(sim):
+    buttons = ButtonEvents(GP0)
+    assert [gesture for gesture, _ in gestures(sim, buttons, [(0.5, 0.1), (1.0, 0.1)])] == [SHORT, SHORT]
+
+
+def test_idle_between_gestures(sim):
+    buttons = ButtonEvents(GP0)
+    assert buttons.idle()
+    start = sim.clock.monotonic()
+    sim.press(start + 0.1, 0.1)
+    sim.clock.sleep(0.15)
+    buttons.poll()
+    assert not buttons.idle()  # Held down
+    gestures(sim, buttons, [], seconds=1)
+    assert buttons.idle()
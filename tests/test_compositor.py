@@ -0,0 +1,60 @@
+from compositor import Compositor, merge_rects, rect_cost
+
+
+class Screen:
+    # Just what Compositor uses of a display
+    width = 128
+    height = 160
+    auto_refresh = True
+
+    def __init__(self):
+        self.refreshes = 0
+        self.sends = True  # What refresh() returns
+
+    def refresh(self) -> bool:
+        self.refreshes += 1
+        return self.sends
+
+
+def test_touching_rects_merge_when_cheaper():
+    assert merge_rects([(0, 0, 10, 10), (10, 0, 20, 10)]) == [(0, 0, 20, 10)]
+
+
+def test_distant_rects_stay_apart():
+    rects = [(0, 0, 10, 10), (50, 50, 60, 60)]
+    assert merge_rects(rects) == rects
+
+
+def test_merge_only_when_it_costs_no_more():
+    # Two thin strips meeting in a corner: their bounding box is mostly pixels that didn't change
+    rects = [(0, 0, 100, 2), (98, 0, 100, 100)]
+    assert sorted(merge_rects(rects)) == sorted(rects)
+    assert rect_cost((0, 0, 100, 100)) > rect_cost(rects[0]) + rect_cost(rects[1])
+
+
+def test_chains_merge_into_one():
+    rects = [(0, 0, 10, 10), (20, 0, 30, 10), (10, 0, 20, 10)]
+    assert merge_rects(rects) == [(0, 0, 30, 10)]
+
+
+def test_tick_refreshes_only_when_dirty():
+    screen = Screen()
+    compositor = Compositor(screen)
+    assert not screen.auto_refresh
+    assert compositor.tick() == 0 and screen.refreshes == 0
+    compositor.mark(-5, 150, 20, 20)  # Clipped to the screen
+    assert compositor.dirty == [(0, 150, 15, 160)]
+    assert compositor.tick() == rect_cost((0, 150, 15, 160))
+    assert screen.refreshes == 1 and compositor.dirty == []
+
+
+def test_dropped_refresh_keeps_the_dirty_areas():
+    screen = Screen()
+    compositor = Compositor(screen)
+    compositor.mark_all()
+    screen.sends = False
+    assert compositor.tick() == 0
+    assert compositor.frames == 0 and compositor.dirty
+    screen.sends = True
+    assert compositor.tick() == rect_cost((0, 0, 128, 160))
+    assert compositor.frames == 1
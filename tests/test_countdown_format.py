@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from countdown_format import CountdownFormatter
+
+LAUNCH = datetime(2026, 10, 17, 12, 0, 0)
+
+
+def legacy_format(full_launch_time, current_time) -> str:
+    # The body of countdown_loop() before CountdownFormatter, unchanged
+    countdown = full_launch_time - current_time
+
+    total_seconds = int(countdown.total_seconds())
+    days = total_seconds // 86400
+    hours = total_seconds // 3600
+    minutes = (total_seconds % 3600) // 60
+    seconds = total_seconds % 60
+
+    if hours == 0:
+        hour_logic = ""
+    else:
+        hour_logic = f"{hours}:"
+
+    if hours >= 100:
+        countdown_str = f"{days} Days"
+    elif total_seconds <= 0:
+        countdown_str = "00:00"
+    else:
+        countdown_str = f"{hour_logic}{minutes:02}:{seconds:02}"
+
+    return countdown_str.split('.')[0]
+
+
+def around(*points):
+    # Every second from 2 before to 2 after each point
+    return [point + step for point in points for step in range(-2, 3)]
+
+
+BOUNDARIES = around(-3600, -60, 0, 60, 3600, 86400, 99 * 3600, 100 * 3600, 5 * 86400, 365 * 86400)
+
+
+@pytest.mark.parametrize("total_seconds", BOUNDARIES)
+def test_matches_old_output(total_seconds):
+    expected = legacy_format(LAUNCH, LAUNCH - timedelta(seconds=total_seconds))
+    assert CountdownFormatter().format(total_seconds) == expected
+
+
+def test_matches_old_output_counting_down():
+    # One formatter across every boundary, so the cached prefix and day count get reused on the way
+    formatter = CountdownFormatter()
+    for total_seconds in sorted(BOUNDARIES + list(range(-5, 7200)), reverse=True):
+        assert formatter.format(total_seconds) == legacy_format(LAUNCH, LAUNCH - timedelta(seconds=total_seconds))
+
+
+def test_same_second_is_not_rebuilt():
+    formatter = CountdownFormatter()
+    text = formatter.format(3723)
+    assert formatter.format(3723) is text
+    assert formatter.builds == 1
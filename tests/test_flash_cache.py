@@ -0,0 +1,44 @@
+import pytest
+
+from flash_cache import FlashCache, pack, unpack
+from launches import make_record
+
+ENTRIES = [
+    make_record({}, 1792238400, "Starlink Group 10-41", "Falcon 9", "SLC-40", "Cape Canaveral SFS", "United States"),
+    make_record({}, 1792324800, "Tianzhou 天舟 \U0001f680", "Long March 7", "LC-201", "Wenchang", "China"),
+    make_record({}, 1792411200, "TBD", None, "", None, None),
+]
+
+
+def test_round_trip():
+    fetched_at, entries = unpack(pack(1792200000, ENTRIES))
+    assert fetched_at == 1792200000
+    assert entries == ENTRIES
+
+
+def test_missing_fields_stay_empty():
+    # JSON null is stored as "", so it doesn't come back from flash as "None"
+    assert unpack(pack(0, ENTRIES))[1][2].vehicle == ""
+
+
+def test_empty_queue():
+    assert unpack(pack(5, [])) == (5, [])
+
+
+@pytest.mark.parametrize("data", (b"", b"PLT3", b"PLT2" + bytes(5), pack(0, ENTRIES)[:-1], pack(0, ENTRIES)[:20]))
+def test_bad_record_raises_value_error(data):
+    with pytest.raises(ValueError):
+        unpack(data)
+
+
+def test_write_limits_carry_on_after_a_reset(tmp_path):
+    path = str(tmp_path / "launch_cache.bin")
+    assert FlashCache(path).save(1792200000, ENTRIES, 1792200000)
+
+    cache = FlashCache(path)
+    assert cache.load() == (1792200000, ENTRIES)
+    # Only the fetch time changed, so flash waits for max_interval
+    assert not cache.save(1792201000, ENTRIES, 1792201000)
+    # New launches still wait for min_interval
+    assert not cache.save(1792200100, ENTRIES[:2], 1792200100)
+    assert cache.save(1792201000, ENTRIES[:2], 1792201000)
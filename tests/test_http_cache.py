@@ -0,0 +1,74 @@
+import adafruit_requests
+import pytest
+
+from http_cache import HttpCache, _max_age
+from simulator.network import fixture
+
+URL = "https://fdo.rocketlaunch.live/json/launches/next/5"
+
+
+def parse(response):
+    return response.json()["result"]
+
+
+@pytest.fixture
+def server(sim):
+    server = sim.server
+    yield server
+    server.max_age = 0
+    server.error_responses = server.portal_responses = 0
+    server.serve(fixture("rocketlaunch_next_5.json"))
+
+
+def test_unchanged_data_comes_back_as_304(server):
+    cache = HttpCache(adafruit_requests.Session())
+    first = cache.get(URL, parse)
+    served = server.bytes_served
+    assert cache.get(URL, parse) is first
+    assert (cache.misses, cache.revalidated) == (1, 1)
+    assert server.bytes_served == served  # Not a byte of the body again
+
+
+def test_changed_data_is_downloaded_again(server):
+    cache = HttpCache(adafruit_requests.Session())
+    first = cache.get(URL, parse)
+    server.serve(fixture("rocketlaunch_next_5.json").replace(b"Falcon 9", b"Falcon Heavy"))
+    assert cache.get(URL, parse) != first
+    assert cache.misses == 2
+
+
+def test_max_age_skips_the_request(sim, server):
+    server.max_age = 60
+    cache = HttpCache(adafruit_requests.Session())
+    cache.get(URL, parse)
+    requests = server.requests
+    cache.get(URL, parse)
+    assert cache.hits == 1 and server.requests == requests
+    sim.clock.sleep(61)
+    cache.get(URL, parse)
+    assert server.requests == requests + 1
+
+
+def test_error_status_raises_and_isnt_parsed(server):
+    cache = HttpCache(adafruit_requests.Session())
+    server.error_responses = 1
+    with pytest.raises(RuntimeError):
+        cache.get(URL, lambda response: pytest.fail("parsed an error page"))
+    assert cache.errors == 1 and URL not in cache.entries
+
+
+def test_empty_value_isnt_kept(server):
+    # A 304 would bring the empty value back, so the next request has to download the data again
+    cache = HttpCache(adafruit_requests.Session())
+    assert cache.get(URL, lambda response: []) == []
+    assert URL not in cache.entries
+    assert cache.get(URL, parse)
+    assert (cache.misses, cache.revalidated) == (2, 0)
+
+
+@pytest.mark.parametrize("header, seconds", (
+    (None, 0), ("max-age=300", 300), ("public, max-age=60", 60), ("no-cache, max-age=60", 0), ("max-age=x", 0),
+    ("max-age=999999", 86400),
+))
+def test_max_age_header(header, seconds):
+    assert _max_age(header) == seconds
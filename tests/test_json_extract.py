@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from json_extract import JsonExtractor
+
+FIELDS = {"name": ("name",), "vehicle": ("vehicle", "name"), "t0": ("t0",)}
+DOCUMENT = json.dumps({"valid_auth": False, "count": 2, "result": [
+    {"id": 1, "name": "Starlink é \"10\"", "vehicle": {"id": 9, "name": "Falcon 9"}, "t0": None,
+     "tags": [{"id": 5, "name": "ignored"}]},
+    {"id": 2, "name": "Go \U0001f680", "vehicle": {"name": "Electron"}, "t0": "2026-10-17T12:00Z"},
+]}).encode()
+
+
+def extract(data: bytes, chunk_size: int, max_records=2, max_string=64) -> list:
+    extractor = JsonExtractor("result", FIELDS, max_records=max_records, max_string=max_string)
+    for start in range(0, len(data), chunk_size):
+        if extractor.feed(data[start:start + chunk_size]):
+            break
+    return extractor.finish()
+
+
+@pytest.mark.parametrize("chunk_size", (1, 2, 3, 7, 64, 4096))
+def test_matches_json_loads(chunk_size):
+    expected = [{"name": launch["name"], "vehicle": launch["vehicle"]["name"], "t0": launch["t0"]}
+                for launch in json.loads(DOCUMENT)["result"]]
+    assert extract(DOCUMENT, chunk_size) == expected
+
+
+def test_stops_after_max_records():
+    assert [record["name"] for record in extract(DOCUMENT, 16, max_records=1)] == ["Starlink é \"10\""]
+
+
+def test_long_string_is_cut_on_a_character():
+    data = json.dumps({"result": [{"name": "é" * 10}]}, ensure_ascii=False).encode()
+    assert extract(data, 5, max_string=7)[0]["name"] == "é" * 3
+
+
+@pytest.mark.parametrize("escaped, text", (
+    ("\\ud83d\\ude80", "\U0001f680"),
+    ("\\u5929\\u821f", "天舟"),
+    ("\\ud83d", "�"),
+    ("\\ude80!", "�!"),
+    ("\\ud83d\\n", "�\n"),
+))
+def test_unicode_escapes(escaped, text):
+    data = b'{"result": [{"name": "' + escaped.encode() + b'"}]}'
+    assert extract(data, 1)[0]["name"] == text
+
+
+@pytest.mark.parametrize("data", (
+    b"<html><body><h1>502 Bad Gateway</h1></body></html>",
+    b"  \r\n<!DOCTYPE html><html><body>Accept and connect</body></html>",
+    b'{"result": [}',
+    b'"result"',
+    b"",
+    b" \n",
+    DOCUMENT[:len(DOCUMENT) // 2],
+))
+def test_malformed_input_raises_value_error(data):
+    with pytest.raises(ValueError):
+        extract(data, 4)
+
+
+def test_stopping_early_is_not_an_error():
+    # The rest of the response isn't read once max_records records are in, so the document is never closed
+    extractor = JsonExtractor("result", FIELDS, max_records=1)
+    assert extractor.feed(DOCUMENT[:DOCUMENT.index(b"}, {") + 1])
+    assert len(extractor.finish()) == 1
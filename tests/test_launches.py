@@ -0,0 +1,63 @@
+from launches import LaunchQueue
+from timeutil import parse_t0
+
+NOW = parse_t0("2026-10-17T12:00Z")
+
+
+def record(name: str, t0=None, win_open=None) -> dict:
+    return {"t0": t0, "win_open": win_open, "name": name, "vehicle": "Falcon 9", "pad": "SLC-40",
+            "location": "Cape Canaveral SFS", "country": "United States"}
+
+
+RECORDS = [
+    record("Second", "2026-10-18T06:00Z"),
+    record("First", "2026-10-17T12:30Z"),
+    record("Window only", None, "2026-10-19T00:00Z"),
+    record("No date yet"),
+]
+
+
+def test_load_sorts_by_t0_and_skips_undated():
+    queue = LaunchQueue()
+    queue.load(RECORDS, NOW)
+    assert [entry.name for entry in queue.entries] == ["First", "Second", "Window only"]
+    assert queue.current().t0 == parse_t0("2026-10-17T12:30Z")
+    assert queue.entries[2].t0 == parse_t0("2026-10-19T00:00Z")
+    # Launches from one response share their strings
+    assert queue.entries[0].vehicle is queue.entries[1].vehicle
+
+
+def test_rollover_after_grace():
+    queue = LaunchQueue(grace=60)
+    queue.load(RECORDS, NOW)
+    t0 = queue.current().t0
+    assert not queue.expire(t0 + 59)
+    assert queue.expire(t0 + 60)
+    assert queue.current().name == "Second"
+    assert queue.rolled_over and queue.needs_refresh(t0 + 60)
+
+
+def test_last_launch_stays_up():
+    queue = LaunchQueue()
+    queue.load(RECORDS[2:3], NOW)
+    later = parse_t0("2026-10-20T00:00Z")
+    assert not queue.expire(later)
+    assert queue.current().name == "Window only"
+    assert queue.needs_refresh(later)
+
+
+def test_moved_t0_tightens_polling():
+    queue = LaunchQueue()
+    queue.load(RECORDS, NOW)
+    assert queue.policy.slips == 0
+    queue.load([record("First", "2026-10-17T13:00Z")], NOW + 60)
+    assert queue.policy.slips == 1
+
+
+def test_refresh_in():
+    queue = LaunchQueue()
+    assert queue.refresh_in(NOW) == 0
+    queue.load(RECORDS, NOW)
+    # T-0 is 30 minutes out, where the data is good for 3 minutes
+    assert queue.refresh_in(NOW) == 180
+    assert queue.refresh_in(NOW + 180) == 0
@@ -0,0 +1,63 @@
+import pytest
+
+import net_supervisor
+from net_supervisor import NetSupervisor
+
+
+@pytest.fixture
+def radio(sim, monkeypatch):
+    monkeypatch.setattr(net_supervisor, "random", lambda: 1.0)  # No jitter, the full delay every time
+    radio = sim.radio
+    radio.disconnect()
+    yield radio
+    radio.fail_connects = 0
+
+
+def test_backoff_doubles_up_to_max_delay(sim, radio):
+    net = NetSupervisor(radio, "ssid", min_delay=2, max_delay=20)
+    radio.fail_connects = 6
+    connects = radio.connects
+    waits = []
+    for _ in range(6):
+        assert not net.connect()
+        waits.append(round(net.retry_in()))
+        assert not net.connect()  # Too early, not even tried
+        sim.clock.sleep(net.retry_in())
+    assert waits == [2, 4, 8, 16, 20, 20]
+    assert radio.connects - connects == 6  # Only the attempts the backoff allowed
+    assert net.connect()
+    assert net.failed_connects == 0 and net.retry_in() == 0
+
+
+def test_jitter_shortens_the_wait(sim, radio, monkeypatch):
+    monkeypatch.setattr(net_supervisor, "random", lambda: 0.0)
+    net = NetSupervisor(radio, "ssid", min_delay=2)
+    radio.fail_connects = 1
+    net.connect()
+    assert round(net.retry_in(), 1) == 1.0
+
+
+def test_fetch_while_offline_is_skipped(radio):
+    net = NetSupervisor(radio, "ssid")
+    radio.fail_connects = 1
+    assert net.fetch(lambda timeout: pytest.fail("requested while offline")) is None
+    assert (net.skipped, net.fetches) == (1, 0)
+
+
+def test_failed_request_is_counted_not_raised(radio):
+    net = NetSupervisor(radio, "ssid")
+
+    def request(timeout):
+        raise RuntimeError("HTTP 502")
+
+    assert net.fetch(request) is None
+    assert net.fetch(lambda timeout: timeout) == net.timeout
+    assert (net.fetches, net.failures) == (2, 1)
+
+
+def test_dropped_link_is_noticed(radio):
+    net = NetSupervisor(radio, "ssid")
+    assert net.connect()
+    radio.disconnect()
+    assert not net.online()
+    assert net.drops == 1
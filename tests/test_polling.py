@@ -0,0 +1,33 @@
+import pytest
+
+from polling import PollPolicy, until_next
+
+DAY = 86400
+
+
+@pytest.mark.parametrize("to_t0, max_age", (
+    (-30, 60), (600, 60), (601, 180), (3600, 180), (6 * 3600, 600), (DAY, 1800), (7 * DAY, 7200), (30 * DAY, 21600),
+))
+def test_max_age_by_tier(to_t0, max_age):
+    assert PollPolicy().max_age(to_t0, 0) == max_age
+
+
+def test_stale_in_stops_at_the_next_tier():
+    policy = PollPolicy()
+    # Fetched just now, T-0 in 2 hours: good for 10 minutes, unless the 1 hour tier starts first
+    assert policy.stale_in(0, 2 * 3600, 0) == 600
+    assert policy.stale_in(0, 3600 + 120, 0) == 120
+    assert policy.stale_in(0, 2 * 3600, 600) == 0
+
+
+def test_moved_t0_keeps_polling_tight_until_it_settles():
+    policy = PollPolicy(settle=3600)
+    policy.moved(0)
+    assert policy.max_age(30 * DAY, 10) == 300
+    assert policy.max_age(30 * DAY, 3600) == 21600
+    assert policy.slips == 1
+
+
+@pytest.mark.parametrize("now, seconds", ((0, 60), (59, 1), (60, 60), (125, 55)))
+def test_until_next(now, seconds):
+    assert until_next(now) == seconds
@@ -0,0 +1,54 @@
+from schedule import Carousel, Schedule
+from timeutil import parse_t0
+
+CALENDAR = """# Comment
+2026-12-25T06:00Z | Christmas | Day | Home | North Pole | Earth
+
+2027-01-01T06:00Z | New Year
+2027-01-01T00:00Z
+2026-02-06T19:00Z | Opening Ceremony | Milan-Cortina | San Siro | Milan | Italy | 17 | Europe/Rome
+2027-02-30 | Not a T-0
+2027-03-01T00:00Z | Trip | | | | | 5 | Mars/Olympus
+2027-04-01T00:00Z | Broken | | | | | days | UTC
+2027-05-01T00:00Z | No zone | | | | | 3
+"""
+
+
+def load(tmp_path, text=CALENDAR) -> Schedule:
+    path = tmp_path / "schedule.txt"
+    path.write_text(text)
+    calendar = Schedule()
+    assert calendar.load(str(path))
+    return calendar
+
+
+def test_events_sorted_and_short_lines_padded(tmp_path):
+    calendar = load(tmp_path)
+    assert [event.name for event in calendar.events] == ["Opening Ceremony", "Christmas", "", "New Year"]
+    assert list(calendar.starts) == sorted(calendar.starts)
+    assert calendar.events[-1].vehicle == "" and calendar.events[-1].country == ""
+    assert calendar.skipped == 4
+
+
+def test_span_with_default_city(tmp_path):
+    calendar = load(tmp_path)
+    start = parse_t0("2026-02-06T19:00Z")
+    assert calendar.span(start - 1) == (0, 17, "Europe/Rome", "Rome")
+    assert calendar.span(start + 17 * 86400) is None
+
+
+def test_missing_file(tmp_path):
+    assert not Schedule().load(str(tmp_path / "schedule.txt"))
+
+
+def test_carousel_takes_turns(tmp_path):
+    calendar = load(tmp_path)
+    carousel = Carousel(calendar, window=2)
+    now = parse_t0("2026-12-01T00:00Z")
+    first = carousel.current(now)
+    carousel.advance()
+    assert first.name == "Christmas"
+    assert carousel.current(now).name == ""
+    carousel.advance()
+    assert carousel.current(now) is first
+    assert carousel.current(parse_t0("2030-01-01T00:00Z")).name == "New Year"
@@ -0,0 +1,67 @@
+from scheduler import Scheduler
+
+
+def stop_after(scheduler: Scheduler, sim, seconds: float):
+    start = sim.clock.monotonic()
+    scheduler.after("stop", seconds, scheduler.stop)
+    return start
+
+
+def test_deadlines_dont_drift(sim):
+    # Every tick takes 30 ms, which mustn't push the next deadline back
+    scheduler = Scheduler()
+    times = []
+
+    def tick():
+        times.append(sim.clock.monotonic())
+        sim.clock.sleep(0.03)
+
+    task = scheduler.every("tick", 0.1, tick)
+    start = stop_after(scheduler, sim, 1.05)
+    scheduler.run()
+    assert task.runs == 11
+    assert [round(at - start, 3) for at in times] == [round(i * 0.1, 3) for i in range(11)]
+    assert task.skipped == 0
+
+
+def test_slow_callback_skips_missed_intervals(sim):
+    # 0.35 s callbacks on a 0.1 s interval: the deadlines missed meanwhile are dropped instead of run in a burst
+    scheduler = Scheduler()
+    times = []
+
+    def slow():
+        times.append(sim.clock.monotonic())
+        sim.clock.sleep(0.35)
+
+    task = scheduler.every("slow", 0.1, slow)
+    stop_after(scheduler, sim, 1)
+    scheduler.run()
+    # Each run starts as the previous one returns, one run per callback rather than one per missed deadline
+    assert [round(b - a, 3) for a, b in zip(times, times[1:])] == [0.35] * 3
+    assert (task.runs, task.skipped) == (4, 7)
+
+
+def test_after_fires_once(sim):
+    scheduler = Scheduler()
+    fired = []
+    scheduler.after("once", 0.5, lambda: fired.append(sim.clock.monotonic()))
+    start = sim.clock.monotonic()
+    scheduler.run()
+    assert len(fired) == 1 and round(fired[0] - start, 3) == 0.5
+    assert scheduler.tasks == []
+
+
+def test_reschedule_and_idle(sim):
+    waits = []
+
+    def idle(seconds: float):
+        waits.append(round(seconds, 3))
+        sim.clock.sleep(seconds)
+
+    scheduler = Scheduler(idle=idle)
+    task = scheduler.every("poll", 0.05, lambda: None)
+    scheduler.reschedule(task, 2)
+    stop_after(scheduler, sim, 1)
+    scheduler.run()
+    assert task.runs == 0
+    assert waits == [1.0]
@@ -0,0 +1,71 @@
+import time
+
+import pytest
+
+import timesource
+from timesource import TimeSource
+
+START = 1792238400
+
+
+class Clocks:
+    # Stands in for NTP and the RTC, each reading whole seconds like the real ones
+
+    def __init__(self):
+        self.ntp = START
+        self.rtc = START
+
+    @property
+    def datetime(self):
+        return time.gmtime(self.ntp)
+
+    def wait(self, seconds: int, rtc_error=0):
+        # Moves both clocks on, the RTC ending up rtc_error seconds off
+        self.ntp += seconds
+        self.rtc = self.ntp + rtc_error
+
+
+class RTC:
+    datetime = None
+
+
+@pytest.fixture
+def clocks(sim, monkeypatch):
+    clocks = Clocks()
+    monkeypatch.setattr(timesource, "time", lambda: clocks.rtc)
+    monkeypatch.setattr(timesource.rtc, "RTC", RTC)
+    return clocks
+
+
+def synced_source(clocks) -> TimeSource:
+    source = TimeSource(None, max_interval=21600, min_interval=600)
+    source.ntp = clocks
+    assert source.sync()
+    return source
+
+
+def test_rounding_error_keeps_the_interval(clocks):
+    source = synced_source(clocks)
+    clocks.wait(21600, rtc_error=1)
+    source.sync()
+    assert source.interval == 21600
+
+
+def test_real_drift_shrinks_the_interval(clocks):
+    source = synced_source(clocks)
+    clocks.wait(21600, rtc_error=4)
+    source.sync()
+    assert source.interval == 2700  # 185 ppm reaches half a second in 45 minutes
+
+
+def test_interval_grows_back_once_the_drift_settles(clocks):
+    source = synced_source(clocks)
+    clocks.wait(21600, rtc_error=-100)
+    source.sync()
+    assert source.interval == 600
+    intervals = []
+    for _ in range(7):
+        clocks.wait(source.interval)
+        source.sync()
+        intervals.append(source.interval)
+    assert intervals == [1200, 2400, 4800, 9600, 19200, 21600, 21600]
@@ -0,0 +1,41 @@
+import pytest
+
+from timeutil import parse_t0
+from timezones import TimeZone, offset_text
+
+
+@pytest.mark.parametrize("minutes, text", ((0, "+0"), (60, "+1"), (-360, "-6"), (330, "+5:30"), (-570, "-9:30")))
+def test_offset_text(minutes, text):
+    assert offset_text(minutes) == text
+
+
+@pytest.mark.parametrize("name, t0, minutes", (
+    # US DST 2026 runs from 2026-03-08 08:00Z to 2026-11-01 07:00Z in Chicago
+    ("America/Chicago", "2026-03-08T07:59Z", -360),
+    ("America/Chicago", "2026-03-08T08:00Z", -300),
+    ("America/Chicago", "2026-11-01T06:59Z", -300),
+    ("America/Chicago", "2026-11-01T07:00Z", -360),
+    # EU DST 2026 runs from 2026-03-29 01:00Z to 2026-10-25 01:00Z everywhere
+    ("Europe/Rome", "2026-03-29T00:59Z", 60),
+    ("Europe/Rome", "2026-03-29T01:00Z", 120),
+    ("Europe/London", "2026-10-25T00:59Z", 60),
+    ("Europe/London", "2026-10-25T01:00Z", 0),
+    ("America/Phoenix", "2026-07-01T00:00Z", -420),
+    ("Asia/Kolkata", "2026-07-01T00:00Z", 330),
+    # Outside the precomputed years
+    ("America/New_York", "2050-07-01T00:00Z", -240),
+    ("America/New_York", "2050-01-01T00:00Z", -300),
+))
+def test_offset_minutes(name, t0, minutes):
+    assert TimeZone(name).offset_minutes(parse_t0(t0)) == minutes
+
+
+def test_to_local_adds_the_offset():
+    zone = TimeZone("Asia/Kolkata")
+    epoch = parse_t0("2026-10-17T12:00Z")
+    assert zone.to_local(epoch) == epoch + 330 * 60
+
+
+def test_unknown_zone():
+    with pytest.raises(ValueError):
+        TimeZone("Mars/Olympus")
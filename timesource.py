@@ -0,0 +1,110 @@
+import rtc
+from time import time, localtime, monotonic_ns
+
+import adafruit_ntp
+
+from timeutil import epoch_seconds
+
+# Any RTC reading before this (2024-01-01) means the clock was never set since power-up
+_EARLIEST_VALID = 1704067200
+
+
+class TimeSource:
+    # The one clock shared by the launch and clock screens. The RTC is set to UTC from NTP, then read as plain integer
+    # epoch seconds: one read per tick is one consistent snapshot, with no datetime objects and no chance of the
+    # fields tearing across a second boundary.
+    # Every resync compares the RTC against NTP to measure its drift, and the resync interval shrinks for a fast
+    # drifting RTC so the error stays under about half a second. Errors under 2 s can be rounding alone and let the
+    # interval grow back instead.
+
+    def __init__(self, pool, server="pool.ntp.org", max_interval=21600, min_interval=600, timeout=10, retry=60):
+        # pool (SocketPool) - socket pool used for the NTP request
+        # server (str) - default: "pool.ntp.org" - NTP server
+        # max_interval (int) - default: 21600 - longest time (in seconds) between resyncs
+        # min_interval (int) - default: 600 - shortest time (in seconds) between resyncs, however bad the drift
+        # timeout (float) - default: 10 - seconds to wait for the NTP answer
+        # retry (int) - default: 60 - time (in seconds) before asking again after NTP didn't answer
+
+        self.ntp = adafruit_ntp.NTP(pool, server=server, tz_offset=0, socket_timeout=timeout)
+        self.max_interval = max_interval
+        self.min_interval = min_interval
+        self.interval = max_interval
+        self.retry = retry
+        self.synced_at = None  # UTC epoch seconds of the last successful sync
+        self.failed_at = None  # RTC epoch seconds of the last failed sync, None after a success
+        self.forced: bool = False
+        self.drift_ppm = None  # RTC error per elapsed time between the last two syncs, in parts per million
+        self.syncs: int = 0
+        self.reads: int = 0
+        self.read_ns: int = 0
+
+    def now(self) -> int:
+        # Current UTC time in epoch seconds, from a single RTC read.
+
+        start = monotonic_ns()
+        now = int(time())
+        self.read_ns += monotonic_ns() - start
+        self.reads += 1
+        return now
+
+    def valid(self) -> bool:
+        # Whether the RTC holds a real time, either from a sync or from before a soft reset.
+        return self.synced_at is not None or self.now() >= _EARLIEST_VALID
+
+    def due(self, now: int) -> bool:
+        return self.sync_in(now) <= 0
+
+    def sync_in(self, now: int) -> int:
+        # Seconds until the next resync is due, 0 or less if it's due now.
+
+        if self.forced:
+            return 0
+        if self.failed_at is not None and now - self.failed_at < self.retry:
+            return self.failed_at + self.retry - now
+        if self.synced_at is None:
+            return 0
+        return self.synced_at + self.interval - now
+
+    def expire(self):
+        # Makes the next due() check say yes, e.g. for a resync asked for with the button. The drift estimate stays.
+        self.forced = True
+
+    def sync(self) -> bool:
+        # Sets the RTC from NTP and updates the drift estimate. Returns False if NTP didn't answer.
+
+        try:
+            ntp_time = self.ntp.datetime
+        except (OSError, RuntimeError) as error:
+            print(f"NTP sync failed: {error}")
+            self.failed_at = self.now()
+            self.forced = False
+            return False
+        ntp_epoch = epoch_seconds(ntp_time.tm_year, ntp_time.tm_mon, ntp_time.tm_mday,
+                                  ntp_time.tm_hour, ntp_time.tm_min, ntp_time.tm_sec)
+        rtc_epoch = self.now()
+
+        if self.synced_at is not None and ntp_epoch > self.synced_at:
+            error = rtc_epoch - ntp_epoch
+            self.drift_ppm = error * 1_000_000 / (ntp_epoch - self.synced_at)
+            if abs(error) >= 2:
+                # Resync before the accumulated error reaches half a second
+                self.interval = int(500_000 / abs(self.drift_ppm))
+                self.interval = max(self.min_interval, min(self.max_interval, self.interval))
+            else:
+                # Both readings are whole seconds, so up to a second off is just rounding. Back off towards
+                # max_interval again, in case an earlier estimate was too pessimistic.
+                self.interval = min(self.max_interval, self.interval * 2)
+
+        rtc.RTC().datetime = localtime(ntp_epoch)
+        self.synced_at = ntp_epoch
+        self.forced = False
+        self.failed_at = None
+        self.syncs += 1
+        print(f"RTC synced to NTP, off by {rtc_epoch - ntp_epoch} seconds")
+        return True
+
+    def report(self) -> str:
+        drift = "unknown" if self.drift_ppm is None else f"{self.drift_ppm:.1f} ppm"
+        cost = self.read_ns / self.reads / 1000 if self.reads else 0
+        return (f"Time source: drift {drift}, {self.syncs} syncs, resync every {self.interval} s, "
+                f"{self.reads} reads at {cost:.1f} us each")
@@ -0,0 +1,43 @@
+def days_from_civil(y: int, m: int, d: int) -> int:
+    # Days since 1970-01-01 for a proleptic Gregorian date, without going through time.mktime() or datetime.
+
+    y -= m <= 2
+    era = y // 400
+    yoe = y - era * 400
+    doy = (153 * (m + (-3 if m > 2 else 9)) + 2) // 5 + d - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468
+
+
+def epoch_seconds(y: int, m: int, d: int, h=0, mi=0, s=0) -> int:
+    # Seconds since 1970-01-01T00:00Z for a UTC date and time.
+
+    return days_from_civil(y, m, d) * 86400 + h * 3600 + mi * 60 + s
+
+
+def parse_t0(t0: str) -> int:
+    # Converts a rocketlaunch.live time ("YYYY-MM-DDTHH:MMZ", always UTC) to epoch seconds.
+
+    return epoch_seconds(int(t0[0:4]), int(t0[5:7]), int(t0[8:10]), int(t0[11:13]), int(t0[14:16]))
+
+
+def civil_from_days(days: int):
+    # Inverse of days_from_civil(), returns (year, month, day).
+
+    days += 719468
+    era = days // 146097
+    doe = days - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    d = doy - (153 * mp + 2) // 5 + 1
+    m = mp + (3 if mp < 10 else -9)
+    return yoe + era * 400 + (m <= 2), m, d
+
+
+def date_time(epoch: int):
+    # Splits epoch seconds into (year, month, day, hour, minute, second) with plain integer math.
+
+    days, seconds = divmod(epoch, 86400)
+    y, m, d = civil_from_days(days)
+    return y, m, d, seconds // 3600, (seconds % 3600) // 60, seconds % 60
@@ -0,0 +1,114 @@
+from array import array
+
+from timeutil import days_from_civil, civil_from_days
+
+# Zone name -> (standard UTC offset in minutes, DST rule or None)
+# Add an entry here to support another zone, as long as it follows one of the rules below.
+ZONES = {
+    "UTC": (0, None),
+    "America/New_York": (-300, "US"),
+    "America/Chicago": (-360, "US"),
+    "America/Denver": (-420, "US"),
+    "America/Phoenix": (-420, None),
+    "America/Los_Angeles": (-480, "US"),
+    "America/Anchorage": (-540, "US"),
+    "Pacific/Honolulu": (-600, None),
+    "Europe/London": (0, "EU"),
+    "Europe/Paris": (60, "EU"),
+    "Europe/Berlin": (60, "EU"),
+    "Europe/Rome": (60, "EU"),
+    "Asia/Tokyo": (540, None),
+    "Asia/Kolkata": (330, None),
+}
+
+
+def _sunday_on_or_after(days: int) -> int:
+    # days_from_civil() counts from a Thursday, so (days + 3) % 7 is 0 on Mondays and 6 on Sundays
+    return days + (6 - (days + 3) % 7) % 7
+
+
+def _last_sunday(y: int, m: int) -> int:
+    last = days_from_civil(y + (m == 12), m % 12 + 1, 1) - 1
+    return last - ((last + 3) % 7 + 1) % 7
+
+
+def dst_bounds(rule: str, year: int, std_offset: int):
+    # UTC epoch seconds of the start and end of daylight saving time in a year.
+    # rule (str) - "US" (2nd Sunday of March to 1st Sunday of November, 2:00 local) or
+    #              "EU" (last Sunday of March to last Sunday of October, 1:00 UTC)
+    # std_offset (int) - standard UTC offset in minutes
+
+    if rule == "US":
+        start = _sunday_on_or_after(days_from_civil(year, 3, 8)) * 86400 + 7200 - std_offset * 60
+        end = _sunday_on_or_after(days_from_civil(year, 11, 1)) * 86400 + 7200 - (std_offset + 60) * 60
+    elif rule == "EU":
+        start = _last_sunday(year, 3) * 86400 + 3600
+        end = _last_sunday(year, 10) * 86400 + 3600
+    else:
+        raise ValueError(f"Unknown DST rule {rule}")
+    return start, end
+
+
+def offset_text(minutes: int) -> str:
+    # A UTC offset for the screen, e.g. "+1", "-6" or "+5:30".
+    # minutes (int) - the offset in minutes, like offset_minutes() returns
+
+    sign = "-" if minutes < 0 else "+"
+    minutes = abs(minutes)
+    if minutes % 60:
+        return f"{sign}{minutes // 60}:{minutes % 60:02}"
+    return f"{sign}{minutes // 60}"
+
+
+class TimeZone:
+    # Works out local UTC offsets on the device instead of asking timeapi.io.
+    # The DST start/end instants for first_year..last_year are computed once into a flat array of UTC epoch seconds,
+    # so the offset for any instant (now, or a launch months away on the other side of a DST change) is one binary
+    # search. Instants outside that range fall back to computing their own year's bounds.
+
+    def __init__(self, name="America/Chicago", first_year=2024, last_year=2040):
+        # name (str) - default: "America/Chicago" - a key of ZONES
+        # first_year, last_year (ints) - defaults: 2024, 2040 - years covered by the precomputed table
+
+        if name not in ZONES:
+            raise ValueError(f"Unknown time zone {name}, add it to ZONES in timezones.py")
+        self.name = name
+        self.std_offset, self.rule = ZONES[name]
+        self.first = 0
+        self.last = 0
+        self.transitions = array("L")
+        if self.rule is not None:
+            for year in range(first_year, last_year + 1):
+                start, end = dst_bounds(self.rule, year, self.std_offset)
+                self.transitions.append(start)
+                self.transitions.append(end)
+            self.first = days_from_civil(first_year, 1, 1) * 86400
+            self.last = days_from_civil(last_year + 1, 1, 1) * 86400
+
+    def is_dst(self, epoch: int) -> bool:
+        # Whether daylight saving time is in effect at a UTC instant.
+
+        if self.rule is None:
+            return False
+        if not self.first <= epoch < self.last:
+            year = civil_from_days(epoch // 86400)[0]
+            start, end = dst_bounds(self.rule, year, self.std_offset)
+            return start <= epoch < end
+
+        # Transitions alternate start, end, start, ... so an odd count of passed transitions means DST is on
+        low = 0
+        high = len(self.transitions)
+        while low < high:
+            middle = (low + high) // 2
+            if self.transitions[middle] <= epoch:
+                low = middle + 1
+            else:
+                high = middle
+        return low % 2 == 1
+
+    def offset_minutes(self, epoch: int) -> int:
+        # Local UTC offset (in minutes) at a UTC instant given in epoch seconds.
+        return self.std_offset + 60 if self.is_dst(epoch) else self.std_offset
+
+    def to_local(self, epoch: int) -> int:
+        return epoch + self.offset_minutes(epoch) * 60
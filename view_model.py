@@ -0,0 +1,59 @@
+class ViewModel:
+    # Remembers the last string written to each bound label and only assigns .text when the value changes.
+    # Every real assignment makes adafruit_display_text rebuild its glyph TileGrids and dirty that part of the screen,
+    # which then has to be pushed over SPI, so skipping unchanged writes saves both bus traffic and frame time.
+
+    def __init__(self):
+        self.labels: dict = {}
+        self.rendered: dict = {}
+        self.regions: dict = {}
+        self.compositor = None  # Set to a Compositor to mark each real write dirty on it
+        self.updates: int = 0  # Real label writes during the current tick
+        self.skipped: int = 0  # Writes avoided during the current tick
+        self.last_updates: int = 0  # Real label writes during the last finished tick
+        self.total_updates: int = 0
+        self.total_skipped: int = 0
+        self.ticks: int = 0
+
+    def bind(self, name: str, target, region=None):
+        # Registers a label under a name so it can be updated through set().
+        # name (str) - key used to refer to the label
+        # target (Label/ScrollingLabel) - the displayio label to manage
+        # region (tuple) - default: None - (x, y, width, height) on screen the label can cover, marked dirty on the
+        #                  compositor after every write. Targets that mark themselves (like GlyphText) don't need one.
+
+        self.labels[name] = target
+        self.rendered[name] = target.text
+        if region is not None:
+            self.regions[name] = region
+
+    def set(self, name: str, text: str) -> bool:
+        # Writes text to a bound label only if it differs from what's already on screen.
+        # Returns True if the label was actually updated.
+
+        if self.rendered[name] == text:
+            self.skipped += 1
+            return False
+        self.labels[name].text = text
+        self.rendered[name] = text
+        self.updates += 1
+        if self.compositor is not None and name in self.regions:
+            self.compositor.mark(*self.regions[name])
+        return True
+
+    def end_tick(self) -> int:
+        # Closes the current tick and returns how many labels were really written during it.
+
+        count = self.updates
+        self.last_updates = count
+        self.total_updates += count
+        self.total_skipped += self.skipped
+        self.ticks += 1
+        self.updates = 0
+        self.skipped = 0
+        return count
+
+    def summary(self) -> str:
+        average = self.total_updates / self.ticks if self.ticks else 0
+        return (f"Label writes: {self.total_updates} over {self.ticks} ticks ({average:.2f}/tick), "
+                f"{self.total_skipped} skipped")